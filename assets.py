@@ -0,0 +1,81 @@
+"""
+Lazily loaded game assets.
+
+Images, fonts and sounds are loaded the first time they are requested and then
+kept, so nothing is read from disk before the screen that needs it is shown and
+nothing is loaded twice.
+"""
+
+import pygame
+
+
+class Assets(object):
+    """
+    Asset cache.
+    """
+
+    def __init__(self):
+        self._images = {}
+        self._fonts = {}
+        self._sounds = {}
+
+    def image(self, name):
+        """
+        Return an image converted to the display format.
+
+        :param name: Image file
+        :return: Surface
+        """
+        surface = self._images.get(name)
+        if surface is None:
+            surface = pygame.image.load(name).convert_alpha()
+            self._images[name] = surface
+        return surface
+
+    def add_image(self, name, surface):
+        """
+        Store an image loaded elsewhere, e.g. by the background loader.
+
+        :param name: Image file
+        :param surface: Surface already converted to the display format
+        :return: None
+        """
+        self._images[name] = surface
+
+    def font(self, size, name='freesansbold.ttf'):
+        """
+        Return a font.
+
+        :param size: Point size
+        :param name: Font file
+        :return: Font
+        """
+        font = self._fonts.get((name, size))
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self._fonts[(name, size)] = font
+        return font
+
+    def sound(self, name):
+        """
+        Return a sound, or None if there is no audio device.
+
+        :param name: Sound file
+        :return: Sound
+        """
+        if name not in self._sounds:
+            self._sounds[name] = pygame.mixer.Sound(name) if pygame.mixer.get_init() else None
+        return self._sounds[name]
+
+    def add_sound(self, name, sound):
+        """
+        Store a sound loaded elsewhere, e.g. by the background loader.
+
+        :param name: Sound file
+        :param sound: Sound
+        :return: None
+        """
+        self._sounds[name] = sound
+
+
+assets = Assets()
@@ -0,0 +1,297 @@
+"""
+Sentence corpus for Word Invader.
+
+The question bank is authored as CSV or plain text, one sentence per row, with
+the target word(s) written between brackets:
+
+    A transportation [ planner's, ] job may include counting traffic.
+
+Running this module compiles the raw corpus into a compact binary file that the
+game loads with a single read:
+
+    python corpus.py questions.txt -o sentences.bin
+
+Each sentence is validated (exactly one bracketed target), tokenized, and the
+render width of every token is precomputed with the game font at the sizes the
+game uses, so nothing has to be parsed or measured at launch.
+"""
+
+import argparse
+import csv
+import io
+import os
+import struct
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+# Binary format
+MAGIC = b'WINV'
+VERSION = 1
+
+# Game font and the sizes it is rendered at (see sentence_text in realMain.py)
+FONT_NAME = 'freesansbold.ttf'
+FONT_SIZES = (20,)
+
+# Below this many sentences the process pool costs more than it saves
+PARALLEL_THRESHOLD = 2000
+
+_HEADER = struct.Struct('<4sHHI')  # magic, version, number of sizes, number of sentences
+_U16 = struct.Struct('<H')
+_SENTENCE = struct.Struct('<HHHH')  # text bytes, tokens, target start, target end
+
+# A compiled sentence. tokens excludes the brackets, target is the (start, end)
+# token slice of the bracketed word(s), and widths maps each font size to the
+# pixel width of every token
+Sentence = namedtuple('Sentence', ['text', 'tokens', 'target', 'widths'])
+
+# A loaded corpus. space_widths maps each font size to the width of a space
+Corpus = namedtuple('Corpus', ['sizes', 'space_widths', 'sentences'])
+
+
+class CorpusError(ValueError):
+    """
+    Raised when a raw sentence is malformed or a compiled file is unreadable.
+    """
+    pass
+
+
+def tokenize(text):
+    """
+    Split a raw sentence into its words and locate the bracketed target.
+
+    :param text: Raw sentence
+    :return: Tuple of (tokens, (target start, target end))
+    """
+    if text.count('[') != 1 or text.count(']') != 1:
+        raise CorpusError('sentence must have exactly one bracketed target')
+    before, rest = text.split('[', 1)
+    if ']' not in rest:
+        raise CorpusError('target bracket is closed before it is opened')
+    target, after = rest.split(']', 1)
+    before, target, after = before.split(), target.split(), after.split()
+    if len(target) == 0:
+        raise CorpusError('bracketed target is empty')
+    tokens = before + target + after
+    return tokens, (len(before), len(before) + len(target))
+
+
+def read_raw(path):
+    """
+    Read the raw sentences of a corpus file. CSV files take the "sentence"
+    column (or the first one); text files take one sentence per line, skipping
+    blank lines and lines starting with "#".
+
+    :param path: Corpus file
+    :return: List of (line number, sentence)
+    """
+    rows = []
+    with open(path, encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.csv'):
+            reader = csv.reader(f)
+            header = next(reader, [])
+            column = 0
+            if 'sentence' in header:
+                column = header.index('sentence')
+            elif header and '[' in header[0]:
+                rows.append((1, header[0]))  # No header row
+            for row in reader:
+                if len(row) > column and row[column].strip():
+                    rows.append((reader.line_num, row[column].strip()))
+        else:
+            for i, line in enumerate(f, 1):
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    rows.append((i, line))
+    return rows
+
+
+_worker_fonts = {}
+
+
+def _init_worker(sizes):
+    import pygame
+    pygame.font.init()
+    for size in sizes:
+        _worker_fonts[size] = pygame.font.Font(FONT_NAME, size)
+
+
+def tokenize_rows(rows):
+    """
+    Tokenize raw rows. Only parses text, so it can run off the main thread.
+
+    :param rows: List of (line number, sentence)
+    :return: Tuple of (list of (text, tokens, target), errors)
+    """
+    tokenized = []
+    errors = []
+    for line, text in rows:
+        try:
+            tokens, target = tokenize(text)
+        except CorpusError as e:
+            errors.append('line {}: {}'.format(line, e))
+            continue
+        tokenized.append((text, tuple(tokens), target))
+    return tokenized, errors
+
+
+def measure(tokenized, fonts):
+    """
+    Measure the tokens of tokenized sentences.
+
+    :param tokenized: List of (text, tokens, target) returned by tokenize_rows
+    :param fonts: Font of each font size
+    :return: List of Sentence
+    """
+    sentences = []
+    for text, tokens, target in tokenized:
+        widths = {}
+        for size, font in fonts.items():
+            widths[size] = tuple(font.size(t)[0] for t in tokens)
+        sentences.append(Sentence(text, tokens, target, widths))
+    return sentences
+
+
+def _compile_chunk(rows):
+    """
+    Tokenize and measure a chunk of raw rows. Runs in a worker process.
+
+    :return: Tuple of (sentences, errors)
+    """
+    tokenized, errors = tokenize_rows(rows)
+    return measure(tokenized, _worker_fonts), errors
+
+
+def compile_corpus(rows, sizes=FONT_SIZES, jobs=None):
+    """
+    Compile raw rows into sentences, in parallel for large corpora.
+
+    :param rows: List of (line number, sentence)
+    :param sizes: Font sizes to measure
+    :param jobs: Number of worker processes, None uses every core
+    :return: Tuple of (sentences, space widths, errors)
+    """
+    _init_worker(sizes)
+    space_widths = {size: _worker_fonts[size].size(' ')[0] for size in sizes}
+    if jobs == 1 or len(rows) < PARALLEL_THRESHOLD:
+        sentences, errors = _compile_chunk(rows)
+        return sentences, space_widths, errors
+
+    jobs = jobs or os.cpu_count() or 1
+    chunk = max(1, len(rows) // (jobs * 4))
+    chunks = [rows[i:i + chunk] for i in range(0, len(rows), chunk)]
+    sentences = []
+    errors = []
+    with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(sizes,)) as pool:
+        for s, e in pool.map(_compile_chunk, chunks):  # map keeps input order
+            sentences.extend(s)
+            errors.extend(e)
+    return sentences, space_widths, errors
+
+
+def dumps(sentences, space_widths):
+    """
+    Serialize compiled sentences to the binary format.
+
+    :param sentences: List of Sentence
+    :param space_widths: Width of a space for each font size
+    :return: Bytes
+    """
+    sizes = sorted(space_widths)
+    out = io.BytesIO()
+    out.write(_HEADER.pack(MAGIC, VERSION, len(sizes), len(sentences)))
+    for size in sizes:
+        out.write(struct.pack('<HH', size, space_widths[size]))
+    for s in sentences:
+        text = s.text.encode('utf-8')
+        out.write(_SENTENCE.pack(len(text), len(s.tokens), s.target[0], s.target[1]))
+        out.write(text)
+        for token in s.tokens:
+            token = token.encode('utf-8')
+            out.write(_U16.pack(len(token)))
+            out.write(token)
+        for size in sizes:
+            out.write(struct.pack('<{}H'.format(len(s.tokens)), *s.widths[size]))
+    return out.getvalue()
+
+
+def loads(data):
+    """
+    Parse a compiled corpus.
+
+    :param data: Bytes written by dumps
+    :return: Corpus
+    """
+    if len(data) < _HEADER.size:
+        raise CorpusError('file is too short to be a compiled corpus')
+    magic, version, n_sizes, n_sentences = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise CorpusError('not a compiled corpus')
+    if version != VERSION:
+        raise CorpusError('unsupported corpus version {} (expected {}), rebuild it'
+                          .format(version, VERSION))
+    pos = _HEADER.size
+    sizes = []
+    space_widths = {}
+    for _ in range(n_sizes):
+        size, space = struct.unpack_from('<HH', data, pos)
+        pos += 4
+        sizes.append(size)
+        space_widths[size] = space
+
+    sentences = []
+    u16 = _U16.unpack_from
+    for _ in range(n_sentences):
+        n_text, n_tokens, start, end = _SENTENCE.unpack_from(data, pos)
+        pos += _SENTENCE.size
+        text = data[pos:pos + n_text].decode('utf-8')
+        pos += n_text
+        tokens = []
+        for _ in range(n_tokens):
+            n = u16(data, pos)[0]
+            tokens.append(data[pos + 2:pos + 2 + n].decode('utf-8'))
+            pos += 2 + n
+        widths = {}
+        fmt = '<{}H'.format(n_tokens)
+        for size in sizes:
+            widths[size] = struct.unpack_from(fmt, data, pos)
+            pos += 2 * n_tokens
+        sentences.append(Sentence(text, tuple(tokens), (start, end), widths))
+    return Corpus(tuple(sizes), space_widths, sentences)
+
+
+def load_corpus(path):
+    """
+    Load a compiled corpus file in one read.
+
+    :param path: File written by the build step
+    :return: Corpus
+    """
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compile the Word Invader sentence corpus')
+    parser.add_argument('source', help='raw corpus, .csv or plain text')
+    parser.add_argument('-o', '--output', default='sentences.bin', help='compiled output file')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=list(FONT_SIZES),
+                        help='font sizes to precompute widths for')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes (default: all cores)')
+    args = parser.parse_args(argv)
+
+    rows = read_raw(args.source)
+    sentences, space_widths, errors = compile_corpus(rows, tuple(args.sizes), args.jobs)
+    for error in errors:
+        print('{}: {}'.format(args.source, error), file=sys.stderr)
+    if errors:
+        return 1
+    with open(args.output, 'wb') as f:
+        f.write(dumps(sentences, space_widths))
+    print('{} sentences written to {}'.format(len(sentences), args.output))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+Game state snapshots for Word Invader.
+
+The whole play state (player, enemies, bullet, hits and current question) is
+packed into a small binary blob with struct and array, so it can be written on
+exit or periodically and restored on the next launch in well under a
+millisecond. Surfaces and sounds are not part of the state; they are reloaded
+as usual.
+
+The state is read from and written to a namespace dict holding the game
+variables, which for realMain.py is its globals().
+"""
+
+import os
+import struct
+from array import array
+
+MAGIC = b'WISS'
+VERSION = 1
+
+# Integer variables, in the order they are packed
+SCALARS = ('playerX', 'playerY', 'playerX_change',
+           'bulletX', 'bulletY', 'bulletX_change', 'bulletY_change',
+           'hit_count', 'prepY', 'question')
+
+# Per-enemy lists, each num_of_enemies long
+ENEMY_LISTS = ('enemyX', 'enemyY', 'enemyX_change', 'enemyY_change')
+
+BULLET_STATES = ('ready', 'fire')
+
+_HEADER = struct.Struct('<4sBBH')  # magic, version, bullet state, number of enemies
+_SCALARS = struct.Struct('<{}i'.format(len(SCALARS)))
+
+
+class SnapshotError(ValueError):
+    """
+    Raised when a snapshot cannot be read.
+    """
+    pass
+
+
+def snapshot(ns):
+    """
+    Pack the game state.
+
+    :param ns: Namespace with the game variables
+    :return: Bytes
+    """
+    n = ns['num_of_enemies']
+    data = bytearray(_HEADER.pack(MAGIC, VERSION, BULLET_STATES.index(ns['bullet_state']), n))
+    data += _SCALARS.pack(*[int(ns[name]) for name in SCALARS])
+    for name in ENEMY_LISTS:
+        data += array('i', [int(v) for v in ns[name][:n]]).tobytes()
+    return bytes(data)
+
+
+def restore(blob, ns, num_questions=None):
+    """
+    Unpack a snapshot into the namespace. Enemy lists are updated in place, so
+    references to them stay valid. The snapshot is fully checked before the
+    namespace is changed.
+
+    :param blob: Bytes returned by snapshot
+    :param ns: Namespace with the game variables
+    :param num_questions: Size of the question bank; if given, the restored question must be within it
+    :return: None
+    """
+    if len(blob) < _HEADER.size + _SCALARS.size:
+        raise SnapshotError('snapshot is truncated')
+    magic, version, bullet_state, n = _HEADER.unpack_from(blob, 0)
+    if magic != MAGIC:
+        raise SnapshotError('not a game state snapshot')
+    if version != VERSION:
+        raise SnapshotError('unsupported snapshot version {}'.format(version))
+    if bullet_state >= len(BULLET_STATES):
+        raise SnapshotError('invalid bullet state {}'.format(bullet_state))
+    pos = _HEADER.size
+    scalars = _SCALARS.unpack_from(blob, pos)
+    pos += _SCALARS.size
+    question = scalars[SCALARS.index('question')]
+    if num_questions is not None and not 0 <= question < num_questions:
+        raise SnapshotError('question {} is out of the question bank'.format(question))
+    lists = []
+    for _ in ENEMY_LISTS:
+        values = array('i')
+        values.frombytes(blob[pos:pos + n * values.itemsize])
+        if len(values) != n:
+            raise SnapshotError('snapshot is truncated')
+        pos += n * values.itemsize
+        lists.append(values)
+
+    ns['bullet_state'] = BULLET_STATES[bullet_state]
+    ns['num_of_enemies'] = n
+    for name, value in zip(SCALARS, scalars):
+        ns[name] = value
+    for name, values in zip(ENEMY_LISTS, lists):
+        ns[name][:] = values.tolist()
+
+
+def save(path, ns):
+    """
+    Write a snapshot to a file. The file is replaced atomically, so a crash
+    while saving leaves the previous snapshot intact.
+
+    :param path: File
+    :param ns: Namespace with the game variables
+    :return: None
+    """
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(snapshot(ns))
+    os.replace(tmp, path)
+
+
+def load(path, ns, num_questions=None):
+    """
+    Restore a snapshot file into the namespace.
+
+    :param path: File
+    :param ns: Namespace with the game variables
+    :param num_questions: Size of the question bank, see restore
+    :return: None
+    """
+    with open(path, 'rb') as f:
+        restore(f.read(), ns, num_questions)
@@ -0,0 +1,165 @@
+"""
+Sentence layout for Word Invader.
+
+Wraps a question sentence to a pixel width and composes it into a single
+surface, with the bracketed target word highlighted. The layout and the surface
+are computed once per question and reused every frame until it changes.
+"""
+
+from bisect import bisect_right
+from collections import namedtuple
+
+import pygame
+
+# A piece of text drawn at (x, y) relative to the sentence surface
+Run = namedtuple('Run', ['text', 'x', 'y', 'highlight'])
+
+
+class SentenceLayout(object):
+    """
+    Lays out sentences for one font.
+
+    Token widths come from the compiled corpus when available, otherwise they
+    are measured once with the font and cached. Line breaks are found with a
+    binary search over the running width of the tokens.
+
+    :param font: Font used to render the sentence
+    :param size: Point size of the font, used to look up precomputed widths
+    :param max_width: Wrapping width in pixels
+    :param color: Text color
+    :param highlight_color: Color of the target word
+    """
+
+    def __init__(self, font, size, max_width, color=(255, 255, 255), highlight_color=(255, 215, 0)):
+        self._font = font
+        self._size = size
+        self._max_width = max_width
+        self._color = color
+        self._highlight_color = highlight_color
+        self._line_height = font.get_linesize()
+        self._space = font.size(' ')[0]
+
+        self._advances = {}  # Glyph advance cache
+        self._widths = {}  # Word width cache
+
+        self._cache_key = None
+        self._cache_surface = None
+
+    def _advance(self, char):
+        advance = self._advances.get(char)
+        if advance is None:
+            metrics = self._font.metrics(char)[0]
+            advance = metrics[4] if metrics is not None else 0
+            self._advances[char] = advance
+        return advance
+
+    def _width(self, text):
+        width = self._widths.get(text)
+        if width is None:
+            width = self._font.size(text)[0]
+            self._widths[text] = width
+        return width
+
+    def _split_word(self, word):
+        """
+        Split a word wider than the line so that its head fits.
+
+        :param word: Word
+        :return: Tuple of (head, tail)
+        """
+        prefix = [0]
+        for char in word:
+            prefix.append(prefix[-1] + self._advance(char))
+        # Glyph advances are rounded down, so check the guess against the font
+        n = max(1, bisect_right(prefix, self._max_width) - 1)
+        while n > 1 and self._font.size(word[:n])[0] > self._max_width:
+            n -= 1
+        return word[:n], word[n:]
+
+    def wrap(self, tokens, widths=None):
+        """
+        Break tokens into lines.
+
+        :param tokens: Words of the sentence
+        :param widths: Precomputed pixel width of each word, optional
+        :return: List of lines, each a list of (token index, text)
+        """
+        items = [(i, t) for i, t in enumerate(tokens)]
+        if widths is None:
+            widths = [self._width(t) for t in tokens]
+        widths = list(widths)
+
+        def running(ws):
+            # prefix[k] is the width of the first k words, each followed by a space
+            prefix = [0]
+            for w in ws:
+                prefix.append(prefix[-1] + w + self._space)
+            return prefix
+
+        prefix = running(widths)
+        lines = []
+        start = 0
+        while start < len(items):
+            end = bisect_right(prefix, prefix[start] + self._max_width + self._space) - 1
+            if end == start:
+                # The word alone does not fit, break it
+                index, word = items[start]
+                head, tail = self._split_word(word)
+                items[start:start + 1] = [(index, head), (index, tail)]
+                widths[start:start + 1] = [self._width(head), self._width(tail)]
+                prefix = running(widths)
+                end = start + 1
+            lines.append(items[start:end])
+            start = end
+        return lines
+
+    def layout(self, tokens, target, widths=None):
+        """
+        Compute the positioned runs of a sentence. Consecutive words of the
+        same kind on a line are merged into a single run.
+
+        :param tokens: Words of the sentence
+        :param target: (start, end) token slice of the target word(s)
+        :param widths: Precomputed pixel width of each word, optional
+        :return: List of Run
+        """
+        runs = []
+        y = 0
+        for line in self.wrap(tokens, widths):
+            x = 0
+            words = []
+            highlight = None
+            for index, text in line + [(None, None)]:
+                is_target = index is not None and target[0] <= index < target[1]
+                if words and (index is None or is_target != highlight):
+                    run = ' '.join(words)
+                    runs.append(Run(run, x, y, highlight))
+                    x += self._width(run) + self._space
+                    words = []
+                words.append(text)
+                highlight = is_target
+            y += self._line_height
+        return runs
+
+    def render(self, sentence):
+        """
+        Return the composed surface of a compiled sentence. The surface is
+        cached until a different sentence is requested.
+
+        :param sentence: corpus.Sentence
+        :return: Surface
+        """
+        if sentence is self._cache_key:
+            return self._cache_surface
+
+        runs = self.layout(sentence.tokens, sentence.target, sentence.widths.get(self._size))
+        width = max([r.x + self._width(r.text) for r in runs] + [1])
+        height = max([r.y + self._line_height for r in runs] + [1])
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for run in runs:
+            color = self._highlight_color if run.highlight else self._color
+            surface.blit(self._font.render(run.text, True, color), (run.x, run.y))
+
+        self._cache_key = sentence
+        self._cache_surface = surface
+        return surface
@@ -0,0 +1,149 @@
+"""
+Background loading of gameplay assets.
+
+While the title screen is shown, a worker thread reads and decodes the gameplay
+images and sounds and loads the compiled question bank, or reads and tokenizes
+the raw one if it was not compiled. Reading files and decoding release the GIL,
+so the title screen keeps running. Work that must run on the main thread
+(converting images to the display format, opening fonts, measuring the raw
+question bank with the game font) is done in small steps by poll(), called once
+per title screen frame.
+"""
+
+import io
+import os
+import threading
+from collections import deque
+
+import pygame
+
+import corpus
+
+
+class AssetLoader(object):
+    """
+    Prefetches gameplay assets into an asset cache.
+
+    :param assets: assets.Assets cache to fill
+    :param images: Image files
+    :param sounds: Sound files
+    :param fonts: Font sizes
+    :param compiled: Compiled question bank
+    :param source: Raw question bank, used if there is no compiled file; it is tokenized by the worker and measured by poll()
+    """
+
+    # Raw sentences measured by each poll() step
+    MEASURE_STEP = 64
+
+    def __init__(self, assets, images=(), sounds=(), fonts=(),
+                 compiled='sentences.bin', source='questions.txt'):
+        self._assets = assets
+        self._images = list(images)
+        self._sounds = list(sounds)
+        self._fonts = deque(fonts)
+        self._compiled = compiled
+        self._source = source
+
+        # Decoded images waiting to be converted on the main thread
+        self._decoded = deque()
+        self._sentences = None
+
+        # Raw question bank tokenized by the worker, waiting to be measured,
+        # and the malformed sentences it found
+        self._tokenized = None
+        self._measured = []
+        self._corpus_errors = []
+        self._error = None
+
+        self._total = len(self._images) + len(self._sounds) + len(self._fonts) + 1
+        self._done = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name='asset-loader', daemon=True)
+
+    def start(self):
+        """
+        Start loading in the background.
+
+        :return: self
+        """
+        self._thread.start()
+        return self
+
+    def _step(self):
+        with self._lock:
+            self._done += 1
+
+    def _run(self):
+        try:
+            for name in self._images:
+                with open(name, 'rb') as f:
+                    data = f.read()
+                self._decoded.append((name, pygame.image.load(io.BytesIO(data), name)))
+            for name in self._sounds:
+                sound = None
+                if pygame.mixer.get_init():
+                    with open(name, 'rb') as f:
+                        sound = pygame.mixer.Sound(file=io.BytesIO(f.read()))
+                self._assets.add_sound(name, sound)
+                self._step()
+            if os.path.exists(self._compiled):
+                self._sentences = corpus.load_corpus(self._compiled).sentences
+                self._step()
+            else:
+                tokenized, self._corpus_errors = corpus.tokenize_rows(corpus.read_raw(self._source))
+                self._tokenized = tokenized
+        except Exception as e:
+            # Re-raised on the main thread by finish()
+            self._error = e
+
+    @property
+    def progress(self):
+        """
+        Fraction of the assets that are ready to use, from 0 to 1.
+
+        :return: float
+        """
+        with self._lock:
+            return self._done / self._total
+
+    def poll(self):
+        """
+        Finish one pending step that has to run on the main thread, if any.
+        Call it once per frame.
+
+        :return: Progress
+        """
+        if self._decoded:
+            name, surface = self._decoded.popleft()
+            self._assets.add_image(name, surface.convert_alpha())
+            self._step()
+        elif self._fonts:
+            self._assets.font(self._fonts.popleft())
+            self._step()
+        elif self._tokenized is not None and self._sentences is None:
+            fonts = {size: self._assets.font(size, corpus.FONT_NAME) for size in corpus.FONT_SIZES}
+            start = len(self._measured)
+            self._measured += corpus.measure(self._tokenized[start:start + self.MEASURE_STEP], fonts)
+            if len(self._measured) == len(self._tokenized):
+                self._sentences = self._measured
+                self._step()
+        return self.progress
+
+    def finish(self):
+        """
+        Wait for the worker and complete every pending step. Raises
+        corpus.CorpusError if the raw question bank has malformed sentences,
+        like the corpus compiler, or if the question bank is empty.
+
+        :return: Sentences of the question bank
+        """
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        if self._corpus_errors:
+            raise corpus.CorpusError('\n'.join('{}: {}'.format(self._source, e) for e in self._corpus_errors))
+        while self._sentences is None or self._decoded or self._fonts:
+            self.poll()
+        if len(self._sentences) == 0:
+            raise corpus.CorpusError('the question bank is empty')
+        return self._sentences
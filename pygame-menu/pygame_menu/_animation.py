@@ -0,0 +1,137 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+ANIMATION
+Time source of the animations.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2021 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+__all__ = [
+    'AnimationClock',
+    'get_animation_clock'
+]
+
+import time
+
+from pygame_menu._custom_types import NumberType
+
+
+class AnimationClock(object):
+    """
+    Monotonic time source of the animations, like the blinking of the selection
+    arrows and the text cursors. The clock is advanced once per
+    :py:meth:`pygame_menu.Menu.draw`, thus, every object drawn in the same frame
+    reads the same time. Unlike ``pygame.time.Clock.tick(framerate)`` it never
+    waits.
+
+    Objects should keep the time they read last and compute the elapsed time from
+    it, as the clock may be advanced more than once per frame if there are many
+    Menus.
+    """
+    _dt: float
+    _frame: int
+    _offset: float
+    _start: float
+    _time: float
+
+    def __init__(self) -> None:
+        self._dt = 0
+        self._frame = 0
+        self._offset = 0
+        self._start = time.perf_counter()
+        self._time = 0
+
+    def tick(self) -> float:
+        """
+        Advance the clock to the current time.
+
+        :return: Milliseconds elapsed since the previous tick
+        """
+        now = (time.perf_counter() - self._start) * 1000 + self._offset
+        self._dt = now - self._time
+        self._time = now
+        self._frame += 1
+        return self._dt
+
+    def advance(self, ms: NumberType) -> 'AnimationClock':
+        """
+        Move the clock forward, as if the given time had passed. The next readings
+        include it; for example, this can skip an animation.
+
+        :param ms: Milliseconds
+        :return: Self reference
+        """
+        assert isinstance(ms, (int, float)) and ms >= 0
+        self._offset += ms
+        self._time += ms
+        return self
+
+    def get_time(self) -> float:
+        """
+        Return the time of the last tick.
+
+        :return: Milliseconds since the clock was created
+        """
+        return self._time
+
+    def get_dt(self) -> float:
+        """
+        Return the time between the last two ticks.
+
+        :return: Milliseconds
+        """
+        return self._dt
+
+    def get_frame(self) -> int:
+        """
+        Return the number of ticks.
+
+        :return: Number of ticks
+        """
+        return self._frame
+
+    def elapsed(self, since: NumberType) -> float:
+        """
+        Return the time elapsed from a previous time of the clock until the last
+        tick.
+
+        :param since: Time returned by :py:meth:`pygame_menu._animation.AnimationClock.get_time`
+        :return: Milliseconds
+        """
+        return self._time - since
+
+
+# Shared by all the Menus
+_clock = AnimationClock()
+
+
+def get_animation_clock() -> 'AnimationClock':
+    """
+    Return the animation clock shared by all the Menus.
+
+    :return: Animation clock
+    """
+    return _clock
@@ -0,0 +1,166 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+CACHE
+Memory bounded caches shared by the Menu objects.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2021 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+__all__ = [
+    'LRUCache',
+    'surface_bytes'
+]
+
+from collections import OrderedDict
+
+import pygame
+from pygame_menu._custom_types import Any, Dict, Hashable, Optional
+
+
+def surface_bytes(surface: 'pygame.Surface') -> int:
+    """
+    Return the memory used by the pixels of a surface.
+
+    :param surface: Surface
+    :return: Size in bytes
+    """
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class LRUCache(object):
+    """
+    Least recently used cache. If the total size of the stored values exceeds
+    ``max_size``, or the number of values exceeds ``max_items``, the least
+    recently used values are evicted.
+
+    The size of each value is given when it is stored; for surfaces use
+    :py:func:`pygame_menu._cache.surface_bytes`.
+
+    :param max_size: Maximum total size of the values. If ``0`` there's no limit
+    :param max_items: Maximum number of values. If ``0`` there's no limit
+    """
+    _data: 'OrderedDict[Hashable, Any]'
+    _sizes: Dict[Hashable, int]
+    evictions: int
+    hits: int
+    max_items: int
+    max_size: int
+    misses: int
+    size: int
+
+    def __init__(self, max_size: int = 0, max_items: int = 0) -> None:
+        assert isinstance(max_size, int) and max_size >= 0
+        assert isinstance(max_items, int) and max_items >= 0
+        self._data = OrderedDict()
+        self._sizes = {}
+        self.max_items = max_items
+        self.max_size = max_size
+        self.size = 0
+
+        # Stats
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return a value and mark it as the most recently used.
+
+        :param key: Key
+        :return: Value, ``None`` if the key is not stored
+        """
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any, size: int = 0) -> Any:
+        """
+        Store a value, evicting the least recently used values if the cache is
+        full. A value larger than ``max_size`` is not stored.
+
+        :param key: Key
+        :param value: Value, cannot be ``None``
+        :param size: Size of the value
+        :return: The value
+        """
+        assert value is not None
+        if key in self._data:
+            self.remove(key)
+        if 0 < self.max_size < size:
+            return value
+        self._data[key] = value
+        self._sizes[key] = size
+        self.size += size
+        while 0 < self.max_size < self.size or 0 < self.max_items < len(self._data):
+            old, _ = self._data.popitem(last=False)
+            self.size -= self._sizes.pop(old)
+            self.evictions += 1
+        return value
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Remove a value, if stored.
+
+        :param key: Key
+        :return: None
+        """
+        if key in self._data:
+            del self._data[key]
+            self.size -= self._sizes.pop(key)
+
+    def clear(self) -> None:
+        """
+        Remove all the values. The stats are kept.
+
+        :return: None
+        """
+        self._data.clear()
+        self._sizes.clear()
+        self.size = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Return the cache stats.
+
+        :return: Dict of hits, misses, evictions, number of items and total size
+        """
+        return {
+            'evictions': self.evictions,
+            'hits': self.hits,
+            'items': len(self._data),
+            'misses': self.misses,
+            'size': self.size
+        }
@@ -0,0 +1,234 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+PROFILER
+Timings of the Menu draw phases and widgets.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2021 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+__all__ = ['MenuProfiler']
+
+from collections import deque
+import json
+import time
+
+from pygame_menu._custom_types import Any, Dict, List, Optional, Tuple
+
+# Percentiles of the stats
+_PERCENTILES = (50, 90, 99)
+
+
+class MenuProfiler(object):
+    """
+    Records the time spent by each phase of a frame (layout, widgets, decorator,
+    scroll, menubar, focus...) and by each widget class. The totals of each frame
+    are stored in fixed-size ring buffers, thus, the stats describe the last
+    ``buffer_size`` frames.
+
+    Each phase and widget draw is also stored as an event (up to ``trace_size``),
+    which can be exported in Chrome trace-event format and opened in
+    ``chrome://tracing`` or Perfetto.
+
+    See :py:meth:`pygame_menu.Menu.set_profiling`.
+
+    :param buffer_size: Number of frames stored for each phase and widget class
+    :param trace_size: Maximum number of trace events stored
+    """
+    _buffer_size: int
+    _frame_phases: Dict[str, float]
+    _frame_widgets: Dict[str, float]
+    _phases: Dict[str, 'deque']
+    _start: float
+    _trace: 'deque'
+    _widgets: Dict[str, 'deque']
+    frames: int
+
+    def __init__(self, buffer_size: int = 256, trace_size: int = 16384) -> None:
+        assert isinstance(buffer_size, int) and buffer_size > 0
+        assert isinstance(trace_size, int) and trace_size >= 0
+        self._buffer_size = buffer_size
+        self._frame_phases = {}
+        self._frame_widgets = {}
+        self._phases = {}
+        self._start = time.perf_counter()
+        self._trace = deque(maxlen=trace_size)
+        self._widgets = {}
+        self.frames = 0
+
+    def begin(self) -> float:
+        """
+        Start a frame.
+
+        :return: Current time (s)
+        """
+        self._frame_phases.clear()
+        self._frame_widgets.clear()
+        return time.perf_counter()
+
+    def phase(self, name: str, t0: float) -> float:
+        """
+        Record a phase of the current frame, which started at the given time. If
+        the phase is recorded many times within the frame the times are added.
+
+        :param name: Phase name
+        :param t0: Start time (s)
+        :return: Current time (s), the start time of the next phase
+        """
+        t = time.perf_counter()
+        self._frame_phases[name] = self._frame_phases.get(name, 0) + t - t0
+        self._trace.append((name, 'phase', t0, t - t0))
+        return t
+
+    def widget(self, name: str, t0: float) -> float:
+        """
+        Record the draw of a widget within the current frame.
+
+        :param name: Widget class name
+        :param t0: Start time (s)
+        :return: Current time (s)
+        """
+        t = time.perf_counter()
+        self._frame_widgets[name] = self._frame_widgets.get(name, 0) + t - t0
+        self._trace.append((name, 'widget', t0, t - t0))
+        return t
+
+    def end(self, name: str, t0: float) -> None:
+        """
+        Finish the frame, and store the totals of the phases and widget classes.
+
+        :param name: Frame name, recorded as a phase, for example ``'draw'``
+        :param t0: Start time of the frame (s), returned by :py:meth:`pygame_menu._profiler.MenuProfiler.begin`
+        :return: None
+        """
+        t = time.perf_counter()
+        self._trace.append((name, 'frame', t0, t - t0))
+        self._frame_phases[name] = t - t0
+        for buffers, frame in ((self._phases, self._frame_phases), (self._widgets, self._frame_widgets)):
+            for key, dt in frame.items():
+                buffer = buffers.get(key)
+                if buffer is None:
+                    buffer = buffers[key] = deque(maxlen=self._buffer_size)
+                buffer.append(dt)
+        self.frames += 1
+
+    def clear(self) -> 'MenuProfiler':
+        """
+        Remove all the recorded timings.
+
+        :return: Self reference
+        """
+        self._phases.clear()
+        self._trace.clear()
+        self._widgets.clear()
+        self.frames = 0
+        return self
+
+    @staticmethod
+    def _summary(values: 'deque') -> Dict[str, float]:
+        """
+        Return the summary of a buffer.
+
+        :param values: Times (s)
+        :return: Number of frames, and mean, min, max and percentiles (ms)
+        """
+        values = sorted(values)
+        n = len(values)
+        summary = {
+            'count': n,
+            'max': values[-1] * 1000,
+            'mean': sum(values) / n * 1000,
+            'min': values[0] * 1000
+        }
+        for p in _PERCENTILES:  # Nearest-rank
+            summary['p{0}'.format(p)] = values[max(0, -(-p * n // 100) - 1)] * 1000
+        return summary
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return the stats of the phases and widget classes over the stored frames.
+        Each one has the number of frames (``count``), and the ``mean``, ``min``,
+        ``max``, ``p50``, ``p90`` and ``p99`` times in milliseconds.
+
+        :return: Dict of ``frames``, ``phases`` and ``widgets``
+        """
+        return {
+            'frames': self.frames,
+            'phases': {name: self._summary(values) for name, values in sorted(self._phases.items())},
+            'widgets': {name: self._summary(values) for name, values in sorted(self._widgets.items())}
+        }
+
+    def get_trace(self) -> List[Tuple[str, str, float, float]]:
+        """
+        Return the stored events.
+
+        :return: List of (name, category, start time, duration), times in seconds
+        """
+        return list(self._trace)
+
+    @staticmethod
+    def _write(data: Dict[str, Any], path: Optional[str]) -> str:
+        """
+        Serialize the data as JSON, and write it if a path is given.
+
+        :param data: Data
+        :param path: File path
+        :return: JSON string
+        """
+        data = json.dumps(data, indent=1)
+        if path is not None:
+            with open(path, 'w') as f:
+                f.write(data)
+        return data
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """
+        Export the stats as JSON, see :py:meth:`pygame_menu._profiler.MenuProfiler.get_stats`.
+
+        :param path: If given, the JSON is also written to this file
+        :return: JSON string
+        """
+        return self._write(self.get_stats(), path)
+
+    def to_chrome_trace(self, path: Optional[str] = None) -> str:
+        """
+        Export the stored events in Chrome trace-event format (complete events,
+        times in microseconds since the profiler was created).
+
+        :param path: If given, the trace is also written to this file
+        :return: JSON string
+        """
+        events = []
+        for name, category, t0, dt in self._trace:
+            events.append({
+                'cat': category,
+                'dur': dt * 1e6,
+                'name': name,
+                'ph': 'X',
+                'pid': 0,
+                'tid': 0,
+                'ts': (t0 - self._start) * 1e6
+            })
+        return self._write({'displayTimeUnit': 'ms', 'traceEvents': events}, path)
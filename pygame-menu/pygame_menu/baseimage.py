@@ -49,22 +49,35 @@ __all__ = [
     'IMAGE_MODE_SIMPLE',
 
     # Base class
-    'BaseImage'
+    'BaseImage',
+
+    # Image cache
+    'get_image_cache'
 
 ]
 
 import base64
+import hashlib
+import os
 import os.path as path
 import math
+import weakref
 from io import BytesIO
 from pathlib import Path
 
 import pygame
 import pygame_menu.locals as _locals
+from pygame_menu._cache import LRUCache, surface_bytes
 from pygame_menu.utils import assert_vector, assert_position
 from pygame_menu._custom_types import Tuple2IntType, Union, Vector2NumberType, Callable, Tuple, List, \
     NumberType, Optional, Dict, Tuple4IntType, Literal, Tuple2NumberType, ColorType, Tuple3IntType, Any
 
+try:
+    import numpy as np
+    import pygame.surfarray as _surfarray
+except (ModuleNotFoundError, ImportError):
+    np = None
+
 # Example image paths
 __images_path__ = path.join(path.dirname(path.abspath(__file__)), 'resources', 'images', '{0}')
 
@@ -92,6 +105,22 @@ _VALID_IMAGE_FORMATS = ['.jpg', '.png', '.gif', '.bmp', '.pcx', '.tga', '.tif',
 # Custom types
 ColorChannelType = Literal['r', 'g', 'b']
 
+# Decoded images shared by all the BaseImage objects, up to 64 MB
+_image_cache = LRUCache(max_size=64 * 1024 * 1024)
+
+
+def get_image_cache() -> 'LRUCache':
+    """
+    Return the cache of decoded images shared by all the
+    :py:class:`pygame_menu.baseimage.BaseImage` objects, keyed by the file (path
+    and modification time) or by the hash of the image data. Its stats are given
+    by ``get_image_cache().get_stats()``, and its memory limit (bytes) can be
+    changed through ``get_image_cache().max_size``.
+
+    :return: Image cache
+    """
+    return _image_cache
+
 
 class BaseImage(object):
     """
@@ -107,6 +136,8 @@ class BaseImage(object):
     """
     _angle: NumberType
     _attributes: Dict[str, Any]
+    _decoded_bytes: int
+    _decoded_surface: Optional['weakref.ReferenceType']
     _drawing_mode: int
     _drawing_offset: Tuple2IntType
     _drawing_position: str
@@ -114,10 +145,15 @@ class BaseImage(object):
     _filename: str
     _filepath: Union[str, 'BytesIO']
     _frombase64: bool
-    _last_transform: Tuple[int, int, Optional['pygame.Surface']]
+    _image_data: Optional[bytes]
+    _image_key: Optional[Tuple[Any, ...]]
+    _last_transform: Tuple[Optional[Tuple[Any, ...]], Optional['pygame.Surface']]
     _original_surface: 'pygame.Surface'
     _rotated: bool
     _surface: 'pygame.Surface'
+    _transform_cache: Optional['LRUCache']
+    _transform_cache_angle_step: NumberType
+    _transform_cache_scale_step: NumberType
     smooth_scaling: bool
 
     def __init__(self,
@@ -164,27 +200,106 @@ class BaseImage(object):
         self.set_drawing_offset(drawing_offset)
         self.set_drawing_position(drawing_position)
 
-        # Convert from bas64 to bytesio
-        if frombase64:
-            if 'base64,' in image_path:  # Remove header of file
-                for i in range(len(image_path)):
-                    if image_path[i] == ',':
-                        image_path = image_path[(i + 1):]
-                        break
-            image_path = BytesIO(base64.b64decode(image_path))
-
-        # Load the image and store as a surface
+        # The image is decoded the first time its surface is used, see _load(). The
+        # decoded surface is shared by the images of the same file or data
+        self._decoded_bytes = 0
+        self._decoded_surface = None
+        self._image_data = None
+        self._image_key = None
         if load_from_file:
-            self._surface = pygame.image.load(image_path)
-            self._original_surface = self._surface.copy()
+            if frombase64:
+                if 'base64,' in image_path:  # Remove header of file
+                    for i in range(len(image_path)):
+                        if image_path[i] == ',':
+                            image_path = image_path[(i + 1):]
+                            break
+                self._image_data = base64.b64decode(image_path)
+            elif isinstance(image_path, BytesIO):
+                self._image_data = image_path.read()
+            if self._image_data is not None:
+                self._image_key = ('data', hashlib.sha1(self._image_data).digest())
+            else:
+                stat = os.stat(image_path)
+                self._image_key = ('file', path.abspath(image_path), stat.st_mtime_ns, stat.st_size)
 
         # Other internals
         self._angle = 0
         self._attributes = {}
-        self._last_transform = (0, 0, None)  # Improves drawing
+        self._last_transform = (None, None)  # Scaled or tiled surface drawn last, see draw()
         self._rotated = False
         self.smooth_scaling = True  # Uses smooth scaling by default in draw() method
 
+        # Rotated and scaled surfaces, see set_transform_cache()
+        self._transform_cache = None
+        self._transform_cache_angle_step = 0
+        self._transform_cache_scale_step = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Called only if the attribute does not exist, that is, if the surfaces
+        # have not been loaded yet
+        if name in ('_surface', '_original_surface') and self.__dict__.get('_image_key') is not None:
+            self._load()
+            return self.__dict__[name]
+        raise AttributeError('{0} object has no attribute {1}'.format(self.__class__.__name__, name))
+
+    def _load(self) -> None:
+        """
+        Decode the image, or take it from the image cache. The surface is shared
+        with the cache and other images until its pixels change.
+
+        :return: None
+        """
+        surface = _image_cache.get(self._image_key)
+        if surface is None:
+            if self._image_data is not None:
+                surface = pygame.image.load(BytesIO(self._image_data))
+            else:
+                surface = pygame.image.load(self._filepath)
+            _image_cache.put(self._image_key, surface, surface_bytes(surface))
+        self._decoded_bytes = surface_bytes(surface)
+        self._decoded_surface = weakref.ref(surface)
+        self._image_data = None
+        self._image_key = None
+        self._surface = surface
+        self._original_surface = surface
+
+    def is_loaded(self) -> bool:
+        """
+        Return ``True`` if the image has been decoded. Images are decoded the first
+        time they are drawn or their size or pixels are requested.
+
+        :return: ``True`` if loaded
+        """
+        return '_surface' in self.__dict__
+
+    def get_memory_usage(self) -> Dict[str, int]:
+        """
+        Return the memory used by the image, in bytes. ``decoded`` is the size of
+        the decoded image (``0`` if not loaded yet), and ``resident`` is the size of
+        the surfaces kept by this image (current, checkpoint, drawing and
+        transform cache surfaces), except the decoded one, which is shared through
+        :py:func:`pygame_menu.baseimage.get_image_cache`.
+
+        :return: Dict of decoded and resident bytes
+        """
+        resident = 0
+        if self.is_loaded():
+            shared = self._decoded_surface()
+            surfaces = {}
+            for surface in (self._surface, self._original_surface, self._last_transform[1]):
+                if surface is not None:
+                    surface = surface.get_abs_parent()  # Subsurfaces use the pixels of their parent
+                    surfaces[id(surface)] = surface
+            for s in surfaces.values():
+                if s is not shared:
+                    resident += surface_bytes(s)
+            if self._transform_cache is not None:
+                resident += self._transform_cache.size
+        return {
+            'decoded': self._decoded_bytes,
+            'resident': resident
+        }
+
     def __copy__(self) -> 'BaseImage':
         """
         Copy method.
@@ -280,6 +395,7 @@ class BaseImage(object):
         :param flags: Optional flags
         :return: Self reference
         """
+        self._prepare_surface_change()
         if value is None:
             self._surface.set_alpha(None)
             return self
@@ -347,9 +463,23 @@ class BaseImage(object):
             frombase64=self._frombase64
         )
         image._angle = self._angle
-        image._surface = self._surface.copy()
-        image._original_surface = self._surface.copy()
+        if not self.is_loaded():  # Share the image, decoded by the first that uses it
+            image._image_data = self._image_data
+            image._image_key = self._image_key
+        else:
+            # The surfaces are copied before changing their pixels, thus, the
+            # current surface is shared if it's the checkpoint
+            if self._surface is self._original_surface:
+                image._surface = self._surface
+            else:
+                image._surface = self._surface.copy()
+            image._original_surface = image._surface
+            image._decoded_bytes = self._decoded_bytes
+            image._decoded_surface = self._decoded_surface
         image.smooth_scaling = self.smooth_scaling
+        if self._transform_cache is not None:
+            image.set_transform_cache(True, self._transform_cache_angle_step, self._transform_cache_scale_step,
+                                      self._transform_cache.max_size)
         for k in self._attributes.keys():
             image.set_attribute(k, self._attributes[k])
         return image
@@ -477,6 +607,7 @@ class BaseImage(object):
         :return: Self reference
         """
         assert_vector(pos, 2)
+        self._prepare_surface_change()
         self._surface.set_at(pos, color)
         return self
 
@@ -492,6 +623,13 @@ class BaseImage(object):
         """
         Return the surface object of the image.
 
+        .. note::
+
+            The pixels of the image may be shared with other images of the same
+            file or data, see :py:func:`pygame_menu.baseimage.get_image_cache`,
+            thus, the returned surface must not be modified; copy it instead, or
+            use the methods of the image.
+
         :param new: Return a new surface, if ``False`` return the same object
         :return: Image surface
         """
@@ -533,7 +671,7 @@ class BaseImage(object):
 
         :return: Self reference
         """
-        self._surface = self._original_surface.copy()
+        self._surface = self._original_surface  # Copied before changing its pixels
         return self
 
     def checkpoint(self) -> 'BaseImage':
@@ -542,7 +680,8 @@ class BaseImage(object):
 
         :return: Self reference
         """
-        self._original_surface = self._surface.copy()
+        self._prepare_surface_change()
+        self._original_surface = self._surface
         return self
 
     def apply_image_function(self, image_function: Callable[[int, int, int, int], Tuple4IntType]
@@ -553,42 +692,94 @@ class BaseImage(object):
 
         .. note::
 
-            See :py:meth:`pygame_menu.BaseImage.to_bw` method as an example.
+            This function calls ``image_function`` for each pixel, thus, it is slow for large
+            images. If the function only uses arithmetic, use
+            :py:meth:`pygame_menu.BaseImage.apply_image_array_function` instead.
 
         :param image_function: Color function, takes colors as ``image_function=myfunc(r,g,b,a)``. Returns the same tuple *(r, g, b, a)*
         :return: Self reference
         """
-        w, h = self._surface.get_size()
+        self._prepare_surface_change()
+        surface = self._surface
+        w, h = surface.get_size()
         for x in range(w):
             for y in range(h):
-                r, g, b, a = self._surface.get_at((x, y))
+                r, g, b, a = surface.get_at((x, y))
                 r, g, b, a = image_function(r, g, b, a)
                 r = int(max(0, min(r, 255)))
                 g = int(max(0, min(g, 255)))
                 b = int(max(0, min(b, 255)))
                 a = int(max(0, min(a, 255)))
-                self.set_at((x, y), pygame.Color(r, g, b, a))
+                surface.set_at((x, y), pygame.Color(r, g, b, a))
         return self
 
-    def to_bw(self) -> 'BaseImage':
+    def apply_image_array_function(self, image_function: Callable[[Any, Any, Any, Any], Tuple[Any, Any, Any, Any]]
+                                   ) -> 'BaseImage':
         """
-        Converts the image to black and white.
+        Apply a function to all the pixels of the image at once. The function will
+        receive the red, green, blue and alpha channels as integer NumPy arrays of
+        the image size, and must return the new channels (arrays or numbers). The
+        values are clipped to *[0, 255]*.
+
+        For example, to invert the colors:
+
+        .. code-block:: python
+
+            image.apply_image_array_function(lambda r, g, b, a: (255 - r, 255 - g, 255 - b, a))
+
+        If NumPy is not installed, or the image format is not supported by
+        ``pygame.surfarray`` (for example, 8-bit images), the function is called
+        for each pixel with integer values, as in
+        :py:meth:`pygame_menu.BaseImage.apply_image_function`; then it should use
+        only arithmetic operations.
 
         .. note::
 
-            This function is slow for large images.
+            If the image has no per-pixel alpha, the returned alpha is ignored.
+
+        :param image_function: Channels function, takes channels as ``image_function=myfunc(r,g,b,a)``. Returns the same tuple *(r, g, b, a)*
+        :return: Self reference
+        """
+        if np is None or self._surface.get_bitsize() not in (24, 32):
+            return self.apply_image_function(image_function)
+        self._prepare_surface_change()
+        try:
+            rgb = _surfarray.pixels3d(self._surface)
+        except ValueError:  # Unsupported pixel format
+            return self.apply_image_function(image_function)
+        alpha = None
+        if self._surface.get_flags() & pygame.SRCALPHA:
+            alpha = _surfarray.pixels_alpha(self._surface)
+            a = alpha.astype(np.int32)
+        else:
+            a = np.full(rgb.shape[0:2], 255, dtype=np.int32)
+
+        channels = image_function(rgb[:, :, 0].astype(np.int32), rgb[:, :, 1].astype(np.int32),
+                                  rgb[:, :, 2].astype(np.int32), a)
+        for i in range(3):
+            rgb[:, :, i] = np.clip(channels[i], 0, 255).astype(np.uint8)
+        if alpha is not None:
+            alpha[:, :] = np.clip(channels[3], 0, 255).astype(np.uint8)
+
+        # Release the surface lock
+        del rgb, alpha
+        return self
+
+    def to_bw(self) -> 'BaseImage':
+        """
+        Converts the image to black and white.
 
         :return: Self reference
         """
 
-        def bw(r: int, g: int, b: int, a: int) -> Tuple4IntType:
+        def bw(r: Any, g: Any, b: Any, a: Any) -> Tuple[Any, Any, Any, Any]:
             """
             To black-white function.
             """
-            c = int((r + g + b) / 3)
+            c = (r + g + b) // 3
             return c, c, c, a
 
-        return self.apply_image_function(image_function=bw)
+        return self.apply_image_array_function(image_function=bw)
 
     def pick_channels(self, channels: Union[ColorChannelType,
                                             Tuple[ColorChannelType, ColorChannelType],
@@ -608,20 +799,75 @@ class BaseImage(object):
             channels = [channels]
         assert isinstance(channels, (tuple, list))
         assert 1 <= len(channels) <= 3, 'maximum size of channels can be 3'
+        pr, pg, pb = int('r' in channels), int('g' in channels), int('b' in channels)
 
-        w, h = self._surface.get_size()
-        for x in range(w):
-            for y in range(h):
-                r, g, b, a = self._surface.get_at((x, y))
-                if 'r' not in channels:
-                    r = 0
-                if 'g' not in channels:
-                    g = 0
-                if 'b' not in channels:
-                    b = 0
-                # noinspection PyArgumentList
-                self._surface.set_at((x, y), pygame.Color(r, g, b, a))
-        return self
+        def pick(r: Any, g: Any, b: Any, a: Any) -> Tuple[Any, Any, Any, Any]:
+            """
+            Pick channels function.
+            """
+            return r * pr, g * pg, b * pb, a
+
+        return self.apply_image_array_function(image_function=pick)
+
+    def tint(self, color: ColorType) -> 'BaseImage':
+        """
+        Tint the image, multiplying each channel by the given color. For example,
+        ``(255, 255, 255)`` keeps the image, and ``(255, 0, 0)`` keeps only the red channel.
+        If the color has alpha, it also multiplies the image alpha.
+
+        :param color: Tint color
+        :return: Self reference
+        """
+        assert isinstance(color, (tuple, list)) and len(color) in (3, 4), 'invalid color'
+        tr, tg, tb = color[0:3]
+        ta = color[3] if len(color) == 4 else 255
+
+        def tint(r: Any, g: Any, b: Any, a: Any) -> Tuple[Any, Any, Any, Any]:
+            """
+            Tint function.
+            """
+            return r * tr // 255, g * tg // 255, b * tb // 255, a * ta // 255
+
+        return self.apply_image_array_function(image_function=tint)
+
+    def adjust_brightness_contrast(self, brightness: NumberType = 0, contrast: NumberType = 1) -> 'BaseImage':
+        """
+        Adjust the brightness and contrast of the image. Each color channel
+        ``c`` changes to ``(c - 128) * contrast + 128 + brightness``.
+
+        :param brightness: Value added to each channel, from ``-255`` to ``255``
+        :param contrast: Contrast factor, ``1`` keeps the image contrast
+        :return: Self reference
+        """
+        assert isinstance(brightness, (int, float)) and -255 <= brightness <= 255
+        assert isinstance(contrast, (int, float)) and contrast >= 0, 'contrast cannot be negative'
+
+        def adjust(r: Any, g: Any, b: Any, a: Any) -> Tuple[Any, Any, Any, Any]:
+            """
+            Brightness and contrast function.
+            """
+            return (r - 128) * contrast + 128 + brightness, (g - 128) * contrast + 128 + brightness, \
+                (b - 128) * contrast + 128 + brightness, a
+
+        return self.apply_image_array_function(image_function=adjust)
+
+    def scale_alpha(self, factor: NumberType) -> 'BaseImage':
+        """
+        Multiply the alpha of each pixel by a factor. The image must have per-pixel
+        alpha; else, use :py:meth:`pygame_menu.BaseImage.set_alpha`.
+
+        :param factor: Alpha factor
+        :return: Self reference
+        """
+        assert isinstance(factor, (int, float)) and factor >= 0, 'factor cannot be negative'
+
+        def scale(r: Any, g: Any, b: Any, a: Any) -> Tuple[Any, Any, Any, Any]:
+            """
+            Alpha scaling function.
+            """
+            return r, g, b, a * factor
+
+        return self.apply_image_array_function(image_function=scale)
 
     def flip(self, x: bool, y: bool) -> 'BaseImage':
         """
@@ -652,12 +898,28 @@ class BaseImage(object):
         assert isinstance(smooth, bool)
         assert width > 0 and height > 0, 'width and height must be greater than zero'
         w, h = self.get_size()
+        step = self._transform_cache_scale_step
+        if self._transform_cache is not None and step > 0:
+            width = max(1, round(width / step)) * step
+            height = max(1, round(height / step)) * step
         if width == 1 and height == 1:
             return self
+
+        # Look up the cache, keyed by the source surface
+        key = None
+        if self._transform_cache is not None:
+            key = ('scale', self._surface, width, height, smooth)
+            surface = self._transform_cache.get(key)
+            if surface is not None:
+                self._surface = surface
+                return self
+
         if not smooth or self._surface.get_bitsize() < 24:
             self._surface = pygame.transform.scale(self._surface, (int(w * width), int(h * height)))
         else:  # image bitsize less than 24 bits raises ValueError
             self._surface = pygame.transform.smoothscale(self._surface, (int(w * width), int(h * height)))
+        if key is not None:
+            self._transform_cache.put(key, self._surface, surface_bytes(self._surface))
         return self
 
     def scale2x(self) -> 'BaseImage':
@@ -736,6 +998,11 @@ class BaseImage(object):
             return self
         if not self._rotated and auto_checkpoint:
             self.checkpoint()
+        if self._transform_cache is not None and (self._rotated or auto_checkpoint):
+            self._rotated = True
+            self._surface = self._get_rotated_surface(angle)
+            self._angle = angle % 360
+            return self
         if self._rotated:
             self.restore()
         self._rotated = True
@@ -743,6 +1010,108 @@ class BaseImage(object):
         self._angle = angle % 360
         return self
 
+    def set_transform_cache(self,
+                            enabled: bool = True,
+                            angle_step: NumberType = 1,
+                            scale_step: NumberType = 0.01,
+                            max_size: int = 32 * 1024 * 1024
+                            ) -> 'BaseImage':
+        """
+        Enable or disable the cache of rotated and scaled surfaces. If enabled, the
+        rotation angles are rounded to multiples of ``angle_step`` and the scale
+        factors to multiples of ``scale_step``, and the transformed surfaces are
+        kept, up to ``max_size`` bytes of pixels. Thus, an image rotated a bit each
+        frame is only transformed the first time each angle is reached.
+
+        The cached rotations are taken from the checkpointed surface, so they are
+        discarded by :py:meth:`pygame_menu.BaseImage.checkpoint`, and by methods
+        which modify the pixels, like :py:meth:`pygame_menu.BaseImage.set_alpha`.
+
+        .. note::
+
+            The surfaces are shared with the cache, thus, the surface returned by
+            ``get_surface(new=False)`` must not be modified.
+
+        :param enabled: Enable the cache
+        :param angle_step: Rotation angle step (degrees). If ``0`` angles are not rounded
+        :param scale_step: Scale factor step. If ``0`` factors are not rounded
+        :param max_size: Maximum memory of the cached surfaces (bytes)
+        :return: Self reference
+        """
+        assert isinstance(enabled, bool)
+        assert isinstance(angle_step, (int, float)) and 0 <= angle_step <= 360
+        assert isinstance(scale_step, (int, float)) and scale_step >= 0
+        assert isinstance(max_size, int) and max_size > 0
+        self._transform_cache = LRUCache(max_size=max_size) if enabled else None
+        self._transform_cache_angle_step = angle_step
+        self._transform_cache_scale_step = scale_step
+        return self
+
+    def get_transform_cache(self) -> Optional['LRUCache']:
+        """
+        Return the cache of rotated and scaled surfaces, ``None`` if disabled. Its
+        stats are given by ``get_transform_cache().get_stats()``.
+
+        :return: Transform cache
+        """
+        return self._transform_cache
+
+    def precompute_rotations(self) -> 'BaseImage':
+        """
+        Rotate the image by each multiple of the cache angle step, from ``0`` to
+        ``360`` degrees, and store the surfaces in the transform cache. Then, any
+        call to :py:meth:`pygame_menu.BaseImage.rotate` only takes the surface from
+        the cache. The cache must be enabled with a non-zero angle step, and
+        ``max_size`` must be large enough to keep all the rotations.
+
+        :return: Self reference
+        """
+        assert self._transform_cache is not None and self._transform_cache_angle_step > 0, \
+            'transform cache must be enabled with a non-zero angle step'
+        if not self._rotated:
+            self.checkpoint()
+            self._rotated = True  # The current surface is the checkpoint rotated by the current angle
+        step = self._transform_cache_angle_step
+        for i in range(int(math.ceil(360 / step))):
+            self._get_rotated_surface(i * step)
+        return self
+
+    def _get_rotated_surface(self, angle: NumberType) -> 'pygame.Surface':
+        """
+        Return the checkpointed surface rotated by the angle rounded to the cache
+        step, from the transform cache if possible.
+
+        :param angle: Rotation angle (degrees)
+        :return: Rotated surface
+        """
+        step = self._transform_cache_angle_step
+        if step > 0:
+            k = round(angle / step) % max(1, round(360 / step))
+            angle = k * step
+        else:
+            angle = angle % 360
+        key = ('rotate', angle)
+        surface = self._transform_cache.get(key)
+        if surface is None:
+            surface = pygame.transform.rotate(self._original_surface, angle)
+            self._transform_cache.put(key, surface, surface_bytes(surface))
+        return surface
+
+    def _prepare_surface_change(self) -> None:
+        """
+        Discard the transformed surfaces, as the pixels of the image are going to
+        change. If the surface is shared with the checkpoint (and maybe with other
+        images and the image cache), or it's a crop of another surface, it is
+        copied.
+
+        :return: None
+        """
+        self._last_transform = (None, None)
+        if self._transform_cache is not None:
+            self._transform_cache.clear()
+        if self._surface is self._original_surface or self._surface.get_parent() is not None:
+            self._surface = self._surface.copy()
+
     def get_angle(self) -> NumberType:
         """
         Return the image angle.
@@ -779,6 +1148,45 @@ class BaseImage(object):
         else:
             raise ValueError('unknown drawing position')
 
+    def _get_tiled_surface(self, area: 'pygame.Rect') -> 'pygame.Surface':
+        """
+        Compose the image repeated over the area, as drawn by the repeat modes.
+        The tiles keep their pixel alpha, and the alpha of the image is applied
+        when the composed surface is drawn.
+
+        :param area: Area to draw
+        :return: Surface
+        """
+        w, h = self._surface.get_size()
+        timesx, timesy = 1, 1
+        if self._drawing_mode != IMAGE_MODE_REPEAT_Y:
+            timesx = int(math.ceil(float(area.width) / w))
+        if self._drawing_mode != IMAGE_MODE_REPEAT_X:
+            timesy = int(math.ceil(float(area.height) / h))
+        assert timesx > 0 and timesy > 0, \
+            'invalid size, width and height must be greater than zero'
+
+        # Only the part of the image within the area is drawn in each tile
+        tile = self._surface.get_rect().clip(area)
+        tiled = pygame.Surface(((timesx - 1) * w + tile.width, (timesy - 1) * h + tile.height),
+                               pygame.SRCALPHA, 32)
+        alpha = self._surface.get_alpha()
+        per_pixel = self._surface.get_masks()[3] != 0
+
+        # Copy the pixels unchanged. Images with per pixel alpha are copied with
+        # a blend mode, as a regular blit would blend them with the empty surface
+        if not per_pixel:
+            self._surface.set_alpha(None)
+        flags = pygame.BLEND_RGBA_MAX if per_pixel else 0
+        for x in range(timesx):
+            for y in range(timesy):
+                tiled.blit(self._surface, (x * w, y * h), tile, flags)
+        if not per_pixel:
+            self._surface.set_alpha(alpha)
+        if alpha is not None:
+            tiled.set_alpha(alpha)
+        return tiled
+
     def draw(self, surface: 'pygame.Surface', area: Optional['pygame.Rect'] = None,
              position: Tuple2IntType = (0, 0)) -> 'BaseImage':
         """
@@ -805,18 +1213,25 @@ class BaseImage(object):
         offx = self._drawing_offset[0] - px
         offy = self._drawing_offset[1] - py
 
-        if self._drawing_mode == IMAGE_MODE_FILL:
-
-            # Check if exists the transformed surface
-            if area.width == self._last_transform[0] and area.height == self._last_transform[1] and \
-                    self._last_transform[2] is not None:
-                surf = self._last_transform[2]
-            else:  # Transform scale
-                if self.smooth_scaling and self._surface.get_bitsize() > 8:
-                    surf = pygame.transform.smoothscale(self._surface, (area.width, area.height))
+        if self._drawing_mode in (IMAGE_MODE_FILL, IMAGE_MODE_REPEAT_X, IMAGE_MODE_REPEAT_Y,
+                                  IMAGE_MODE_REPEAT_XY):
+
+            # The drawn surface only depends on the image and the area, thus,
+            # it's reused while both are the same. Moving the image (offset,
+            # position) only changes where it is blitted
+            key = (self._drawing_mode, self._surface, self.smooth_scaling, area.width, area.height)
+            if self._drawing_mode != IMAGE_MODE_FILL:
+                key += tuple(self._surface.get_rect().clip(area))  # Part of the image drawn in each tile
+            surf = self._last_transform[1]
+            if surf is None or self._last_transform[0] != key:
+                if self._drawing_mode == IMAGE_MODE_FILL:
+                    if self.smooth_scaling and self._surface.get_bitsize() > 8:
+                        surf = pygame.transform.smoothscale(self._surface, (area.width, area.height))
+                    else:
+                        surf = pygame.transform.scale(self._surface, (area.width, area.height))
                 else:
-                    surf = pygame.transform.scale(self._surface, (area.width, area.height))
-                self._last_transform = (area.width, area.height, surf)
+                    surf = self._get_tiled_surface(area)
+                self._last_transform = (key, surf)
 
             surface.blit(
                 surf,
@@ -825,56 +1240,6 @@ class BaseImage(object):
                     offy + position[1]
                 ))
 
-        elif self._drawing_mode == IMAGE_MODE_REPEAT_X:
-
-            w = self._surface.get_width()
-            times = int(math.ceil(float(area.width) / w))
-            assert times > 0, \
-                'invalid size, width must be greater than zero'
-            for x in range(times):
-                surface.blit(
-                    self._surface,
-                    (
-                        x * w + offx + position[0],
-                        offy + position[1]
-                    ),
-                    area
-                )
-
-        elif self._drawing_mode == IMAGE_MODE_REPEAT_Y:
-
-            h = self._surface.get_height()
-            times = int(math.ceil(float(area.height) / h))
-            assert times > 0, \
-                'invalid size, height must be greater than zero'
-            for y in range(times):
-                surface.blit(
-                    self._surface,
-                    (
-                        0 + offx + position[0],
-                        y * h + offy + position[1]
-                    ),
-                    area
-                )
-
-        elif self._drawing_mode == IMAGE_MODE_REPEAT_XY:
-
-            w, h = self._surface.get_size()
-            timesx = int(math.ceil(float(area.width) / w))
-            timesy = int(math.ceil(float(area.height) / h))
-            assert timesx > 0 and timesy > 0, \
-                'invalid size, width and height must be greater than zero'
-            for x in range(timesx):
-                for y in range(timesy):
-                    surface.blit(
-                        self._surface,
-                        (
-                            x * w + offx + position[0],
-                            y * h + offy + position[1]
-                        ),
-                        area
-                    )
-
         elif self._drawing_mode == IMAGE_MODE_CENTER:
 
             sw, hw = area.width, area.height  # Window
@@ -40,7 +40,7 @@ import pygame.draw as pydraw
 import pygame.gfxdraw as gfxdraw
 
 import warnings
-from math import pi
+from math import ceil, floor, pi
 from pathlib import Path
 from uuid import uuid4
 
@@ -81,11 +81,15 @@ class Decorator(object):
     """
     _coord_cache: Dict[
         str, Tuple[int, int, Union[Tuple[Tuple2NumberType, ...], Tuple2NumberType]]]  # centerx, centery, coords
-    _cache_last_status: Dict[str, Tuple[int, int, int, int, int, int]]
+    _cache_layers: Dict[str, Optional[List[Tuple[Optional['pygame.Surface'], Tuple2IntType,
+                                                 Optional[Tuple[int, str, Any]]]]]]  # surface, offset, dynamic decor
     _cache_needs_update: Dict[str, bool]
-    _cache_surface: Dict[str, Optional['pygame.Surface']]
-    _decor: Dict[str, List[Tuple[int, str, Any]]]  # type, id, data
+    _callables: int
+    _decor: Dict[str, List[Optional[Tuple[int, str, Any]]]]  # type, id, data. None if removed
+    _decor_active: Dict[str, Optional[List[Tuple[int, str, Any]]]]
     _decor_enabled: Dict[str, bool]
+    _decor_removed: Dict[str, int]
+    _decor_slot: Dict[str, Tuple[str, int]]  # prev/post, index within _decor
     _obj: Union['Widget', 'ScrollArea', 'Menu']
     _post_enabled: bool
     _prev_enabled: bool
@@ -99,17 +103,29 @@ class Decorator(object):
         :type obj: :py:class:`pygame_menu.widgets.core.Widget`, :py:class:`pygame_menu.Menu`, :py:class:`pygame_menu.scrollarea.ScrollArea`
         """
         self._coord_cache = {}
-        self._decor = {DECOR_TYPE_PREV: [], DECOR_TYPE_POST: []}
         self._obj = obj
+
+        # Decorations are stored in the order they are drawn. Removed decorations
+        # leave an empty slot until half of the list is empty, so that the index
+        # of each decoration (used to find it from its ID) is kept
+        self._decor = {DECOR_TYPE_PREV: [], DECOR_TYPE_POST: []}
         self._decor_enabled = {}
+        self._decor_removed = {DECOR_TYPE_PREV: 0, DECOR_TYPE_POST: 0}
+        self._decor_slot = {}
+
+        # Enabled decorations to draw. None if it must be computed again
+        self._decor_active = {DECOR_TYPE_PREV: [], DECOR_TYPE_POST: []}
+        self._callables = 0
 
         self._prev_enabled = True
         self._post_enabled = True
 
         # If True, enables surface cache. This is intended to be used if there's many
-        # decorations in the object (for example, 400). This is an expensive method anyway
-        # because surface is called many times. See the following rendering times to guess
-        # how much does a decoration takes time to render 1000 times (object: button)
+        # decorations in the object (for example, 400). The static decorations are drawn
+        # into layers bounded to the decorations, which are moved with the object, while
+        # the dynamic decorations (callables) are drawn on each call between the layers.
+        # See the following rendering times to guess how much does a decoration takes
+        # time to render 1000 times (object: button)
         # 100 decoration, no cache:     0.214
         # 100 decoration, with cache:   0.646
         # 300 decoration, no cache:     0.581
@@ -120,10 +136,9 @@ class Decorator(object):
         # 10000 decoration, with cache: 0.599
         self.cache = False
 
-        # Previous (surf.width, surf.height, rect.x, rect.y, rect.centerx, rect.centery
-        self._cache_last_status = {DECOR_TYPE_PREV: (0, 0, 0, 0, 0, 0), DECOR_TYPE_POST: (0, 0, 0, 0, 0, 0)}
+        # Cached layers, see _draw_assemble_cache()
+        self._cache_layers = {DECOR_TYPE_PREV: None, DECOR_TYPE_POST: None}
         self._cache_needs_update = {DECOR_TYPE_PREV: False, DECOR_TYPE_POST: False}
-        self._cache_surface = {DECOR_TYPE_PREV: None, DECOR_TYPE_POST: None}
 
     def __copy__(self) -> 'Decorator':
         """
@@ -155,17 +170,24 @@ class Decorator(object):
 
         if prev:
             assert self._prev_enabled, 'prev decorators are not enabled'
-            self._decor[DECOR_TYPE_PREV].append((decortype, decor_id, data))
+            p = DECOR_TYPE_PREV
         else:
             assert self._post_enabled, 'post decorators are not enabled'
-            self._decor[DECOR_TYPE_POST].append((decortype, decor_id, data))
+            p = DECOR_TYPE_POST
+        decor = (decortype, decor_id, data)
+        self._decor_slot[decor_id] = (p, len(self._decor[p]))
+        self._decor[p].append(decor)
+        if self._decor_active[p] is not None:
+            self._decor_active[p].append(decor)
+        if decortype == DECORATION_CALLABLE or decortype == DECORATION_CALLABLE_NO_ARGS:
+            self._callables += 1
 
         # Force surface cache update
         if hasattr(self._obj, 'force_menu_surface_cache_update'):
             self._obj.force_menu_surface_cache_update()
 
         # Forces cache update
-        self._cache_needs_update[DECOR_TYPE_PREV if prev else DECOR_TYPE_POST] = True
+        self._cache_needs_update[p] = True
 
         # Check sizes
         if self._total_decor() >= 300 and not self.cache:
@@ -191,7 +213,29 @@ class Decorator(object):
 
         :return: None
         """
-        return len(self._decor[DECOR_TYPE_PREV]) + len(self._decor[DECOR_TYPE_POST])
+        return len(self._decor_slot)
+
+    def _has_callable(self) -> bool:
+        """
+        Return ``True`` if there is any callable decoration, whose drawing may
+        change on each call.
+
+        :return: Bool
+        """
+        return self._callables > 0
+
+    def _get_active(self, prev: str) -> List[Tuple[int, str, Any]]:
+        """
+        Return the enabled decorations, in drawing order.
+
+        :param prev: Mode
+        :return: Decoration list
+        """
+        active = self._decor_active[prev]
+        if active is None:
+            active = [d for d in self._decor[prev] if d is not None and self._decor_enabled[d[1]]]
+            self._decor_active[prev] = active
+        return active
 
     def force_cache_update(self, prev: Optional[bool] = None) -> 'Decorator':
         """
@@ -466,10 +510,9 @@ class Decorator(object):
 
         .. note::
 
-            If your callable function changes over time set ``decorator.cache=False``
-            or force cache manually by calling Decorator method
-            :py:class:`pygame_menu.decorator.Decorator.force_cache_update`. Also, the object
-            should force the menu surface cache to update.
+            Callables are not cached, they are called each time the object is drawn,
+            even if ``decorator.cache=True``. If the callable changes over time the
+            object should force the menu surface cache to update.
 
         :param fun: Function
         :param prev: If ``True`` draw previous the object, else draws post
@@ -568,7 +611,11 @@ class Decorator(object):
         """
         if decorid not in self._decor_enabled.keys():
             raise IndexError('decoration ID "{0}" was not found'.format(decorid))
-        self._decor_enabled[decorid] = False
+        if self._decor_enabled[decorid]:
+            self._decor_enabled[decorid] = False
+            p = self._decor_slot[decorid][0]
+            self._decor_active[p] = None
+            self._cache_needs_update[p] = True
         return self
 
     def enable(self, decorid: str) -> 'Decorator':
@@ -581,7 +628,11 @@ class Decorator(object):
         """
         if decorid not in self._decor_enabled.keys():
             raise IndexError('decoration ID "{0}" was not found'.format(decorid))
-        self._decor_enabled[decorid] = True
+        if not self._decor_enabled[decorid]:
+            self._decor_enabled[decorid] = True
+            p = self._decor_slot[decorid][0]
+            self._decor_active[p] = None
+            self._cache_needs_update[p] = True
         return self
 
     def remove(self, decorid: str) -> 'Decorator':
@@ -593,16 +644,27 @@ class Decorator(object):
         :return: Self reference
         """
         assert isinstance(decorid, str)
+        if decorid not in self._decor_slot.keys():
+            raise IndexError('decoration ID "{0}" was not found'.format(decorid))
         if decorid in self._coord_cache.keys():
             del self._coord_cache[decorid]
-        for p in (DECOR_TYPE_PREV, DECOR_TYPE_POST):
-            for d in self._decor[p]:
-                if d[1] == decorid:
-                    self._decor[p].remove(d)
-                    self._cache_needs_update[p] = True
-                    del self._decor_enabled[decorid]
-                    return self
-        raise IndexError('decoration ID "{0}" was not found'.format(decorid))
+        p, i = self._decor_slot.pop(decorid)
+        decor = self._decor[p][i]
+        self._decor[p][i] = None
+        self._decor_removed[p] += 1
+        if decor[0] == DECORATION_CALLABLE or decor[0] == DECORATION_CALLABLE_NO_ARGS:
+            self._callables -= 1
+        if self._decor_enabled.pop(decorid):
+            self._decor_active[p] = None
+        self._cache_needs_update[p] = True
+
+        # Compact the list if half of it is empty
+        if 2 * self._decor_removed[p] >= len(self._decor[p]):
+            self._decor[p] = [d for d in self._decor[p] if d is not None]
+            self._decor_removed[p] = 0
+            for i in range(len(self._decor[p])):
+                self._decor_slot[self._decor[p][i][1]] = (p, i)
+        return self
 
     def remove_all(self, prev: Optional[bool] = None) -> 'Decorator':
         """
@@ -617,13 +679,111 @@ class Decorator(object):
             return self
         p = DECOR_TYPE_PREV if prev else DECOR_TYPE_POST
         self._cache_needs_update[p] = False
-        del self._decor[p]
+        self._cache_layers[p] = None
+        for d in self._decor[p]:
+            if d is not None:
+                del self._decor_slot[d[1]]
+                del self._decor_enabled[d[1]]
+                if d[1] in self._coord_cache.keys():
+                    del self._coord_cache[d[1]]
+                if d[0] == DECORATION_CALLABLE or d[0] == DECORATION_CALLABLE_NO_ARGS:
+                    self._callables -= 1
         self._decor[p] = []
+        self._decor_active[p] = []
+        self._decor_removed[p] = 0
         return self
 
+    @staticmethod
+    def _is_dynamic(decor: Tuple[int, str, Any]) -> bool:
+        """
+        Return ``True`` if the decoration cannot be cached into a layer, because
+        it may change on each call (callables), or its drawing depends on the
+        absolute position within the surface (textured polygons, and the arcs drawn
+        without gfx).
+
+        :param decor: Decoration
+        :return: Bool
+        """
+        dtype = decor[0]
+        return dtype == DECORATION_CALLABLE or dtype == DECORATION_CALLABLE_NO_ARGS or \
+            dtype == DECORATION_TEXTURE_POLYGON or (dtype == DECORATION_ARC and not decor[2][6])
+
+    @staticmethod
+    def _get_decor_rect(decor: Tuple[int, str, Any]) -> Optional['pygame.Rect']:
+        """
+        Return the rect which bounds a static decoration, relative to the center
+        of the object.
+
+        :param decor: Decoration
+        :return: Rect, ``None`` if the decoration draws nothing
+        """
+        dtype, _, data = decor
+        points = data[0] if dtype != DECORATION_NONE else ()
+        margin = 0
+        if dtype == DECORATION_POLYGON:
+            margin = data[3]
+        elif dtype == DECORATION_CIRCLE or dtype == DECORATION_ARC or dtype == DECORATION_PIE:
+            x, y = points[0]
+            r = data[1]
+            points = ((x - r, y - r), (x + r, y + r))
+            if dtype != DECORATION_PIE:
+                margin = data[-2]
+        elif dtype == DECORATION_ELLIPSE:
+            (x, y), rx, ry = points[0], data[1], data[2]
+            points = ((x - rx, y - ry), (x + rx, y + ry))
+        elif dtype == DECORATION_SURFACE or dtype == DECORATION_BASEIMAGE or dtype == DECORATION_TEXT:
+            (x, y), w, h = points[0], data[1].get_width(), data[1].get_height()
+            if data[2]:  # Centered
+                x -= w / 2
+                y -= h / 2
+            points = ((x, y), (x + w, y + h))
+        elif dtype == DECORATION_RECT:
+            (x, y), drect, width = points[0], data[1], data[3]
+            points = ((x + drect.x, y + drect.y), (x + drect.right, y + drect.bottom))
+            margin = width
+        elif dtype == DECORATION_LINE:
+            margin = data[2]
+        if len(points) == 0:
+            return None
+
+        # Leave some room for the line widths and antialiasing
+        margin += 2
+        x1 = floor(min(p[0] for p in points)) - margin
+        y1 = floor(min(p[1] for p in points)) - margin
+        x2 = ceil(max(p[0] for p in points)) + margin
+        y2 = ceil(max(p[1] for p in points)) + margin
+        return pygame.Rect(x1, y1, x2 - x1 + 1, y2 - y1 + 1)
+
+    def _draw_layer(self, deco: List[Tuple[int, str, Any]]
+                    ) -> Tuple[Optional['pygame.Surface'], Tuple2IntType, None]:
+        """
+        Draw static decorations into a layer surface, bounded to the decorations.
+
+        :param deco: Decoration list
+        :return: Layer surface (``None`` if empty), its position relative to the object center, and no dynamic decoration
+        """
+        rects = []
+        for d in deco:
+            r = self._get_decor_rect(d)
+            if r is not None:
+                rects.append(r)
+        if len(rects) == 0:
+            return None, (0, 0), None
+        bounds = rects[0].unionall(rects[1:])
+        layer = make_surface(bounds.width, bounds.height)
+
+        # Draw as if the object center were placed at the layer position
+        center = pygame.Rect(0, 0, 0, 0)
+        center.center = (-bounds.x, -bounds.y)
+        self._draw(deco, layer, center)
+        return layer, (bounds.x, bounds.y), None
+
     def _draw_assemble_cache(self, prev: str, deco: List[Tuple[int, str, Any]], surface: 'pygame.Surface') -> None:
         """
-        Draw cache, assemble if needed.
+        Draw cache, assemble if needed. The consecutive static decorations are
+        drawn into a layer which is blitted relative to the object center, thus,
+        moving the object does not draw them again. Dynamic decorations are drawn
+        between the layers each call.
 
         :param prev: Mode
         :param deco: Decoration lists
@@ -633,25 +793,28 @@ class Decorator(object):
         if len(deco) == 0:
             return
 
-        w, h = surface.get_size()
-        rect = self._obj.get_rect()
-
-        # If needs update, or the surface size changed, or the rect position changed
-        prev_surf_changed = self._cache_last_status[prev][0] != w or self._cache_last_status[prev][1] != h
-        prev_rect_changed = self._cache_last_status[prev][2] != rect.x or \
-                            self._cache_last_status[prev][3] != rect.y or \
-                            self._cache_last_status[prev][4] != rect.width or \
-                            self._cache_last_status[prev][5] != rect.height
-
-        if self._cache_needs_update[prev] or prev_surf_changed or prev_rect_changed or \
-                self._cache_surface[prev] is None:
-            self._cache_last_status[prev] = (w, h, rect.x, rect.y, rect.width, rect.height)
-            del self._cache_surface[prev]
-            self._cache_surface[prev] = make_surface(surface.get_width(), surface.get_height())
-            self._draw(deco, self._cache_surface[prev])
+        if self._cache_needs_update[prev] or self._cache_layers[prev] is None:
+            layers = []
+            static = []
+            for d in deco:
+                if self._is_dynamic(d):
+                    if len(static) > 0:
+                        layers.append(self._draw_layer(static))
+                        static = []
+                    layers.append((None, (0, 0), d))
+                else:
+                    static.append(d)
+            if len(static) > 0:
+                layers.append(self._draw_layer(static))
+            self._cache_layers[prev] = layers
             self._cache_needs_update[prev] = False
 
-        surface.blit(self._cache_surface[prev], (0, 0))
+        rect = self._obj.get_rect()
+        for layer, pos, d in self._cache_layers[prev]:
+            if layer is not None:
+                surface.blit(layer, (rect.centerx + pos[0], rect.centery + pos[1]))
+            elif d is not None:
+                self._draw((d,), surface, rect)
 
     def draw_prev(self, surface: 'pygame.Surface') -> 'Decorator':
         """
@@ -661,9 +824,9 @@ class Decorator(object):
         :return: Self reference
         """
         if not self.cache:
-            self._draw(self._decor[DECOR_TYPE_PREV], surface)
+            self._draw(self._get_active(DECOR_TYPE_PREV), surface)
         else:
-            self._draw_assemble_cache(DECOR_TYPE_PREV, self._decor[DECOR_TYPE_PREV], surface)
+            self._draw_assemble_cache(DECOR_TYPE_PREV, self._get_active(DECOR_TYPE_PREV), surface)
         return self
 
     def draw_post(self, surface: 'pygame.Surface') -> 'Decorator':
@@ -674,28 +837,29 @@ class Decorator(object):
         :return: Self reference
         """
         if not self.cache:
-            self._draw(self._decor[DECOR_TYPE_POST], surface)
+            self._draw(self._get_active(DECOR_TYPE_POST), surface)
         else:
-            self._draw_assemble_cache(DECOR_TYPE_POST, self._decor[DECOR_TYPE_POST], surface)
+            self._draw_assemble_cache(DECOR_TYPE_POST, self._get_active(DECOR_TYPE_POST), surface)
         return self
 
     # noinspection PyArgumentList
-    def _draw(self, deco: List[Tuple[int, str, Any]], surface: 'pygame.Surface') -> None:
+    def _draw(self, deco: Union[List[Tuple[int, str, Any]], Tuple[Tuple[int, str, Any], ...]],
+              surface: 'pygame.Surface', rect: Optional['pygame.Rect'] = None) -> None:
         """
         Draw.
 
         :param deco: Decoration list
         :param surface: Pygame surface
+        :param rect: Rect of the object which positions the decorations. If ``None`` uses the object rect
         :return: None
         """
         if len(deco) == 0:
             return
-        rect = self._obj.get_rect()
+        if rect is None:
+            rect = self._obj.get_rect()
 
         for d in deco:
             dtype, decoid, data = d
-            if not self._decor_enabled[decoid]:
-                continue
 
             if dtype == DECORATION_POLYGON:
                 points, color, filled, width, gfx = data
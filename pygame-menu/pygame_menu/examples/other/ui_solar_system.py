@@ -288,6 +288,7 @@ class SolarSystemApp(object):
         for nebula in self.nebulas:
             nebula.set_drawing_position(pygame_menu.locals.POSITION_CENTER)
             nebula.checkpoint()  # Because rotation method works from checkpointed surface
+            nebula.set_transform_cache(angle_step=0.5)  # Each rotation is computed once
             nebula.set_attribute('delta_angle', 0.25 * random.randint(-1, 1) * random.random())
 
         # Add shooting stars
@@ -47,14 +47,19 @@ __all__ = [
     'FONT_EXAMPLES',
 
     # Font util
-    'get_font'
+    'get_font',
+    'get_font_cache',
+    'get_text_cache',
+    'render_text'
 
 ]
 
 import os.path as path
 import pygame.font as _font
 from pathlib import Path
-from typing import Union, Optional
+from typing import Union, Optional, Tuple
+
+from pygame_menu._cache import LRUCache, surface_bytes
 
 # Available fonts path
 __fonts_path__ = path.join(path.dirname(path.abspath(__file__)), 'resources', 'fonts', '{0}')
@@ -76,14 +81,24 @@ FONT_EXAMPLES = (FONT_8BIT, FONT_BEBAS, FONT_COMIC_NEUE, FONT_FRANCHISE, FONT_HE
                  FONT_MUNRO, FONT_NEVIS, FONT_OPEN_SANS, FONT_OPEN_SANS_BOLD, FONT_OPEN_SANS_ITALIC,
                  FONT_OPEN_SANS_LIGHT, FONT_PT_SERIF)
 
-# Stores font cache
-_cache = {}
+# Stores font cache, up to 64 fonts (name and size)
+_cache = LRUCache(max_items=64)
+
+# Stores the file of each font name
+_font_paths = {}
+
+# Rendered text surfaces shared by all the widgets, up to 16 MB
+_text_cache = LRUCache(max_size=16 * 1024 * 1024)
 
 
 def get_font(name: Union[str, '_font.Font', 'Path'], size: int) -> '_font.Font':
     """
     Return a :py:class:`pygame.font.Font` object from a name or file.
 
+    Fonts are cached by name and size, and the file of each name is cached too,
+    thus the filesystem and the system fonts are only checked the first time a
+    name is used.
+
     :param name: Font name or path
     :param size: Font size (px)
     :return: Font object
@@ -104,9 +119,15 @@ def get_font(name: Union[str, '_font.Font', 'Path'], size: int) -> '_font.Font':
         if size <= 0:
             raise ValueError('font size cannot be lower or equal than zero')
 
+        font = _cache.get((name, size))
+        if font is not None:
+            return font
+
+        font_name = name
+        name = _font_paths.get(font_name)
+
         # Font is not a file, then use a system font
-        if not path.isfile(name):
-            font_name = name
+        if name is None and not path.isfile(font_name):
             name = _font.match_font(font_name)
 
             if name is None:  # Show system available fonts
@@ -148,10 +169,11 @@ def get_font(name: Union[str, '_font.Font', 'Path'], size: int) -> '_font.Font':
                                                         sys_message,
                                                         sys_message_2))
 
+        elif name is None:
+            name = font_name
+        _font_paths[font_name] = name
+
         # Try to load the font
-        font = None
-        if (name, size) in _cache:
-            return _cache[(name, size)]
         try:
             font = _font.Font(name, size)
         except IOError:
@@ -160,5 +182,48 @@ def get_font(name: Union[str, '_font.Font', 'Path'], size: int) -> '_font.Font':
         # If font was not loaded throw an exception
         if font is None:
             raise IOError('font file "{0}" cannot be loaded'.format(font))
-        _cache[(name, size)] = font
-        return font
+        return _cache.put((font_name, size), font)
+
+
+def get_font_cache() -> 'LRUCache':
+    """
+    Return the cache of the fonts loaded by :py:func:`pygame_menu.font.get_font`.
+    Its stats are given by ``get_font_cache().get_stats()``, and the maximum
+    number of fonts can be changed through ``get_font_cache().max_items``.
+
+    :return: Font cache
+    """
+    return _cache
+
+
+def get_text_cache() -> 'LRUCache':
+    """
+    Return the cache of rendered text surfaces shared by all the widgets. Its
+    stats are given by ``get_text_cache().get_stats()``, and its memory limit
+    (bytes) can be changed through ``get_text_cache().max_size``.
+
+    :return: Text cache
+    """
+    return _text_cache
+
+
+def render_text(font: '_font.Font', text: str, antialias: bool, color: Tuple[int, ...],
+                background: Optional[Tuple[int, ...]] = None) -> 'pygame.Surface':
+    """
+    Render a text, or return the surface rendered before with the same font,
+    text, color, antialias and background. The surface is shared, thus, it must
+    not be modified.
+
+    :param font: Font object
+    :param text: Text to render
+    :param antialias: Antialias
+    :param color: Text color
+    :param background: Background color. If ``None`` the background is transparent
+    :return: Text surface
+    """
+    key = (font, font.get_bold(), font.get_italic(), font.get_underline(), text, antialias, color, background)
+    surface = _text_cache.get(key)
+    if surface is None:
+        surface = font.render(text, antialias, color, background)
+        _text_cache.put(key, surface, surface_bytes(surface))
+    return surface
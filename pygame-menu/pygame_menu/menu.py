@@ -42,7 +42,6 @@ import time
 import warnings
 
 import pygame
-import pygame.gfxdraw as gfxdraw
 import pygame_menu.baseimage as _baseimage
 import pygame_menu.controls as _controls
 import pygame_menu.events as _events
@@ -50,6 +49,8 @@ import pygame_menu.locals as _locals
 import pygame_menu.themes as _themes
 import pygame_menu.utils as _utils
 import pygame_menu.widgets as _widgets
+from pygame_menu._animation import AnimationClock, get_animation_clock
+from pygame_menu._profiler import MenuProfiler
 from pygame_menu.decorator import Decorator
 from pygame_menu.scrollarea import ScrollArea, get_scrollbars_from_position
 from pygame_menu.sound import Sound
@@ -126,15 +127,20 @@ class Menu(object):
     _attributes: Dict[str, Any]
     _auto_centering: bool
     _background_function: Tuple[bool, Optional[Union[Callable[['Menu'], Any], Callable[[], Any]]]]
+    _batch_depth: int
     _clock: 'pygame.time.Clock'
     _column_max_width: VectorType
     _column_min_width: VectorType
     _column_pos_x: List[NumberType]
     _column_widths: List[NumberType]
     _columns: int
+    _culling: bool
+    _culling_margin: int
+    _culling_rect: Optional['pygame.Rect']
     _current: 'Menu'
     _decorator: 'Decorator'
     _enabled: bool
+    _focus_overlay: Tuple[Optional[Tuple[Any, ...]], Optional['pygame.Surface']]
     _height: int
     _id: str
     _index: int
@@ -154,23 +160,30 @@ class Menu(object):
     _overflow: Tuple2BoolType
     _position: Tuple2IntType
     _prev: Optional[List[Union['Menu', List['Menu']]]]
+    _profiler: Optional['MenuProfiler']
+    _profiling: bool
     _runtime_errors: '_MenuRuntimeErrorConfig'
     _scroll: 'ScrollArea'
     _scrollarea_margin: List[int]
     _sound: 'Sound'
     _stats: '_MenuStats'
     _submenus: List['Menu']
+    _supermenus: List['Menu']
     _theme: '_themes.Theme'
     _top: 'Menu'
     _touchscreen: bool
     _touchscreen_motion_selection: bool
     _used_columns: int
     _widget_columns: Dict[int, List['_widgets.core.Widget']]
+    _widget_layout: Dict[int, List[Tuple[Any, ...]]]
+    _widget_layout_geometry: Optional[Tuple[Any, ...]]
     _widget_max_position: Tuple2IntType
     _widget_min_position: Tuple2IntType
     _widget_offset: List[int]
     _widget_surface_cache_enabled: bool
     _widget_surface_cache_need_update: bool
+    _widget_ids: Dict[str, '_widgets.core.Widget']
+    _widget_tree_ids: Optional[Dict[str, '_widgets.core.Widget']]
     _widgets: List['_widgets.core.Widget']
     _widgets_surface: Optional['pygame.Surface']
     _widgets_surface_last: Tuple[int, int, Optional['pygame.Surface']]
@@ -362,6 +375,7 @@ class Menu(object):
         self._attributes = {}
         self._auto_centering = center_content
         self._background_function = (False, None)  # Accept menu as argument, callable object
+        self._batch_depth = 0  # Number of open widget batches, rendering is deferred while > 0
         self._clock = pygame.time.Clock()
         self._decorator = Decorator(self)
         self._enabled = enabled  # Menu is enabled or not. If disabled menu can't update or draw
@@ -372,6 +386,7 @@ class Menu(object):
         self._sound = Sound()
         self._stats = _MenuStats()
         self._submenus = []
+        self._supermenus = []  # Menus which have this Menu as a submenu
         self._theme = theme
         self._width = int(width)
 
@@ -401,6 +416,8 @@ class Menu(object):
 
         # Menu widgets, it should not be accessed outside the object as strange issues can occur
         self._widgets = []
+        self._widget_ids = {}  # Widget by ID
+        self._widget_tree_ids = None  # Widget by ID within Menu and submenus, built on the first recursive lookup
         self._widget_offset = [theme.widget_offset[0], theme.widget_offset[1]]
 
         if abs(self._widget_offset[0]) < 1:
@@ -450,6 +467,8 @@ class Menu(object):
         self._rows = rows
         self._used_columns = 0  # Total columns used in widget positioning
         self._widget_columns = {}
+        self._widget_layout = {}  # Layout of each column from the last position update
+        self._widget_layout_geometry = None  # Offset and column positions of the last update
         self._widget_max_position = (0, 0)
         self._widget_min_position = (0, 0)
 
@@ -530,6 +549,26 @@ class Menu(object):
         self._widget_surface_cache_enabled = True
         self._widget_surface_cache_need_update = True
 
+        # Draw only the widgets near the visible area of the scroll
+        self._culling = False
+        self._culling_margin = 0
+        self._culling_rect = None  # Area of the widgets surface drawn on the last cache update
+
+        # Timings of the draw phases and widget classes, see set_profiling()
+        self._profiler = None
+        self._profiling = False
+
+        # Status of the last draw which returned the dirty rects
+        self._last_draw_state = None
+
+        # Focus background drawn last, and the (window size, focus rect, color) it was drawn for
+        self._focus_overlay = (None, None)
+
+        # Uniform grid of the widget rects in the world, used to find the widgets
+        # under the mouse or a finger. Built on the first hit test after the layout
+        self._widget_hit_cell = (1, 1)
+        self._widget_hit_index = None
+
         # Scrolling area
         menubar_height = self._menubar.get_height()
         if self._height - menubar_height <= 0:
@@ -834,6 +873,8 @@ class Menu(object):
                 raise ValueError(msg)
 
             self._submenus.append(action)
+            action._supermenus.append(self)
+            self._invalidate_widget_tree_ids()
             widget = _widgets.Button(title, button_id, self._open, action)
             widget.to_menu = True
 
@@ -1555,6 +1596,115 @@ class Menu(object):
 
         return widget
 
+    def add_virtual_list(self,
+                         length: Union[int, Callable[[], int]],
+                         render_item: Callable[[int], Union[str, 'pygame.Surface']],
+                         default: int = 0,
+                         onchange: CallbackType = None,
+                         onreturn: CallbackType = None,
+                         rows: int = 10,
+                         virtuallist_id: str = '',
+                         width: int = 300,
+                         **kwargs
+                         ) -> '_widgets.VirtualList':
+        """
+        Add a virtual list to the Menu: It shows ``rows`` items of a data source of
+        any length, rendering only the visible ones. Use it instead of adding one
+        widget per item for lists with thousands of items, such as score tables.
+
+        Each row is rendered by ``render_item``, which returns the text of the row
+        or a surface. If the selected item changes, ``onchange`` is fired; if the
+        user presses return, ``onreturn`` is fired:
+
+        .. code-block:: python
+
+            render_item(index) -> str or pygame.Surface
+            onchange(index, **kwargs)
+            onreturn(index, **kwargs)
+
+        kwargs (Optional)
+            - ``align``                     *(str)* - Widget `alignment <https://pygame-menu.readthedocs.io/en/latest/_source/create_menu.html#widgets-alignment>`_
+            - ``background_color``          *(tuple, list,* :py:class:`pygame_menu.baseimage.BaseImage`) - Color of the background
+            - ``background_inflate``        *(tuple, list)* - Inflate background in *(x, y)* in px
+            - ``border_color``              *(tuple, list)* - Widget border color
+            - ``border_inflate``            *(tuple, list)* - Widget border inflate in *(x, y)* in px
+            - ``border_width``              *(int)* - Border width in px. If ``0`` disables the border
+            - ``font_background_color``     *(tuple, list, None)* - Widget font background color
+            - ``font_color``                *(tuple, list)* - Widget font color
+            - ``font_name``                 *(str, Path)* - Widget font path
+            - ``font_size``                 *(int)* - Font size of the widget
+            - ``margin``                    *(tuple, list)* - Widget *(left, bottom)* margin in px
+            - ``padding``                   *(int, float, tuple, list)* - Widget padding according to CSS rules. General shape: *(top, right, bottom, left)*
+            - ``readonly_color``            *(tuple, list)* - Color of the widget if readonly mode
+            - ``readonly_selected_color``   *(tuple, list)* - Color of the widget if readonly mode and is selected
+            - ``row_color``                 *(tuple, list, None)* - Background color of the rows
+            - ``row_height``                *(int, None)* - Height of each row in px. If ``None`` uses the font line height
+            - ``row_selected_color``        *(tuple, list)* - Background color of the selected row
+            - ``scrollbar_color``           *(tuple, list)* - Color of the scrollbar
+            - ``scrollbar_thickness``       *(int)* - Thickness of the scrollbar in px
+            - ``selection_color``           *(tuple, list)* - Color of the selected widget; only affects the font color
+            - ``selection_effect``          (:py:class:`pygame_menu.widgets.core.Selection`) - Widget selection effect
+            - ``shadow``                    *(bool)* - Text shadow is enabled or disabled
+            - ``shadow_color``              *(tuple, list)* - Text shadow color
+            - ``shadow_position``           *(str)* - Text shadow position, see locals for position
+            - ``shadow_offset``             *(int, float)* - Text shadow offset
+
+        .. note::
+
+            All theme-related optional kwargs use the default Menu theme if not defined.
+
+        .. note::
+
+            This is applied only to the base Menu (not the currently displayed,
+            stored in ``_current`` pointer); for such behaviour apply
+            to :py:meth:`pygame_menu.Menu.get_current` object.
+
+        .. warning::
+
+            Be careful with kwargs collision. Consider that all optional documented
+            kwargs keys are removed from the object.
+
+        :param length: Number of items, or function returning the number of items
+        :param render_item: Function that renders the item of the given index
+        :param default: Index of the default selected item
+        :param onchange: Callback executed when changing the selected item
+        :param onreturn: Callback executed when pressing return on the selected item
+        :param rows: Number of visible rows
+        :param virtuallist_id: Widget ID
+        :param width: Width of the list (px)
+        :return: :py:class:`pygame_menu.widgets.VirtualList`
+        """
+        # Filter widget attributes to avoid passing them to the callbacks
+        attributes = self._filter_widget_attributes(kwargs)
+
+        row_color = kwargs.pop('row_color', None)
+        row_height = kwargs.pop('row_height', None)
+        row_selected_color = kwargs.pop('row_selected_color', (255, 255, 255, 60))
+        scrollbar_color = kwargs.pop('scrollbar_color', (120, 120, 120))
+        scrollbar_thickness = kwargs.pop('scrollbar_thickness', 6)
+
+        widget = _widgets.VirtualList(
+            default=default,
+            length=length,
+            onchange=onchange,
+            onreturn=onreturn,
+            render_item=render_item,
+            row_color=row_color,
+            row_height=row_height,
+            row_selected_color=row_selected_color,
+            rows=rows,
+            scrollbar_color=scrollbar_color,
+            scrollbar_thickness=scrollbar_thickness,
+            virtuallist_id=virtuallist_id,
+            width=width,
+            **kwargs
+        )
+        self._configure_widget(widget=widget, **attributes)
+        self._append_widget(widget)
+        self._stats.add_virtual_list += 1
+
+        return widget
+
     def add_vertical_margin(self,
                             margin: NumberType,
                             margin_id: str = ''
@@ -1831,6 +1981,32 @@ class Menu(object):
             position=kwargs['shadow_position']
         )
 
+    def batch(self) -> '_MenuBatch':
+        """
+        Return a context manager which defers the Menu layout and rendering until
+        it exits. Use it to add or remove many widgets at once; otherwise, each
+        addition positions every widget and builds the widgets surface again.
+
+        .. code-block:: python
+
+            with menu.batch():
+                for score in scores:
+                    menu.add_label(score)
+
+        Batches can be nested, the Menu is rendered when the outermost exits, even
+        if an exception was raised within. The Menu should not be drawn or updated
+        inside a batch.
+
+        .. note::
+
+            This is applied only to the base Menu (not the currently displayed,
+            stored in ``_current`` pointer); for such behaviour apply
+            to :py:meth:`pygame_menu.Menu.get_current` object.
+
+        :return: Batch context manager
+        """
+        return _MenuBatch(self)
+
     def _append_widget(self, widget: '_widgets.core.Widget') -> None:
         """
         Add a widget to the list of widgets.
@@ -1841,6 +2017,8 @@ class Menu(object):
         assert isinstance(widget, _widgets.core.Widget)
         assert widget.get_menu() == self, 'widget cannot have a different instance of menu'
         self._widgets.append(widget)
+        self._widget_ids[widget.get_id()] = widget
+        self._invalidate_widget_tree_ids()
         if self._index < 0 and widget.is_selectable:
             widget.select()
             self._index = len(self._widgets) - 1
@@ -1896,6 +2074,9 @@ class Menu(object):
             raise ValueError('widget is not in Menu, check if exists on the current '
                              'with menu.get_current().remove_widget(widget)')
         self._widgets.pop(index)
+        if self._widget_ids.get(widget.get_id()) is widget:
+            del self._widget_ids[widget.get_id()]
+            self._invalidate_widget_tree_ids()
         self._update_after_remove_or_hidden(index)
         self._stats.removed_widgets += 1
         widget.set_menu(None)  # Removes Menu reference from widget
@@ -1937,7 +2118,8 @@ class Menu(object):
                 self._select(self._index - 1)
             else:
                 self._select(self._index)
-        self._update_widget_position()
+        if self._batch_depth == 0:
+            self._update_widget_position()
         if update_surface:
             self._widgets_surface = None  # If added on execution time forces the update of the surface
 
@@ -1973,6 +2155,8 @@ class Menu(object):
 
         :return: None
         """
+        self._widget_hit_index = None
+
         # Store widget rects
         widget_rects = {}
         for widget in self._widgets:
@@ -1997,6 +2181,7 @@ class Menu(object):
             # If not visible, continue to the next widget
             if not widget.is_visible():
                 widget.set_col_row_index(-1, -1, index)
+                widget.set_position(0, 0)
                 continue
 
             # Check if the maximum number of elements was reached, if so raise an exception
@@ -2132,87 +2317,214 @@ class Menu(object):
         # Update title position
         self._menubar.set_position(self._position[0], self._position[1])
 
-        # Widget max/min position
-        min_max_updated = False
-        max_x, max_y = -1e8, -1e8
-        min_x, min_y = 1e8, 1e8
-
-        # Update appended widgets
-        for index in range(len(self._widgets)):
-            widget = self._widgets[index]
-            rect = widget_rects[widget.get_id()]
-            selection_effect = widget.get_selection_effect()
-
-            if not widget.is_visible():
-                widget.set_position(0, 0)
-                continue
+        # Update appended widgets. The Y position of a widget is the sum of the heights
+        # of the previous rows of its column, so each column is walked once keeping a
+        # running sum. The layout of the previous update is kept per column; widgets
+        # before the first one whose size, visibility or row changed are not moved
+        geometry = (tuple(self._widget_offset), tuple(self._column_pos_x), tuple(self._column_widths))
+        if geometry != self._widget_layout_geometry:
+            self._widget_layout = {}
+        self._widget_layout_geometry = geometry
+
+        bounds = []
+        for col in self._widget_columns.keys():
+            prev_layout = self._widget_layout.get(col, [])
+            layout = []
+
+            # Find the first widget of the column which has to be placed again
+            for widget in self._widget_columns[col]:
+                k = len(layout)
+                if k == len(prev_layout):
+                    break
+                entry = prev_layout[k]
+                if entry[0] is not widget or entry[1] != self._widget_layout_key(widget, widget_rects) or \
+                        entry[2] != widget.get_position():
+                    break
+                layout.append(entry)
 
-            # Get column and row position
-            col, row, _ = widget.get_col_row_index()
-
-            # Calculate X position
-            column_width = self._column_widths[col]
-            selection_margin = 0
-            align = widget.get_alignment()
-            if align == _locals.ALIGN_CENTER:
-                dx = -widget.get_width() / 2
-            elif align == _locals.ALIGN_LEFT:
-                selection_margin = selection_effect.get_margin()[1]  # left
-                dx = -column_width / 2 + selection_margin
-            elif align == _locals.ALIGN_RIGHT:
-                selection_margin = selection_effect.get_margin()[3]  # right
-                dx = column_width / 2 - rect.width - selection_margin
+            # Resume the running sums from the last widget that kept its position
+            if len(layout) > 0:
+                _, _, _, last_row, row_ysum, ysum_next, col_bounds = layout[-1]
             else:
-                dx = 0
-            x_coord = self._column_pos_x[col] + dx + widget.get_margin()[0] + widget.get_padding()[3]
-            x_coord = max(selection_margin, x_coord)
-            x_coord += max(0, self._widget_offset[0])
-
-            # Calculate Y position
-            ysum = 1  # Compute the total height from the current row position to the top of the column
-            for rwidget in self._widget_columns[col]:
-                _, r, _ = rwidget.get_col_row_index()
-                if r >= row:
-                    break
-                if rwidget.is_visible() and not rwidget.is_floating():
-                    ysum += widget_rects[rwidget.get_id()].height  # Height
-                    ysum += rwidget.get_margin()[1]  # Vertical margin (bottom)
+                last_row, row_ysum, ysum_next, col_bounds = -1, 1, 1, None
+
+            for widget in self._widget_columns[col][len(layout):]:
+                rect = widget_rects[widget.get_id()]
+                selection_effect = widget.get_selection_effect()
+                padding = widget.get_padding()
+
+                # Get column and row position
+                _, row, _ = widget.get_col_row_index()
+
+                # Calculate X position
+                column_width = self._column_widths[col]
+                selection_margin = 0
+                align = widget.get_alignment()
+                if align == _locals.ALIGN_CENTER:
+                    dx = -widget.get_width() / 2
+                elif align == _locals.ALIGN_LEFT:
+                    selection_margin = selection_effect.get_margin()[1]  # left
+                    dx = -column_width / 2 + selection_margin
+                elif align == _locals.ALIGN_RIGHT:
+                    selection_margin = selection_effect.get_margin()[3]  # right
+                    dx = column_width / 2 - rect.width - selection_margin
+                else:
+                    dx = 0
+                x_coord = self._column_pos_x[col] + dx + widget.get_margin()[0] + padding[3]
+                x_coord = max(selection_margin, x_coord)
+                x_coord += max(0, self._widget_offset[0])
+
+                # Calculate Y position. ysum is the total height from the current row
+                # position to the top of the column. Floating widgets share the row
+                # of the previous widget, thus, also its height sum
+                if row != last_row:
+                    row_ysum = ysum_next
+                    last_row = row
+                ysum = row_ysum
+
+                # If the widget offset is zero, then add the selection effect to the height
+                # of the widget to avoid visual glitches
+                yselh = selection_effect.get_margin()[0]
+                if ysum == 1 and self._widget_offset[1] <= yselh:  # No widget is before
+                    if widget.is_selectable:  # Add top margin
+                        ysum += yselh - self._widget_offset[1]
+
+                y_coord = max(0, self._widget_offset[1]) + ysum + padding[0]
+
+                # Update the position of the widget
+                widget.set_position(int(x_coord), int(y_coord))
+
+                # Add the widget height to the next rows
+                if not widget.is_floating():
+                    ysum_next += rect.height  # Height
+                    ysum_next += widget.get_margin()[1]  # Vertical margin (bottom)
 
                     # If no widget is before add the selection effect
-                    yselh = rwidget.get_selection_effect().get_margin()[0]
-                    if r == 0 and self._widget_offset[1] <= yselh:
-                        if rwidget.is_selectable:
-                            ysum += yselh - self._widget_offset[1]
-
-            # If the widget offset is zero, then add the selection effect to the height
-            # of the widget to avoid visual glitches
-            yselh = widget.get_selection_effect().get_margin()[0]
-            if ysum == 1 and self._widget_offset[1] <= yselh:  # No widget is before
-                if widget.is_selectable:  # Add top margin
-                    ysum += yselh - self._widget_offset[1]
-
-            y_coord = max(0, self._widget_offset[1]) + ysum + widget.get_padding()[0]
-
-            # Update the position of the widget
-            widget.set_position(int(x_coord), int(y_coord))
-
-            # Update max/min position, minus padding
-            min_max_updated = True
-            max_x = max(max_x, x_coord + rect.width - widget.get_padding()[1])  # minus right padding
-            max_y = max(max_y, y_coord + rect.height - widget.get_padding()[2])  # minus bottom padding
-            min_x = min(min_x, x_coord - widget.get_padding()[3])
-            min_y = min(min_y, y_coord - widget.get_padding()[0])
+                    if row == 0 and self._widget_offset[1] <= yselh:
+                        if widget.is_selectable:
+                            ysum_next += yselh - self._widget_offset[1]
+
+                # Update max/min position, minus padding
+                widget_bounds = (
+                    x_coord + rect.width - padding[1],  # minus right padding
+                    y_coord + rect.height - padding[2],  # minus bottom padding
+                    x_coord - padding[3],
+                    y_coord - padding[0]
+                )
+                if col_bounds is None:
+                    col_bounds = widget_bounds
+                else:
+                    col_bounds = (
+                        max(col_bounds[0], widget_bounds[0]),
+                        max(col_bounds[1], widget_bounds[1]),
+                        min(col_bounds[2], widget_bounds[2]),
+                        min(col_bounds[3], widget_bounds[3])
+                    )
+
+                layout.append((widget, self._widget_layout_key(widget, widget_rects), widget.get_position(),
+                               last_row, row_ysum, ysum_next, col_bounds))
+                self._stats.position_update_widgets += 1
+
+            self._widget_layout[col] = layout
+            if col_bounds is not None:
+                bounds.append(col_bounds)
 
         # Update position
-        if min_max_updated:
-            self._widget_max_position = (max_x, max_y)
-            self._widget_min_position = (min_x, min_y)
+        if len(bounds) > 0:
+            self._widget_max_position = (max(b[0] for b in bounds), max(b[1] for b in bounds))
+            self._widget_min_position = (min(b[2] for b in bounds), min(b[3] for b in bounds))
         else:
             self._widget_max_position = (0, 0)
             self._widget_min_position = (0, 0)
 
         self._stats.position_update += 1
 
+    @staticmethod
+    def _widget_layout_key(widget: '_widgets.core.Widget', widget_rects: Dict[str, 'pygame.Rect']) -> Tuple[Any, ...]:
+        """
+        Return the values which determine the position of the widget within its column.
+        If none of them change the widget does not need to be moved.
+
+        :param widget: Widget
+        :param widget_rects: Widget rects by ID
+        :return: Layout key
+        """
+        rect = widget_rects[widget.get_id()]
+        # noinspection PyProtectedMember
+        return (
+            widget.get_col_row_index()[1],
+            rect.width,
+            rect.height,
+            widget.get_alignment(),
+            widget.get_margin(),
+            widget.get_padding(),
+            widget.get_selection_effect().get_margin(),
+            widget.is_floating(),
+            widget.is_selectable,
+            widget._translate,
+            widget.lock_position
+        )
+
+    def _build_widget_hit_index(self) -> None:
+        """
+        Build the grid of widget rects used by hit tests. Each cell stores the
+        indices of the widgets overlapping it, in increasing order. The cell size
+        is the average size of the widgets, thus each cell holds a few widgets.
+
+        :return: None
+        """
+        rects = []
+        for index in range(len(self._widgets)):
+            widget = self._widgets[index]
+            if not widget.is_visible():
+                continue
+            rect = widget.get_rect()
+            if rect.width > 0 and rect.height > 0:
+                rects.append((index, rect))
+
+        cell_w, cell_h = 1, 1
+        if len(rects) > 0:
+            cell_w = max(1, int(sum(r[1].width for r in rects) / len(rects)))
+            cell_h = max(1, int(sum(r[1].height for r in rects) / len(rects)))
+
+        grid = {}
+        for index, rect in rects:
+            for cx in range(rect.left // cell_w, (rect.right - 1) // cell_w + 1):
+                for cy in range(rect.top // cell_h, (rect.bottom - 1) // cell_h + 1):
+                    cell = grid.get((cx, cy))
+                    if cell is None:
+                        grid[(cx, cy)] = [(index, rect)]
+                    else:
+                        cell.append((index, rect))
+
+        self._widget_hit_cell = (cell_w, cell_h)
+        self._widget_hit_index = grid
+        self._stats.hit_index_build += 1
+
+    def _get_widgets_at(self, event: 'pygame.event.Event') -> List[int]:
+        """
+        Return the indices of the selectable and visible widgets under the
+        position of a mouse or touchscreen event, in increasing order.
+
+        :param event: Pygame event
+        :return: Widget indices
+        """
+        self._render()  # Update the layout if needed
+        if self._widget_hit_index is None:
+            self._build_widget_hit_index()
+        if event.type in (pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION):
+            pos = (event.x * self._window_size[0], event.y * self._window_size[1])
+        else:
+            pos = event.pos
+        x, y = self._scroll.to_world_position(pos)
+        cell = self._widget_hit_index.get((x // self._widget_hit_cell[0], y // self._widget_hit_cell[1]), ())
+        indices = []
+        for index, rect in cell:
+            widget = self._widgets[index]
+            if widget.is_selectable and widget.is_visible() and rect.collidepoint(x, y):
+                indices.append(index)
+        return indices
+
     def _build_widget_surface(self) -> None:
         """
         Create the surface used to draw widgets according the required width and height.
@@ -2294,9 +2606,52 @@ class Menu(object):
         :return: None
         """
         assert isinstance(widget_id, str)
-        for widget in self._widgets:
-            if widget.get_id() == widget_id:
-                raise IndexError('widget ID="{0}" already exists on the current menu'.format(widget_id))
+        if widget_id in self._widget_ids:
+            raise IndexError('widget ID="{0}" already exists on the current menu'.format(widget_id))
+
+    def _update_widget_id(self, widget: '_widgets.core.Widget', old_id: str) -> None:
+        """
+        Update the widget ID index after the ID of a widget has changed.
+
+        :param widget: Widget
+        :param old_id: Previous widget ID
+        :return: None
+        """
+        if self._widget_ids.get(old_id) is not widget:  # Widget is not appended yet
+            return
+        del self._widget_ids[old_id]
+        self._widget_ids[widget.get_id()] = widget
+        self._invalidate_widget_tree_ids()
+
+    def _invalidate_widget_tree_ids(self) -> None:
+        """
+        Discard the widget ID index of the Menu and submenus, for the Menu and
+        every Menu which contains it as a submenu.
+
+        :return: None
+        """
+        menus = [self]
+        while len(menus) > 0:
+            menu = menus.pop()
+            # If the index of a Menu is not built, neither are the indices of the Menus above it
+            if menu._widget_tree_ids is not None:
+                menu._widget_tree_ids = None
+                menus.extend(menu._supermenus)
+
+    def _get_widget_tree_ids(self) -> Dict[str, '_widgets.core.Widget']:
+        """
+        Return the widget ID index of the Menu and all submenus. Widgets of the
+        Menu take precedence, then the submenus in order.
+
+        :return: Widget by ID
+        """
+        if self._widget_tree_ids is None:
+            tree_ids = {}
+            for menu in reversed(self._submenus):
+                tree_ids.update(menu._get_widget_tree_ids())
+            tree_ids.update(self._widget_ids)
+            self._widget_tree_ids = tree_ids
+        return self._widget_tree_ids
 
     def _close(self) -> bool:
         """
@@ -2542,6 +2897,9 @@ class Menu(object):
 
         :return: ``True`` if the surface has changed (if it was None)
         """
+        if self._batch_depth > 0:  # Deferred until the batch exits
+            return False
+
         t0 = time.time()
         changed = False
 
@@ -2559,10 +2917,29 @@ class Menu(object):
         self._stats.total_rendering_time += time.time() - t0
         return changed
 
-    def draw(self, surface: 'pygame.Surface', clear_surface: bool = False) -> 'Menu':
+    def draw(self,
+             surface: 'pygame.Surface',
+             clear_surface: bool = False,
+             dirty_rects: bool = False
+             ) -> Union['Menu', List['pygame.Rect']]:
         """
         Draw the **current** Menu into the given surface.
 
+        If ``dirty_rects`` is ``True``, the areas of the surface which changed
+        since the previous call are returned instead of the Menu: the scroll area,
+        the menubar, the selected widget and the focus regions. These can be passed
+        to ``pygame.display.update``, thus, if the Menu is static, nothing has to
+        be presented:
+
+        .. code-block:: python
+
+            rects = menu.draw(surface, dirty_rects=True)
+            pygame.display.update(rects)
+
+        If the surface changes, the current Menu changes, there's a background
+        function, or the Menu decorator has a callable decoration, the whole surface
+        is returned.
+
         .. warning::
 
             This method should not be used along :py:meth:`pygame_menu.Menu.get_current`,
@@ -2570,19 +2947,30 @@ class Menu(object):
 
         :param surface: Pygame surface to draw the Menu
         :param clear_surface: Clear surface using theme default color
-        :return: Self reference **(curent)**
+        :param dirty_rects: If ``True`` return the list of changed areas of the surface
+        :return: Self reference **(curent)**, or the list of changed rects if ``dirty_rects``
         """
         assert isinstance(surface, pygame.Surface)
         assert isinstance(clear_surface, bool)
+        assert isinstance(dirty_rects, bool)
 
         if not self.is_enabled():
             self._current._runtime_errors.throw(self._current._runtime_errors.draw, 'menu is not enabled')
-            return self._current
+            return [] if dirty_rects else self._current
         if self._current.disable_draw:
-            return self._current
+            return [] if dirty_rects else self._current
+
+        # Advance the time read by the animations
+        get_animation_clock().tick()
+
+        profiler = self._profiler if self._profiling else None
+        if profiler is not None:
+            t0 = t = profiler.begin()
 
         # Render menu
         render = self._current._render()  # If True, the surface widget has changed, thus cache should change if enabled
+        if profiler is not None:
+            t = profiler.phase('layout', t)
 
         # Updates title
         if self._current._theme.title_updates_pygame_display and \
@@ -2600,23 +2988,45 @@ class Menu(object):
             else:
                 self._top._background_function[1]()
 
+        if profiler is not None:
+            t = profiler.phase('background', t)
+
         # Draw the prev decorator
         self._current._decorator.draw_prev(surface)
+        if profiler is not None:
+            t = profiler.phase('decorator', t)
 
         # print('value', self._current.get_title(), self._current._widget_surface_cache_need_update, id(self._current._widget_surface_cache_need_update))
         # print(self._current._scroll.get_decorator()._decor)
 
+        # If the visible area was scrolled out of the widgets drawn by culling, draw them again
+        cull_rect = None
+        if self._current._culling:
+            view_rect = self._current._get_scroll_view_world_rect()
+            if self._current._culling_rect is None or not self._current._culling_rect.contains(view_rect):
+                self._current._widget_surface_cache_need_update = True
+            margin = self._current._culling_margin
+            cull_rect = view_rect.inflate(2 * margin, 2 * margin)
+
         # Draw widgets, update cache if enabled
+        widgets_drawn = False
         if not self._current._widget_surface_cache_enabled or \
                 (render or self._current._widget_surface_cache_need_update):
+            widgets_drawn = True
 
             # This should be update before drawing widgets. As widget
             # draw may trigger surface cache updating. Don't move this
             # line or unexpected errors may occur
             self._current._widget_surface_cache_need_update = False
 
-            # Fill the scrolling surface (clear previous state)
-            self._current._widgets_surface.fill((255, 255, 255, 0))
+            # Fill the scrolling surface (clear previous state). If culling, clear
+            # only the area drawn before and restrict the drawing to the new area
+            if cull_rect is not None and self._current._culling_rect is not None:
+                self._current._widgets_surface.fill((255, 255, 255, 0), self._current._culling_rect)
+                self._current._widgets_surface.set_clip(cull_rect)
+                self._current._widgets_surface.fill((255, 255, 255, 0))
+            else:
+                self._current._widgets_surface.fill((255, 255, 255, 0))
 
             # Call scrollarea draw decorator. This must be done before filling the
             # surface
@@ -2625,24 +3035,147 @@ class Menu(object):
             scrollarea_decorator.draw_prev(self._current._widgets_surface)
 
             # Iterate through widgets and draw them
+            self._current._culling_rect = cull_rect
             for widget in self._current._widgets:
                 if not widget.is_visible():
                     continue
+                if cull_rect is not None and not cull_rect.colliderect(widget.get_rect()):
+                    self._current._stats.draw_culled_widgets += 1
+                    continue
+                if profiler is not None:
+                    tw = time.perf_counter()
                 widget.draw(self._current._widgets_surface)
                 if widget.is_selected():
                     widget.draw_selection(self._current._widgets_surface)
+                if profiler is not None:
+                    profiler.widget(widget.__class__.__name__, tw)
+            self._current._widgets_surface.set_clip(None)
 
             self._current._stats.draw_update_cached += 1
 
+        if profiler is not None:
+            t = profiler.phase('widgets', t)
+
         self._current._scroll.draw(surface)
+        if profiler is not None:
+            t = profiler.phase('scroll', t)
         self._current._menubar.draw(surface)
+        if profiler is not None:
+            t = profiler.phase('menubar', t)
 
         # Draw focus on selected if the widget is active
-        self._current._draw_focus_widget(surface, self._current.get_selected_widget())
+        focus = self._current._draw_focus_widget(surface, self._current.get_selected_widget())
+        if profiler is not None:
+            t = profiler.phase('focus', t)
         self._current._decorator.draw_post(surface)
+        if profiler is not None:
+            profiler.phase('decorator', t)
+            profiler.end('draw', t0)
         self._current._stats.draw += 1
+
+        if dirty_rects:
+            return self._get_dirty_rects(surface, widgets_drawn, focus)
+        self._last_draw_state = None
         return self._current
 
+    def _get_dirty_rects(self,
+                         surface: 'pygame.Surface',
+                         widgets_drawn: bool,
+                         focus: Optional[Dict[int, Tuple4Tuple2IntType]]
+                         ) -> List['pygame.Rect']:
+        """
+        Return the areas of the surface which changed since the previous draw of
+        the **current** Menu, and store the status of this draw.
+
+        :param surface: Pygame surface the Menu was drawn into
+        :param widgets_drawn: If ``True`` the widgets surface was drawn again
+        :param focus: Focus regions drawn
+        :return: List of rects
+        """
+        current = self._current
+        selected = current.get_selected_widget()
+        selected_rect = None
+        if selected is not None and selected.is_visible():
+            selected_rect = current._scroll.to_real_position(
+                selected.get_selection_effect().inflate(selected.get_rect()), visible=True)
+        focus_rects = []
+        if focus is not None:
+            for area in focus.values():
+                x, y = zip(*area)
+                focus_rects.append(pygame.Rect(min(x), min(y), max(x) - min(x) + 1, max(y) - min(y) + 1))
+
+        # noinspection PyProtectedMember
+        state = (
+            surface,
+            surface.get_size(),
+            current,
+            current._get_scrollarea_rect(),
+            current._scroll.get_offsets(),
+            tuple(sbar._last_render_hash for sbar in current._scroll._scrollbars),
+            current._menubar._last_render_hash,
+            current._get_menubar_rect(),
+            selected,
+            selected_rect,
+            focus_rects
+        )
+        prev = self._last_draw_state
+        self._last_draw_state = state
+
+        # noinspection PyProtectedMember
+        if prev is None or prev[0] is not surface or prev[1] != state[1] or prev[2] is not current or \
+                self._top._background_function[1] is not None or current._decorator._has_callable():
+            current._stats.draw_dirty_rects += 1
+            return [surface.get_rect()]
+
+        rects = []
+        if widgets_drawn or prev[3:6] != state[3:6]:
+            rects.append(state[3])
+            if prev[3] != state[3]:
+                rects.append(prev[3])
+        if prev[6:8] != state[6:8]:
+            rects.append(state[7])
+            rects.append(prev[7])
+        if prev[8] is not selected or prev[9] != selected_rect:
+            for rect in (prev[9], selected_rect):
+                if rect is not None:
+                    rects.append(rect)
+        if prev[10] != focus_rects:
+            rects += prev[10] + focus_rects
+        current._stats.draw_dirty_rects += len(rects)
+        return rects
+
+    def _get_scrollarea_rect(self) -> 'pygame.Rect':
+        """
+        Return the area of the surface the scrollarea is drawn into, including
+        its background and scrollbars.
+
+        :return: Rect
+        """
+        # noinspection PyProtectedMember
+        ex, ey = self._scroll._extend_x, self._scroll._extend_y
+        rect = self._scroll.get_rect()
+        rect = pygame.Rect(rect.x - ex, rect.y - ey, rect.width + ex, rect.height + ey)
+        # noinspection PyProtectedMember
+        for sbar in self._scroll._scrollbars:
+            if sbar.is_visible():
+                rect.union_ip(sbar.get_rect())
+        return rect
+
+    def _get_menubar_rect(self) -> 'pygame.Rect':
+        """
+        Return the area of the surface the menubar is drawn into.
+
+        :return: Rect
+        """
+        rect = self._menubar.get_rect()
+        # noinspection PyProtectedMember
+        polygon = self._menubar._polygon_pos
+        if polygon is not None and len(polygon) > 2:
+            x, y = zip(*polygon)
+            rect.union_ip(pygame.Rect(int(min(x)), int(min(y)),
+                                      int(max(x) - min(x)) + 2, int(max(y) - min(y)) + 2))
+        return rect
+
     def _draw_focus_widget(self, surface: 'pygame.Surface', widget: Optional['_widgets.core.Widget']
                            ) -> Optional[Dict[int, Tuple4Tuple2IntType]]:
         """
@@ -2704,8 +3237,19 @@ class Menu(object):
             coords[3] = (x2, y1), (window_width, y1), (window_width, y2 - 1), (x2, y2 - 1)
             coords[4] = (0, y2), (window_width, y2), (window_width, window_height), (0, window_height)
 
-        for area in coords:
-            gfxdraw.filled_polygon(surface, coords[area], self._theme.focus_background_color)
+        # The areas are composed into a surface, which is kept while the focused
+        # rect does not change
+        color = self._theme.focus_background_color
+        key = (window_width, window_height, x1, y1, x2, y2, tuple(color))
+        if self._focus_overlay[0] != key:
+            overlay = _utils.make_surface(window_width, window_height)
+            for area in coords.values():
+                xmin = min(p[0] for p in area)
+                ymin = min(p[1] for p in area)
+                overlay.fill(color, (xmin, ymin, max(p[0] for p in area) - xmin + 1,
+                                     max(p[1] for p in area) - ymin + 1))
+            self._focus_overlay = (key, overlay)
+        surface.blit(self._focus_overlay[1], (0, 0))
         return coords
 
     def enable(self) -> 'Menu':
@@ -2988,11 +3532,8 @@ class Menu(object):
 
                     # If the mouse motion selection is disabled then select a widget by clicking
                     if not self._current._mouse_motion_selection:
-                        for index in range(len(self._current._widgets)):
-                            widget = self._current._widgets[index]
-                            if widget.is_selectable and widget.is_visible() and \
-                                    self._current._scroll.collide(widget, event):
-                                self._current._select(index)
+                        for index in self._current._get_widgets_at(event):
+                            self._current._select(index)
 
                     # If mouse motion selection, clicking will disable the active state
                     # only if the user clicked outside the widget
@@ -3005,11 +3546,8 @@ class Menu(object):
                 # is not active and the pointed widget is selectable
                 elif self._current._mouse_motion_selection and event.type == pygame.MOUSEMOTION and \
                         selected_widget is not None and not selected_widget.active:
-                    for index in range(len(self._current._widgets)):
-                        widget = self._current._widgets[index]
-                        if widget.is_selectable and widget.is_visible() and \
-                                self._current._scroll.collide(widget, event):
-                            self._current._select(index)
+                    for index in self._current._get_widgets_at(event):
+                        self._current._select(index)
 
                 # Mouse events in selected widget
                 elif self._current._mouse and event.type == pygame.MOUSEBUTTONUP and selected_widget is not None and \
@@ -3029,11 +3567,8 @@ class Menu(object):
 
                     # If the touchscreen motion selection is disabled then select a widget by clicking
                     if not self._current._touchscreen_motion_selection:
-                        for index in range(len(self._current._widgets)):
-                            widget = self._current._widgets[index]
-                            if widget.is_selectable and widget.is_visible() and \
-                                    self._current._scroll.collide(widget, event):
-                                self._current._select(index)
+                        for index in self._current._get_widgets_at(event):
+                            self._current._select(index)
 
                     # If touchscreen motion selection, clicking will disable the active state
                     # only if the user clicked outside the widget
@@ -3046,10 +3581,8 @@ class Menu(object):
                 # is not active and the pointed widget is selectable
                 elif self._current._touchscreen_motion_selection and event.type == pygame.FINGERMOTION and \
                         selected_widget is not None and not selected_widget.active:
-                    for index in range(len(self._current._widgets)):
-                        widget = self._current._widgets[index]
-                        if widget.is_selectable and self._current._scroll.collide(widget, event):
-                            self._current._select(index)
+                    for index in self._current._get_widgets_at(event):
+                        self._current._select(index)
 
                 # Touchscreen events in selected widget
                 elif self._current._touchscreen and event.type == pygame.FINGERUP and selected_widget is not None:
@@ -3102,6 +3635,7 @@ class Menu(object):
 
         kwargs (Optional)
             - ``clear_surface``     *(bool)* - If ``True`` surface is cleared using ``theme.surface_clear_color``
+            - ``dirty_rects``       *(bool)* - If ``True`` only the changed areas of the surface are updated in the display, using ``pygame.display.update`` instead of ``pygame.display.flip``. The surface must be the display surface
             - ``disable_loop``      *(bool)* - If ``True`` the mainloop only runs once. Use for running draw and update in a single call
             - ``fps_limit``         *(int)* - Maximum FPS of the loop. Default equals to ``theme.fps``. If ``0`` there's no limit
 
@@ -3117,10 +3651,12 @@ class Menu(object):
         """
         # Unpack kwargs
         clear_surface = kwargs.get('clear_surface', True)
+        dirty_rects = kwargs.get('dirty_rects', False)
         disable_loop = kwargs.get('disable_loop', False)
         fps_limit = kwargs.get('fps_limit', self._theme.fps)
 
         assert isinstance(clear_surface, bool)
+        assert isinstance(dirty_rects, bool)
         assert isinstance(disable_loop, bool)
         assert isinstance(fps_limit, (int, float))
         assert isinstance(surface, pygame.Surface)
@@ -3155,13 +3691,16 @@ class Menu(object):
             self._current._clock.tick(fps_limit)
 
             # Draw the menu
-            self.draw(surface=surface, clear_surface=clear_surface)
+            rects = self.draw(surface=surface, clear_surface=clear_surface, dirty_rects=dirty_rects)
 
             # Gather events by Menu
             self.update(pygame.event.get())
 
             # Flip contents to screen
-            pygame.display.flip()
+            if not dirty_rects:
+                pygame.display.flip()
+            elif len(rects) > 0:
+                pygame.display.update(rects)
 
             # Menu closed or disabled
             if not self.is_enabled() or disable_loop:
@@ -3233,6 +3772,86 @@ class Menu(object):
         """
         return pygame.Rect(int(self._position[0]), int(self._position[1]), int(self._width), int(self._height))
 
+    def set_widget_culling(self, enabled: bool = True, margin: int = 100) -> 'Menu':
+        """
+        Draw only the widgets within the visible area of the Menu scroll, plus
+        a margin around it, instead of drawing every widget each time the widgets
+        surface is updated. Once the user scrolls out of the drawn area the widgets
+        around the new visible area are drawn. This is useful for long scrolling
+        Menus, where most of the widgets are hidden.
+
+        .. note::
+
+            Widget draw callbacks are only executed if the widget is drawn.
+
+        .. note::
+
+            This is applied only to the base Menu (not the currently displayed,
+            stored in ``_current`` pointer); for such behaviour apply
+            to :py:meth:`pygame_menu.Menu.get_current` object.
+
+        :param enabled: Enable the culling
+        :param margin: Margin around the visible area where the widgets are also drawn (px)
+        :return: Self reference
+        """
+        assert isinstance(enabled, bool)
+        assert isinstance(margin, int)
+        assert margin >= 0, 'margin must be equal or greater than zero'
+        self._culling = enabled
+        self._culling_margin = margin
+        self._culling_rect = None
+        self._widget_surface_cache_need_update = True
+        return self
+
+    def set_profiling(self, enabled: bool = True, buffer_size: Optional[int] = None) -> 'Menu':
+        """
+        Record the time spent by each phase of :py:meth:`pygame_menu.Menu.draw`
+        (``layout``, ``background``, ``decorator``, ``widgets``, ``scroll``,
+        ``menubar``, ``focus``, and the whole ``draw``) and by each widget class,
+        for the last ``buffer_size`` frames. The timings can be read or exported
+        through :py:meth:`pygame_menu.Menu.get_profiler`. If disabled, nothing is
+        recorded, but the timings are kept.
+
+        The widget classes are recorded only on the frames which draw the widgets
+        again, that is, if the widgets surface cache is updated.
+
+        .. note::
+
+            This is applied only to the Menu which is drawn, including the submenus
+            it displays.
+
+        :param enabled: Enable the profiling
+        :param buffer_size: Number of frames stored. If ``None`` it's kept, or ``256`` the first time. If it changes, the previous timings are removed
+        :return: Self reference
+        """
+        assert isinstance(enabled, bool)
+        if buffer_size is not None:
+            assert isinstance(buffer_size, int)
+            assert buffer_size > 0, 'buffer size must be greater than zero'
+        # noinspection PyProtectedMember
+        if enabled and (self._profiler is None or buffer_size not in (None, self._profiler._buffer_size)):
+            self._profiler = MenuProfiler(256 if buffer_size is None else buffer_size)
+        self._profiling = enabled
+        return self
+
+    def get_profiler(self) -> Optional['MenuProfiler']:
+        """
+        Return the profiler of the Menu, see :py:meth:`pygame_menu.Menu.set_profiling`.
+
+        :return: Profiler, ``None`` if the profiling was never enabled
+        """
+        return self._profiler
+
+    def _get_scroll_view_world_rect(self) -> 'pygame.Rect':
+        """
+        Return the visible area of the scroll within the widgets surface.
+
+        :return: Rect in the widgets surface reference
+        """
+        offsets = self._scroll.get_offsets()
+        view_rect = self._scroll.get_view_rect()
+        return pygame.Rect(offsets[0], offsets[1], view_rect.width, view_rect.height)
+
     def set_sound(self, sound: Optional['Sound'], recursive: bool = False) -> 'Menu':
         """
         Add a sound engine to the Menu. If ``recursive=True``, the sound is
@@ -3328,7 +3947,11 @@ class Menu(object):
         if reset:
             self.full_reset()
         del self._widgets[:]
+        for menu in self._submenus:
+            menu._supermenus.remove(self)
         del self._submenus[:]
+        self._widget_ids.clear()
+        self._invalidate_widget_tree_ids()
         self._index = -1
         self._stats.clear += 1
         self._render()
@@ -3574,15 +4197,9 @@ class Menu(object):
         """
         assert isinstance(widget_id, str)
         assert isinstance(recursive, bool)
-        for widget in self._widgets:
-            if widget.get_id() == widget_id:
-                return widget
         if recursive:
-            for menu in self._submenus:
-                widget = menu.get_widget(widget_id, recursive)
-                if widget:
-                    return widget
-        return None
+            return self._get_widget_tree_ids().get(widget_id)
+        return self._widget_ids.get(widget_id)
 
     def reset_value(self, recursive: bool = False) -> 'Menu':
         """
@@ -3636,6 +4253,8 @@ class Menu(object):
         """
         if menu in self._submenus:
             self._submenus.remove(menu)
+            menu._supermenus.remove(self)
+            self._invalidate_widget_tree_ids()
             self._update_after_remove_or_hidden(self._index)
             return True
         if recursive:
@@ -3676,6 +4295,18 @@ class Menu(object):
         """
         return self._clock
 
+    @staticmethod
+    def get_animation_clock() -> 'AnimationClock':
+        """
+        Return the clock of the animations (blinking arrows and cursors, or any
+        animated decoration or draw callback), shared by all the Menus. It is
+        advanced on each :py:meth:`pygame_menu.Menu.draw` and never waits, see
+        :py:class:`pygame_menu._animation.AnimationClock`.
+
+        :return: Animation clock
+        """
+        return get_animation_clock()
+
     def get_index(self) -> int:
         """
         Get selected widget index from the Menu.
@@ -3815,14 +4446,17 @@ class _MenuStats(object):
         self.add_text_input = 0
         self.add_toggle_switch = 0
         self.add_vertical_margin = 0
+        self.add_virtual_list = 0
 
         # Widget update
         self.added_widgets = 0
+        self.batch = 0
         self.removed_widgets = 0
 
         # Widget position
         self.build_surface = 0
         self.position_update = 0
+        self.position_update_widgets = 0
         self.center_content = 0
 
         # Render
@@ -3835,13 +4469,40 @@ class _MenuStats(object):
         # Other
         self.clear = 0
         self.draw = 0
+        self.draw_culled_widgets = 0
+        self.draw_dirty_rects = 0
         self.draw_update_cached = 0
+        self.hit_index_build = 0
         self.loop = 0
         self.reset = 0
         self.select = 0
         self.update = 0
 
 
+# noinspection PyProtectedMember
+class _MenuBatch(object):
+    """
+    Defers the layout and rendering of a Menu, see :py:meth:`pygame_menu.Menu.batch`.
+
+    :param menu: Menu
+    """
+
+    def __init__(self, menu: 'Menu') -> None:
+        self._menu = menu
+
+    def __enter__(self) -> 'Menu':
+        self._menu._batch_depth += 1
+        return self._menu
+
+    def __exit__(self, *args) -> None:
+        menu = self._menu
+        menu._batch_depth -= 1
+        if menu._batch_depth == 0:
+            menu._stats.batch += 1
+            menu._widgets_surface = None
+            menu._render()
+
+
 class _MenuCopyException(Exception):
     """
     If user tries to copy a Menu.
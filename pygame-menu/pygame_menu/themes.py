@@ -450,6 +450,21 @@ class Theme(object):
 
         return self
 
+    def preload_fonts(self, sizes: Union[Tuple[int, ...], List[int]] = ()) -> 'Theme':
+        """
+        Load the title and widget fonts of the theme, so the first Menu using
+        them does not have to load them. Call it at startup, for example, while
+        a loading screen is shown.
+
+        :param sizes: Other sizes of the widget font to load, for widgets which use a different ``font_size``
+        :return: Self reference
+        """
+        assert isinstance(sizes, (tuple, list))
+        _font.get_font(self.title_font, self.title_font_size)
+        for size in (self.widget_font_size,) + tuple(sizes):
+            _font.get_font(self.widget_font, size)
+        return self
+
     def set_background_color_opacity(self, opacity: float) -> 'Theme':
         """
         Modify the Menu background color with given opacity.
@@ -29,7 +29,10 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 -------------------------------------------------------------------------------
 """
 
-__all__ = ['Widget']
+__all__ = [
+    'Widget',
+    'set_render_check'
+]
 
 import pygame
 import pygame_menu.baseimage as _baseimage
@@ -52,6 +55,57 @@ import warnings
 if TYPE_CHECKING:
     from pygame_menu.menu import Menu
 
+# If True, the widgets also compute the hash of the render attributes to check
+# that no change was missed by the version counter. See set_render_check()
+_render_check = False
+
+
+def set_render_check(enabled: bool) -> None:
+    """
+    Enable or disable the render check. If enabled, each time the widget render
+    is skipped because the render version did not change, the hash of the render
+    attributes is also computed; if it changed, a warning is raised and the
+    widget renders. This is slow, use it only for debugging.
+
+    :param enabled: Enable the check
+    :return: None
+    """
+    assert isinstance(enabled, bool)
+    global _render_check
+    _render_check = enabled
+
+
+class _RenderAttribute(object):
+    """
+    Widget attribute that bumps the render version each time it is set to a new
+    object. As it only defines ``__set__``, reading the attribute is a plain
+    lookup of the instance dict.
+
+    :param name: Attribute name
+    """
+    __slots__ = ('_name',)
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __set__(self, widget: 'Widget', value: Any) -> None:
+        attributes = widget.__dict__
+        if attributes.get(self._name, self) is not value:
+            attributes['_render_version'] = widget._render_version + 1
+        attributes[self._name] = value
+
+
+def _add_render_attributes(cls: type) -> None:
+    """
+    Adds the render attribute descriptors of the widget class, see ``Widget._render_attributes``.
+
+    :param cls: Widget class
+    :return: None
+    """
+    for name in cls._render_attributes:
+        if not isinstance(getattr(cls, name, None), _RenderAttribute):
+            setattr(cls, name, _RenderAttribute(name))
+
 
 class Widget(object):
     """
@@ -97,7 +151,9 @@ class Widget(object):
     _id: str
     _joystick_enabled: bool
     _kwargs: Dict[Any, Any]
+    _last_render_args: Tuple[Any, ...]
     _last_render_hash: int
+    _last_render_version: int
     _margin: Tuple2IntType
     _max_height: List[Optional[bool]]
     _max_width: List[Optional[bool]]
@@ -109,6 +165,7 @@ class Widget(object):
     _padding: Tuple4IntType
     _padding_transform: Tuple4IntType
     _rect: 'pygame.Rect'
+    _render_version: int
     _scale: List[Union[bool, NumberType]]
     _selected: bool
     _selection_effect: 'Selection'
@@ -131,6 +188,11 @@ class Widget(object):
     readonly: bool
     selection_expand_background: bool
 
+    # Attributes used by the render method. These are added as descriptors that bump
+    # the render version each time they are set to a new object, see _render_changed()
+    _render_attributes = frozenset(('_font_color', '_selected', '_title', '_visible', 'readonly'))
+    _render_version = 0
+
     def __init__(self,
                  title: Any = '',
                  widget_id: str = '',
@@ -226,7 +288,13 @@ class Widget(object):
         self._border_inflate = (0, 0)
         self._border_width = 0
 
-        # Rendering, this variable may be used by render() method
+        # Rendering, these variables may be used by render() method
+        # If the render version (bumped each time a render attribute is set)
+        # or the render args change respect to the last render, then the widget
+        # should render. See self._render_changed() method
+        self._last_render_args = ()
+        self._last_render_version = -1
+
         # If the hash of the variables change respect to the last render hash
         # (hash computed using self._hash_variables() method)
         # then the widget should render and update the hash
@@ -311,6 +379,7 @@ class Widget(object):
         :return: Render return value
         """
         self._last_render_hash = 0
+        self._render_version += 1
         return self._render()
 
     def force_menu_surface_update(self) -> 'Widget':
@@ -470,6 +539,47 @@ class Widget(object):
             return True
         return False
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        _add_render_attributes(cls)
+
+    def _render_changed(self, *args) -> bool:
+        """
+        This method checks if the widget must render because a render attribute was
+        set (see ``_render_attributes``), the render was forced, or the given variables
+        changed. Unlike :py:meth:`pygame_menu.widgets.core.Widget._render_hash_changed`
+        this only compares the render version, thus, the variables should only include
+        the render status not stored within the widget attributes, for example, the
+        Menu size.
+
+        :param args: Variables not stored as render attributes
+        :return: ``True`` if render has changed the widget
+        """
+        if self._render_version == self._last_render_version and args == self._last_render_args:
+            if not _render_check or not self._render_check_changed(args):
+                return False
+            warnings.warn('{0}({1}) render attributes changed without updating the render version'
+                          .format(self.__class__.__name__, self.get_id()))
+        elif _render_check:
+            self._render_check_changed(args)
+        self._last_render_args = args
+        self._last_render_version = self._render_version
+        return True
+
+    def _render_check_changed(self, args: Tuple[Any, ...]) -> bool:
+        """
+        Checks the hash of the render attributes and the given variables. Used by
+        the render check, see :py:func:`pygame_menu.widgets.core.widget.set_render_check`.
+
+        :param args: Variables not stored as render attributes
+        :return: ``True`` if the hash changed
+        """
+        status = tuple(repr(getattr(self, name, None)) for name in sorted(self._render_attributes))
+        if self._last_render_hash == 0:  # The check was not enabled at the last render
+            self._render_hash_changed(status, args)
+            return False
+        return self._render_hash_changed(status, args)
+
     def set_title(self, title: str) -> 'Widget':  # lgtm [py/inheritance/incorrect-overridden-signature]
         """
         Update the widget title.
@@ -850,10 +960,14 @@ class Widget(object):
         :return: Self reference
         """
         assert isinstance(widget_id, str)
+        old_id = self._id
         if self._menu is not None:
             # noinspection PyProtectedMember
             self._menu._check_id_duplicated(widget_id)
         self._id = widget_id
+        if self._menu is not None:
+            # noinspection PyProtectedMember
+            self._menu._update_widget_id(self, old_id)
         return self
 
     def add_self_to_kwargs(self, key: str = 'widget') -> 'Widget':
@@ -874,6 +988,8 @@ class Widget(object):
                             use_background_color: bool = True) -> 'pygame.Surface':
         """
         Render text. If the font is not defined returns a zero-width surface.
+        The surface is taken from the text cache shared by all the widgets, thus,
+        it must not be modified.
 
         :param text: Text to render
         :param color: Text color
@@ -892,8 +1008,7 @@ class Widget(object):
         if self._font is None:
             return make_surface(0, 0)
 
-        surface = self._font.render(text, self._font_antialias, color, bgcolor)
-        return surface
+        return _fonts.render_text(self._font, text, self._font_antialias, color, bgcolor)
 
     def _render_string(self, string: str, color: ColorType) -> 'pygame.Surface':
         """
@@ -2047,6 +2162,9 @@ class Widget(object):
         return self._decorator
 
 
+_add_render_attributes(Widget)
+
+
 # noinspection PyMissingOrEmptyDocstring
 class _NullSelection(Selection):
     """
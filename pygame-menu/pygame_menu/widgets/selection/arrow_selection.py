@@ -32,6 +32,7 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 __all__ = ['ArrowSelection']
 
 import pygame
+from pygame_menu._animation import get_animation_clock
 from pygame_menu.utils import assert_vector
 from pygame_menu.widgets.core import Selection
 from pygame_menu._custom_types import NumberType, Tuple2IntType, TYPE_CHECKING, Optional
@@ -39,8 +40,6 @@ from pygame_menu._custom_types import NumberType, Tuple2IntType, TYPE_CHECKING,
 if TYPE_CHECKING:
     from pygame_menu.widgets.core import Widget
 
-SELECTOR_CLOCK = pygame.time.Clock()
-
 
 class ArrowSelection(Selection):
     """
@@ -57,6 +56,7 @@ class ArrowSelection(Selection):
     """
     _arrow_vertical_offset: int
     _arrow_size: Tuple2IntType
+    _blink_last: NumberType
     _blink_ms: NumberType
     _blink_time: NumberType
     _blink_status: bool
@@ -78,6 +78,7 @@ class ArrowSelection(Selection):
         assert blink_ms >= 0, 'blinking milliseconds must be greater than or equal to zero'
         self._arrow_vertical_offset = int(arrow_vertical_offset)
         self._arrow_size = (arrow_size[0], arrow_size[1])
+        self._blink_last = get_animation_clock().get_time()
         self._blink_ms = blink_ms
         self._blink_time = 0
         self._blink_status = True
@@ -100,8 +101,9 @@ class ArrowSelection(Selection):
         :param c: Arrow coord C
         :return: None
         """
-        SELECTOR_CLOCK.tick(60)  # As blink is in ms
-        self._blink_time += SELECTOR_CLOCK.get_time()
+        clock = get_animation_clock()
+        self._blink_time += clock.elapsed(self._blink_last)
+        self._blink_last = clock.get_time()
 
         # Switch the blinking if the time exceeded or the widget has changed
         if self._blink_ms != 0 and (self._blink_time > self._blink_ms or self._last_widget != widget):
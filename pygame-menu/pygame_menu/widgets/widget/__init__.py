@@ -39,6 +39,7 @@ from pygame_menu.widgets.widget.scrollbar import ScrollBar
 from pygame_menu.widgets.widget.selector import Selector
 from pygame_menu.widgets.widget.textinput import TextInput
 from pygame_menu.widgets.widget.toggleswitch import ToggleSwitch
+from pygame_menu.widgets.widget.virtuallist import VirtualList
 from pygame_menu.widgets.widget.vmargin import VMargin
 
 # Menubar and positions
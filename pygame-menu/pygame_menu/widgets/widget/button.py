@@ -130,7 +130,7 @@ class Button(Widget):
         surface.blit(self._surface, self._rect.topleft)
 
     def _render(self) -> Optional[bool]:
-        if not self._render_hash_changed(self._selected, self._title, self._visible, self.readonly):
+        if not self._render_changed():
             return True
         self._surface = self._render_string(self._title, self.get_font_color_status())
         self._apply_transforms()
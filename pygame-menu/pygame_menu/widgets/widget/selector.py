@@ -90,6 +90,8 @@ class Selector(Widget):
     _sformat: str
     _title_size: int
 
+    _render_attributes = Widget._render_attributes | {'_elements', '_index', '_sformat'}
+
     def __init__(self,
                  title: Any,
                  elements: Union[List[Tuple[Any, ...]], List[str]],
@@ -148,9 +150,9 @@ class Selector(Widget):
         surface.blit(self._surface, self._rect.topleft)
 
     def _render(self) -> Optional[bool]:
-        string = self._sformat.format(self._title, self.get_value()[0][0])
-        if not self._render_hash_changed(string, self._selected, self._visible, self._index, self.readonly):
+        if not self._render_changed():
             return True
+        string = self._sformat.format(self._title, self.get_value()[0][0])
         self._surface = self._render_string(string, self.get_font_color_status())
         self._apply_transforms()
         self._rect.width, self._rect.height = self._surface.get_size()
@@ -235,6 +237,7 @@ class Selector(Widget):
         check_selector_elements(elements)
         selected_element = self._elements[self._index]
         self._elements = elements
+        self._render_version += 1  # The list may be the same object, updated in place
         try:
             self._index = self._elements.index(selected_element)
         except ValueError:
@@ -36,6 +36,7 @@ import math
 import pygame
 import pygame_menu.controls as _controls
 import pygame_menu.locals as _locals
+from pygame_menu._animation import get_animation_clock
 from pygame_menu.utils import check_key_pressed_valid, make_surface, assert_color
 from pygame_menu.widgets.core import Widget
 from pygame_menu._custom_types import Optional, Any, CallbackType, Union, Tuple, List, ColorType, \
@@ -126,7 +127,7 @@ class TextInput(Widget):
     _absolute_origin: Tuple2IntType
     _apply_widget_update_callback: bool  # Used in ColorInput
     _block_copy_paste: bool
-    _clock: 'pygame.time.Clock'
+    _clock_last: NumberType
     _copy_paste_enabled: bool
     _current_underline_string: str  # Testing
     _cursor_color: ColorType
@@ -182,6 +183,9 @@ class TextInput(Widget):
     _title_size: NumberType
     _valid_chars: Optional[List[str]]
 
+    _render_attributes = Widget._render_attributes | {'_cursor_render', '_input_string', '_maxwidth', '_password',
+                                                      '_selection_enabled', 'active'}
+
     def __init__(self,
                  title: Any = '',
                  textinput_id: str = '',
@@ -299,7 +303,7 @@ class TextInput(Widget):
         self._renderbox = [0, 0, 0]  # Left/Right/Inner, int
 
         # Things cursor:
-        self._clock = pygame.time.Clock()
+        self._clock_last = get_animation_clock().get_time()  # Time of the last update
         self._cursor_color = cursor_color
         self._cursor_ms_counter = 0
         self._cursor_offset = -1.0
@@ -446,12 +450,11 @@ class TextInput(Widget):
             surface.blit(self._cursor_surface, (x, self._rect.y + self._cursor_surface_pos[1]))
 
     def _render(self) -> Optional[bool]:
-        string = self._title + self._get_input_string()  # Render string
-
-        if not self._render_hash_changed(self._menu.get_id(), string, self._selected, self._cursor_render,
-                                         self._selection_enabled, self.active, self._visible, self.readonly,
-                                         self._menu.get_width(inner=True)):
+        # The renderbox is updated in place, thus, it's not a render attribute
+        if not self._render_changed(self._menu.get_id(), self._menu.get_width(inner=True), self._renderbox[0],
+                                    self._renderbox[1]):
             return True
+        string = self._title + self._get_input_string()  # Render string
 
         # Apply underline if exists
         self._surface = self._render_string_underline(string, self.get_font_color_status())
@@ -1457,19 +1460,19 @@ class TextInput(Widget):
         return False
 
     def update(self, events: Union[List['pygame.event.Event'], Tuple['pygame.event.Event']]) -> bool:
-        self._clock.tick(60)
-
         # Check mouse pressed
         # noinspection PyArgumentList
         mouse_left, mouse_middle, mouse_right = pygame.mouse.get_pressed()
         self._mouse_is_pressed = (mouse_left or mouse_right or mouse_middle) and self._mouse_enabled
 
+        # Get the time elapsed since the last update
+        clock = get_animation_clock()
+        time_clock = clock.elapsed(self._clock_last)
+        self._clock_last = clock.get_time()
+
         if self.readonly:
             return False
 
-        # Get time clock
-        time_clock = self._clock.get_time()
-
         # Update cursor switch
         self._cursor_ms_counter += time_clock
         if self._cursor_ms_counter >= self._cursor_switch_ms:
@@ -110,6 +110,8 @@ class ToggleSwitch(Widget):
     _switch_width: int
     _total_states: int
 
+    _render_attributes = Widget._render_attributes | {'_state'}
+
     def __init__(self,
                  title: Any,
                  toggleswitch_id: str = '',
@@ -298,8 +300,7 @@ class ToggleSwitch(Widget):
         surface.blit(self._slider, (sliderx, slidery))
 
     def _render(self) -> Optional[bool]:
-        if not self._render_hash_changed(self._selected, self._title, self._visible, self.readonly,
-                                         self._state):
+        if not self._render_changed():
             return True
 
         # Create basic title
@@ -0,0 +1,489 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+VIRTUAL LIST
+List which only renders the visible rows of a data source.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2021 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+__all__ = ['VirtualList']
+
+import pygame
+import pygame_menu.controls as _controls
+from pygame_menu.utils import check_key_pressed_valid, make_surface, assert_color, is_callable
+from pygame_menu.widgets.core import Widget
+from pygame_menu._custom_types import Any, Callable, CallbackType, ColorType, Dict, List, NumberType, \
+    Optional, Tuple, Union
+
+
+# noinspection PyMissingOrEmptyDocstring
+class VirtualList(Widget):
+    """
+    Virtual list widget. It shows a window of ``rows`` rows of a data source that
+    can have any number of items, and only renders the rows within the window;
+    the row surfaces are taken from a pool of ``rows`` surfaces that is recycled
+    when the window moves. Thus, the memory does not depend on the number of items.
+
+    The length of the data source is given by ``length``, an integer or a function
+    returning the current length. Each row is rendered by ``render_item``, which
+    receives the item index and returns the text of the row or a surface:
+
+    .. code-block:: python
+
+        render_item(index) -> str or pygame.Surface
+
+    The value of the widget is the selected item index. Pressing up/down moves the
+    selection within the list; at the first or last item the event is left to the
+    Menu, which selects the previous or next widget. The callbacks receive the
+    selected index:
+
+    .. code-block:: python
+
+        onchange(index, **kwargs)
+        onreturn(index, **kwargs)
+
+    If the data source changes, call :py:meth:`pygame_menu.widgets.VirtualList.refresh`.
+
+    .. note::
+
+        This widget only accepts translation transformation.
+
+    :param length: Number of items, or function returning the number of items
+    :param render_item: Function that renders the item of the given index
+    :param virtuallist_id: ID of the virtual list
+    :param default: Index of the default selected item
+    :param onchange: Callback when changing the selected item
+    :param onreturn: Callback when pressing return on the selected item
+    :param onselect: Function when selecting the widget
+    :param row_color: Background color of the rows. If ``None`` the rows are transparent
+    :param row_height: Height of each row (px). If ``None`` uses the font line height
+    :param row_selected_color: Background color of the selected row
+    :param rows: Number of visible rows
+    :param scrollbar_color: Color of the scrollbar
+    :param scrollbar_thickness: Thickness of the scrollbar (px). If ``0`` the scrollbar is not drawn
+    :param width: Width of the list (px)
+    :param kwargs: Optional keyword arguments
+    """
+    _first: int
+    _free_rows: List['pygame.Surface']
+    _index: int
+    _length: Callable[[], int]
+    _render_item: Callable[[int], Union[str, 'pygame.Surface']]
+    _row_color: Optional[ColorType]
+    _row_height: int
+    _row_height_default: Optional[int]
+    _row_keys: Dict[int, Tuple[bool, ColorType]]
+    _row_selected_color: ColorType
+    _row_surfaces: Dict[int, 'pygame.Surface']
+    _rows: int
+    _scrollbar_color: ColorType
+    _scrollbar_thickness: int
+    _width: int
+
+    _render_attributes = Widget._render_attributes | {'_first', '_index', '_row_height'}
+
+    def __init__(self,
+                 length: Union[int, Callable[[], int]],
+                 render_item: Callable[[int], Union[str, 'pygame.Surface']],
+                 virtuallist_id: str = '',
+                 default: int = 0,
+                 onchange: CallbackType = None,
+                 onreturn: CallbackType = None,
+                 onselect: CallbackType = None,
+                 row_color: Optional[ColorType] = None,
+                 row_height: Optional[int] = None,
+                 row_selected_color: ColorType = (255, 255, 255, 60),
+                 rows: int = 10,
+                 scrollbar_color: ColorType = (120, 120, 120),
+                 scrollbar_thickness: int = 6,
+                 width: int = 300,
+                 *args,
+                 **kwargs
+                 ) -> None:
+        assert isinstance(length, int) or is_callable(length), 'length must be an integer or a function'
+        assert is_callable(render_item), 'render_item must be callable (function-type)'
+        assert isinstance(virtuallist_id, str)
+        assert isinstance(default, int)
+        if row_color is not None:
+            assert_color(row_color)
+        assert isinstance(row_height, (int, type(None)))
+        if row_height is not None:
+            assert row_height > 0, 'row height must be greater than zero'
+        assert_color(row_selected_color)
+        assert isinstance(rows, int) and rows > 0, 'the number of rows must be greater than zero'
+        assert_color(scrollbar_color)
+        assert isinstance(scrollbar_thickness, int) and scrollbar_thickness >= 0, \
+            'scrollbar thickness must be equal or greater than zero'
+        assert isinstance(width, int) and width > scrollbar_thickness, \
+            'width must be greater than the scrollbar thickness'
+
+        super(VirtualList, self).__init__(
+            args=args,
+            kwargs=kwargs,
+            onchange=onchange,
+            onreturn=onreturn,
+            onselect=onselect,
+            widget_id=virtuallist_id
+        )
+
+        if isinstance(length, int):
+            assert length >= 0, 'length must be equal or greater than zero'
+            total = length
+            self._length = lambda: total
+        else:
+            self._length = length
+        self._render_item = render_item
+        self._row_color = row_color
+        self._row_height = 0
+        self._row_height_default = row_height
+        self._row_selected_color = row_selected_color
+        self._rows = rows
+        self._scrollbar_color = scrollbar_color
+        self._scrollbar_thickness = scrollbar_thickness
+        self._width = width
+
+        # Rendered rows within the window, and the pool of unused row surfaces
+        self._first = 0  # Index of the first visible item
+        self._free_rows = []
+        self._row_keys = {}  # Selected status and font color each row was rendered with
+        self._row_surfaces = {}
+
+        self._index = 0
+        if default > 0:
+            assert default < self._length(), 'default index must be lower than the length'
+        self.set_value(default)
+        self.set_default_value(default)
+
+    def set_default_value(self, index: int) -> 'Widget':
+        self._default_value = index
+        return self
+
+    def reset_value(self) -> 'Widget':
+        self.set_value(self._default_value)
+        return self
+
+    def set_title(self, title: str) -> 'Widget':
+        return self
+
+    def scale(self, width: NumberType, height: NumberType, smooth: bool = False) -> 'Widget':
+        return self
+
+    def resize(self, width: NumberType, height: NumberType, smooth: bool = False) -> 'Widget':
+        return self
+
+    def set_max_width(self, width: Optional[NumberType], scale_height: NumberType = False,
+                      smooth: bool = True) -> 'Widget':
+        return self
+
+    def set_max_height(self, height: Optional[NumberType], scale_width: NumberType = False,
+                       smooth: bool = True) -> 'Widget':
+        return self
+
+    def rotate(self, angle: NumberType) -> 'Widget':
+        return self
+
+    def flip(self, x: bool, y: bool) -> 'Widget':
+        return self
+
+    def get_value(self) -> int:
+        """
+        Return the selected item index, ``-1`` if the list is empty.
+
+        :return: Item index
+        """
+        if self._length() == 0:
+            return -1
+        return self._index
+
+    def set_value(self, index: int) -> None:
+        """
+        Select an item, and move the visible window to show it.
+
+        :param index: Item index
+        :return: None
+        """
+        assert isinstance(index, int)
+        length = self._length()
+        assert 0 <= index < max(length, 1), 'index exceeds the length of the list'
+        self._index = index
+        if index < self._first:
+            self._first = index
+        elif index >= self._first + self._rows:
+            self._first = index - self._rows + 1
+
+    def get_first_visible(self) -> int:
+        """
+        Return the index of the first visible item.
+
+        :return: Item index
+        """
+        return self._first
+
+    def scroll_to(self, first: int) -> 'VirtualList':
+        """
+        Move the visible window to start at the given item, without changing the selection.
+
+        :param first: Index of the first visible item
+        :return: Self reference
+        """
+        assert isinstance(first, int)
+        self._first = max(0, min(first, self._length() - self._rows))
+        return self
+
+    def refresh(self, index: Optional[int] = None) -> 'VirtualList':
+        """
+        Render the rows again after the data source has changed.
+
+        :param index: Item index to render again. If ``None`` renders all the rows, and updates the length
+        :return: Self reference
+        """
+        if index is None:
+            for i in list(self._row_surfaces.keys()):
+                self._release_row(i)
+            length = self._length()
+            self._index = max(0, min(self._index, length - 1))
+            self._first = max(0, min(self._first, length - self._rows))
+        elif index in self._row_surfaces:
+            self._release_row(index)
+        self._render_version += 1
+        return self
+
+    def get_pool_size(self) -> int:
+        """
+        Return the number of row surfaces allocated by the widget.
+
+        :return: Number of surfaces
+        """
+        return len(self._row_surfaces) + len(self._free_rows)
+
+    def _apply_font(self) -> None:
+        if self._row_height_default is None:
+            self._row_height = self._font.get_linesize()
+        else:
+            self._row_height = self._row_height_default
+        # Row surfaces have to be created again with the new height
+        self._row_surfaces = {}
+        self._row_keys = {}
+        self._free_rows = []
+
+    def _release_row(self, index: int) -> None:
+        """
+        Return the surface of a row to the pool.
+
+        :param index: Item index
+        :return: None
+        """
+        self._free_rows.append(self._row_surfaces.pop(index))
+        del self._row_keys[index]
+
+    def _render_row(self, index: int) -> 'pygame.Surface':
+        """
+        Render a row into a surface of the pool, if it changed.
+
+        :param index: Item index
+        :return: Row surface
+        """
+        selected = index == self._index
+        color = self.get_font_color_status() if selected else self._font_color
+        key = (selected, color)
+        if self._row_keys.get(index) == key:
+            return self._row_surfaces[index]
+
+        surface = self._row_surfaces.get(index)
+        if surface is None:
+            if len(self._free_rows) > 0:
+                surface = self._free_rows.pop()
+            else:
+                surface = make_surface(self._width - self._scrollbar_thickness, self._row_height)
+            self._row_surfaces[index] = surface
+        self._row_keys[index] = key
+
+        # Draw the row
+        if selected:
+            surface.fill(self._row_selected_color)
+        elif self._row_color is not None:
+            surface.fill(self._row_color)
+        else:
+            surface.fill((0, 0, 0, 0))
+        item = self._render_item(index)
+        if not isinstance(item, pygame.Surface):
+            item = self._font_render_string(str(item), color)
+        surface.blit(item, (0, int((self._row_height - item.get_height()) / 2)))
+        return surface
+
+    def get_row_rect(self, index: int) -> 'pygame.Rect':
+        """
+        Return the rect of the row of a visible item, in the same reference as
+        :py:meth:`pygame_menu.widgets.core.Widget.get_rect` (without padding).
+
+        :param index: Item index
+        :return: Row rect
+        """
+        return pygame.Rect(self._rect.x, self._rect.y + (index - self._first) * self._row_height,
+                           self._width - self._scrollbar_thickness, self._row_height)
+
+    def _draw(self, surface: 'pygame.Surface') -> None:
+        surface.blit(self._surface, self._rect.topleft)
+
+    def _render(self) -> Optional[bool]:
+        length = self._length()
+        if not self._render_changed(length):
+            return True
+        if self._surface is None or self._surface.get_size() != (self._width, self._rows * self._row_height):
+            self._surface = make_surface(self._width, self._rows * self._row_height)
+        self._surface.fill((0, 0, 0, 0))
+
+        # Release the rows out of the window, then render the visible ones
+        last = min(self._first + self._rows, length)
+        for index in list(self._row_surfaces.keys()):
+            if not self._first <= index < last:
+                self._release_row(index)
+        for index in range(self._first, last):
+            self._surface.blit(self._render_row(index), (0, (index - self._first) * self._row_height))
+
+        # Draw the scrollbar
+        if self._scrollbar_thickness > 0 and length > self._rows:
+            height = self._rows * self._row_height
+            slider_height = max(self._scrollbar_thickness, int(height * self._rows / length))
+            slider_y = int((height - slider_height) * self._first / (length - self._rows))
+            self._surface.fill(self._scrollbar_color, (self._width - self._scrollbar_thickness, slider_y,
+                                                       self._scrollbar_thickness, slider_height))
+
+        self._rect.width, self._rect.height = self._surface.get_size()
+        self.force_menu_surface_update()
+
+    def _move(self, delta: int) -> bool:
+        """
+        Move the selection.
+
+        :param delta: Number of items to move
+        :return: ``True`` if the selection changed
+        """
+        length = self._length()
+        index = max(0, min(self._index + delta, length - 1))
+        if index == self._index or length == 0:
+            return False
+        self.set_value(index)
+        self.change()
+        self._scroll_menu_to_row()
+        return True
+
+    def _scroll_menu_to_row(self) -> None:
+        """
+        Scroll the Menu to show the selected row if the list is not fully visible.
+
+        :return: None
+        """
+        if self._menu is None:
+            return
+        self._render()
+        self._menu.get_scrollarea().scroll_to_rect(self.get_row_rect(self._index), margin=0)
+
+    def _row_at(self, pos: Tuple[NumberType, NumberType]) -> int:
+        """
+        Return the index of the item at a window position, ``-1`` if no item is there.
+
+        :param pos: Position in the window
+        :return: Item index
+        """
+        rect = self._rect.copy()
+        rect.width -= self._scrollbar_thickness
+        if self._menu is not None:
+            rect = self._menu.get_scrollarea().to_real_position(rect)
+        if not rect.collidepoint(*pos):
+            return -1
+        index = self._first + int((pos[1] - rect.y) / self._row_height)
+        return index if index < self._length() else -1
+
+    def update(self, events: Union[List['pygame.event.Event'], Tuple['pygame.event.Event']]) -> bool:
+        if self.readonly:
+            return False
+        updated = False
+
+        for event in events:
+
+            if event.type == pygame.KEYDOWN:  # Check key is valid
+                if not check_key_pressed_valid(event):
+                    continue
+
+            keydown = event.type == pygame.KEYDOWN
+            joy_hatmotion = self._joystick_enabled and event.type == pygame.JOYHATMOTION
+            joy_button_down = self._joystick_enabled and event.type == pygame.JOYBUTTONDOWN
+
+            # Previous item. At the first item the Menu selects the previous widget
+            if keydown and event.key == _controls.KEY_MOVE_DOWN or \
+                    joy_hatmotion and event.value == _controls.JOY_UP:
+                if self._move(-1):
+                    self._sound.play_key_add()
+                    updated = True
+
+            # Next item
+            elif keydown and event.key == _controls.KEY_MOVE_UP or \
+                    joy_hatmotion and event.value == _controls.JOY_DOWN:
+                if self._move(1):
+                    self._sound.play_key_add()
+                    updated = True
+
+            # Page up/down
+            elif keydown and event.key in (pygame.K_PAGEUP, pygame.K_PAGEDOWN):
+                if self._move(self._rows * (-1 if event.key == pygame.K_PAGEUP else 1)):
+                    self._sound.play_key_add()
+                    updated = True
+
+            # Press enter
+            elif keydown and event.key == _controls.KEY_APPLY or \
+                    joy_button_down and event.button == _controls.JOY_BUTTON_SELECT:
+                if self._length() > 0:
+                    self._sound.play_open_menu()
+                    self.apply()
+                    updated = True
+
+            # Scroll the window with the mouse wheel
+            elif self._mouse_enabled and event.type == pygame.MOUSEBUTTONDOWN and event.button in (4, 5):
+                if self._row_at(event.pos) != -1:
+                    self.scroll_to(self._first + (-1 if event.button == 4 else 1))
+                    updated = True
+
+            # Click on an item
+            elif self._mouse_enabled and event.type == pygame.MOUSEBUTTONUP and event.button in (1, 2, 3) or \
+                    self._touchscreen_enabled and event.type == pygame.FINGERUP:
+                if event.type == pygame.FINGERUP:
+                    window_size = self.get_menu().get_window_size()
+                    event_pos = (event.x * window_size[0], event.y * window_size[1])
+                else:
+                    event_pos = event.pos
+                index = self._row_at(event_pos)
+                if index != -1:
+                    self._sound.play_click_mouse()
+                    if index != self._index:
+                        self.set_value(index)
+                        self.change()
+                    updated = True
+
+        if updated:
+            self.apply_update_callbacks()
+
+        return updated
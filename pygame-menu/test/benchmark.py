@@ -0,0 +1,357 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+BENCHMARK
+Benchmark of the Menu hot paths (add, layout, draw, update).
+
+Run from the root of the repository, for example:
+
+    python -m test.benchmark --quick --output bench.json
+    python -m test.benchmark --compare bench.json --threshold 0.2
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2021 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+__all__ = ['BENCHMARK_CASES', 'build_menu', 'compare', 'get_configs', 'main', 'run']
+
+import os
+
+# Headless, must be set before pygame initializes the display (test._utils)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+import timeit
+
+from test._utils import MenuUtils, PygameUtils, surface
+
+import pygame
+import pygame_menu
+from pygame_menu._custom_types import Any, Callable, Dict, List, Optional, Tuple
+
+# Benchmark cases, each one times a Menu operation
+BENCHMARK_CASES = ('add', 'layout', 'draw', 'redraw', 'update')
+
+# Number of widgets of the configurations
+BENCHMARK_WIDGETS = (10, 100, 1000, 10000)
+BENCHMARK_WIDGETS_QUICK = (10, 100)
+
+# Default value of the parameters, each configuration changes one of them
+_DEFAULT_PARAMS = {'columns': 1, 'decorators': 0, 'scroll': 0.0, 'theme': 'default'}
+_PARAMS = (
+    ('columns', 3),
+    ('decorators', 10),
+    ('scroll', 0.5),
+    ('scroll', 1.0),
+    ('theme', 'dark'),
+    ('theme', 'image')
+)
+
+# Minimum time of each measure, the operation is run as many times as needed (s)
+_MIN_TIME = 0.05
+
+
+def _get_theme(name: str) -> 'pygame_menu.themes.Theme':
+    """
+    Return the theme of a configuration.
+
+    :param name: Theme name
+    :return: Theme
+    """
+    if name == 'default':
+        return pygame_menu.themes.THEME_DEFAULT
+    if name == 'dark':
+        return pygame_menu.themes.THEME_DARK
+    if name == 'image':
+        theme = pygame_menu.themes.THEME_DEFAULT.copy()
+        theme.background_color = pygame_menu.baseimage.BaseImage(pygame_menu.baseimage.IMAGE_EXAMPLE_GRAY_LINES)
+        return theme
+    raise ValueError('unknown theme "{0}"'.format(name))
+
+
+def get_configs(widgets: Tuple[int, ...] = BENCHMARK_WIDGETS) -> List[Dict[str, Any]]:
+    """
+    Return the configurations to benchmark. For each number of widgets there's
+    one configuration with the default parameters, and one for each parameter
+    change (columns, decorators, scroll position and theme).
+
+    :param widgets: Number of widgets
+    :return: List of configurations
+    """
+    configs = []
+    for n in widgets:
+        configs.append(dict(_DEFAULT_PARAMS, widgets=n))
+        for key, value in _PARAMS:
+            configs.append(dict(_DEFAULT_PARAMS, widgets=n, **{key: value}))
+    return configs
+
+
+def _config_name(case: str, config: Dict[str, Any]) -> str:
+    """
+    Return the name of a result.
+
+    :param case: Benchmark case
+    :param config: Configuration
+    :return: Name, for example ``draw[widgets=10,columns=1,decorators=0,scroll=0.0,theme=default]``
+    """
+    params = ','.join('{0}={1}'.format(k, config[k]) for k in ('widgets', 'columns', 'decorators', 'scroll', 'theme'))
+    return '{0}[{1}]'.format(case, params)
+
+
+def build_menu(widgets: int, columns: int = 1, decorators: int = 0, theme: str = 'default', **kwargs) -> 'pygame_menu.Menu':
+    """
+    Create a Menu with the given number of widgets; labels, buttons, selectors and
+    text inputs.
+
+    :param widgets: Number of widgets
+    :param columns: Number of columns
+    :param decorators: Number of decorations of each widget
+    :param theme: Theme name
+    :param kwargs: Other configuration parameters, not used
+    :return: Menu
+    """
+    rows = None
+    if columns > 1:
+        rows = int(math.ceil(widgets / columns))
+    menu = MenuUtils.generic_menu(columns=columns, rows=rows, theme=_get_theme(theme), title='benchmark')
+    with menu.batch():
+        for i in range(widgets):
+            kind = i % 4
+            if kind == 0:
+                widget = menu.add_label('Label {0}'.format(i))
+            elif kind == 1:
+                widget = menu.add_button('Button {0}'.format(i), None)
+            elif kind == 2:
+                widget = menu.add_selector('Selector {0}'.format(i), [('a', 0), ('b', 1)])
+            else:
+                widget = menu.add_text_input('Input {0}: '.format(i), default='text')
+            deco = widget.get_decorator()
+            for j in range(decorators):
+                deco.add_line((-10, -10 + 2 * j), (10, -10 + 2 * j), (50, 50, 50))
+    return menu
+
+
+def _scroll(menu: 'pygame_menu.Menu', position: float) -> None:
+    """
+    Scroll the Menu to the widget at the given position.
+
+    :param menu: Menu
+    :param position: Position from the first (0) to the last (1) widget
+    :return: None
+    """
+    widgets = menu.get_widgets()
+    if len(widgets) == 0:
+        return
+    widget = widgets[int(round(position * (len(widgets) - 1)))]
+    menu.get_scrollarea().scroll_to_rect(widget.get_rect())
+
+
+def _time(fun: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """
+    Time a function. It runs as many times as needed to take at least ``_MIN_TIME``,
+    and this is repeated ``repeat`` times.
+
+    :param fun: Function
+    :param repeat: Number of repeats
+    :return: Min and median time of each call (ms), number of calls of each repeat, and number of repeats
+    """
+    t0 = time.perf_counter()
+    fun()
+    first = time.perf_counter() - t0
+    number = max(1, int(_MIN_TIME / max(first, 1e-9)))
+    if first > 10 * _MIN_TIME:  # Slow, the first call is kept as a sample
+        times = [first] + timeit.repeat(fun, number=1, repeat=repeat - 1)
+    else:  # The first call is a warm-up
+        times = [t / number for t in timeit.repeat(fun, number=number, repeat=repeat)]
+    return {
+        'median_ms': statistics.median(times) * 1000,
+        'min_ms': min(times) * 1000,
+        'number': number,
+        'repeat': len(times)
+    }
+
+
+def _run_config(config: Dict[str, Any], repeat: int, cases: Tuple[str, ...]) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the benchmark cases of a configuration.
+
+    :param config: Configuration
+    :param repeat: Number of repeats
+    :param cases: Cases to run
+    :return: Results of each case
+    """
+    results = {}
+    if 'add' in cases:
+        results['add'] = _time(lambda: build_menu(**config).render(), repeat)
+    menu = build_menu(**config)
+    menu.render()
+    _scroll(menu, config['scroll'])
+    menu.draw(surface)
+
+    def layout() -> None:
+        """
+        Layout all the widgets.
+        """
+        menu._widget_layout = {}  # Discard the layout of the previous update
+        menu.render()
+
+    def redraw() -> None:
+        """
+        Draw all the widgets.
+        """
+        menu.force_surface_cache_update()
+        menu.draw(surface)
+
+    def update() -> None:
+        """
+        Move the selection, and draw.
+        """
+        menu.update(PygameUtils.key(pygame_menu.controls.KEY_MOVE_DOWN, keydown=True))
+        menu.draw(surface)
+
+    funs = {'layout': layout, 'draw': lambda: menu.draw(surface), 'redraw': redraw, 'update': update}
+    for case in cases:
+        if case in funs:
+            results[case] = _time(funs[case], repeat)
+    return results
+
+
+def run(widgets: Tuple[int, ...] = BENCHMARK_WIDGETS,
+        repeat: int = 5,
+        cases: Tuple[str, ...] = BENCHMARK_CASES,
+        name_filter: Optional[str] = None,
+        verbose: bool = False
+        ) -> Dict[str, Any]:
+    """
+    Run the benchmark.
+
+    :param widgets: Number of widgets of the configurations
+    :param repeat: Number of repeats of each measure
+    :param cases: Cases to run
+    :param name_filter: Run only the results which name contains this string
+    :param verbose: Print each result
+    :return: Dict of ``meta`` (versions, platform and date) and ``results`` (by name)
+    """
+    assert isinstance(repeat, int) and repeat > 0
+    for case in cases:
+        assert case in BENCHMARK_CASES, 'unknown benchmark case "{0}"'.format(case)
+    results = {}
+    for config in get_configs(widgets):
+        config_cases = tuple(c for c in cases if name_filter is None or name_filter in _config_name(c, config))
+        if len(config_cases) == 0:
+            continue
+        for case, result in _run_config(config, repeat, config_cases).items():
+            name = _config_name(case, config)
+            results[name] = dict(result, case=case, **config)
+            if verbose:
+                print('{0}: {1:.3f} ms'.format(name, result['min_ms']))
+    return {
+        'meta': {
+            'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'platform': platform.platform(),
+            'pygame': pygame.version.ver,
+            'pygame_menu': pygame_menu.__version__,
+            'python': platform.python_version(),
+            'repeat': repeat
+        },
+        'results': results
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.2) -> List[Dict[str, Any]]:
+    """
+    Compare the results against a baseline, both returned by :py:func:`test.benchmark.run`.
+    The min times are compared, as they are the least affected by noise.
+
+    :param results: Results
+    :param baseline: Baseline results
+    :param threshold: Relative change considered a regression or an improvement
+    :return: List of the results in both, with the ``ratio`` (current/baseline) and ``status`` (``regression``, ``improvement`` or ``ok``)
+    """
+    assert threshold >= 0
+    comparison = []
+    base = baseline['results']
+    for name, result in results['results'].items():
+        if name not in base:
+            continue
+        ratio = result['min_ms'] / max(base[name]['min_ms'], 1e-9)
+        status = 'ok'
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 / (1 + threshold):
+            status = 'improvement'
+        comparison.append({
+            'baseline_ms': base[name]['min_ms'],
+            'current_ms': result['min_ms'],
+            'name': name,
+            'ratio': ratio,
+            'status': status
+        })
+    return comparison
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark from the command line.
+
+    :param argv: Arguments
+    :return: Exit code, ``1`` if there's any regression respect to the baseline
+    """
+    parser = argparse.ArgumentParser(description='pygame-menu benchmark')
+    parser.add_argument('--quick', action='store_true', help='benchmark only {0} widgets'.format(BENCHMARK_WIDGETS_QUICK))
+    parser.add_argument('--widgets', type=int, nargs='+', help='number of widgets of the configurations')
+    parser.add_argument('--cases', nargs='+', choices=BENCHMARK_CASES, default=BENCHMARK_CASES)
+    parser.add_argument('--repeat', type=int, default=5, help='number of repeats of each measure')
+    parser.add_argument('--filter', help='run only the results which name contains this string')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='compare the results against this JSON file')
+    parser.add_argument('--threshold', type=float, default=0.2, help='relative change considered a regression')
+    args = parser.parse_args(argv)
+
+    widgets = args.widgets or (BENCHMARK_WIDGETS_QUICK if args.quick else BENCHMARK_WIDGETS)
+    results = run(tuple(widgets), args.repeat, tuple(args.cases), args.filter, verbose=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+
+    if not args.compare:
+        return 0
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    comparison = compare(results, baseline, args.threshold)
+    for c in comparison:
+        print('{0:<12} {1:6.2f}x  {2:10.3f} -> {3:10.3f} ms  {4}'.format(
+            c['status'], c['ratio'], c['baseline_ms'], c['current_ms'], c['name']))
+    return 1 if any(c['status'] == 'regression' for c in comparison) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
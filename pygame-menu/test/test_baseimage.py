@@ -41,6 +41,7 @@ import copy
 import pygame
 import pygame_menu
 from pygame_menu.baseimage import *
+from pygame_menu._cache import surface_bytes
 from pathlib import Path
 
 
@@ -348,6 +349,173 @@ class BaseImageTest(unittest.TestCase):
         image.set_at((10, 10), (0, 0, 0))
         # self.assertEqual(image.get_at((10, 10)), (0, 0, 0, 255))
 
+    def test_array_functions(self) -> None:
+        """
+        Test the pixel operations on all the pixels at once, against the per-pixel path.
+        """
+        for path in (pygame_menu.baseimage.IMAGE_EXAMPLE_PYGAME_MENU, pygame_menu.baseimage.IMAGE_EXAMPLE_WALLPAPER):
+            base = pygame_menu.BaseImage(path)
+            w, h = base.get_size()
+            base.crop(w / 2 - 30, h / 2 - 20, 60, 40)  # Keep the per-pixel path fast
+            base.checkpoint()
+            bw = (lambda r, g, b, a: ((r + g + b) // 3, (r + g + b) // 3, (r + g + b) // 3, a))
+            tests = (
+                (lambda im: im.to_bw(), bw),
+                (lambda im: im.pick_channels(('r', 'b')), lambda r, g, b, a: (r, 0, b, a)),
+                (lambda im: im.tint((255, 128, 0, 128)),
+                 lambda r, g, b, a: (r, g * 128 // 255, 0, a * 128 // 255)),
+                (lambda im: im.adjust_brightness_contrast(20, 1.5),
+                 lambda r, g, b, a: ((r - 128) * 1.5 + 148, (g - 128) * 1.5 + 148, (b - 128) * 1.5 + 148, a)),
+                (lambda im: im.scale_alpha(0.5), lambda r, g, b, a: (r, g, b, a * 0.5)),
+                (lambda im: im.apply_image_array_function(lambda r, g, b, a: (255 - r, 255 - g, 255 - b, a)),
+                 lambda r, g, b, a: (255 - r, 255 - g, 255 - b, a))
+            )
+            for operation, pixel_function in tests:
+                image = base.copy()
+                expected = base.copy()
+                operation(image)
+                expected.apply_image_function(pixel_function)
+                self.assertTrue(image.equals(expected))
+                if image.get_bitsize() == 32:  # The alpha of 24-bit images does not change
+                    self.assertFalse(image.equals(base))
+
+        # Formats not supported by surfarray use the per-pixel path
+        image = pygame_menu.BaseImage(pygame_menu.baseimage.IMAGE_EXAMPLE_PYGAME_MENU)
+        image.crop(0, 0, 10, 10)
+        image._surface = image._surface.convert(8)
+        image.to_bw()
+        r, g, b, _ = image.get_at((5, 5))
+        self.assertTrue(r == g == b)
+
+        # Invalid values
+        self.assertRaises(AssertionError, lambda: image.tint((1, 2)))
+        self.assertRaises(AssertionError, lambda: image.adjust_brightness_contrast(contrast=-1))
+        self.assertRaises(AssertionError, lambda: image.scale_alpha(-1))
+
+    def test_transform_cache(self) -> None:
+        """
+        Test the cache of rotated and scaled surfaces.
+        """
+        image = pygame_menu.BaseImage(pygame_menu.baseimage.IMAGE_EXAMPLE_PYGAME_MENU)
+        image.crop(0, 0, 100, 60)
+        reference = image.copy()
+        self.assertIsNone(image.get_transform_cache())
+        image.set_transform_cache(angle_step=1, scale_step=0.1)
+        cache = image.get_transform_cache()
+
+        # Angles are rounded to the step, the rotated surfaces are reused
+        image.rotate(10.2)
+        self.assertEqual(image.get_angle(), 10.2)  # The angle is not rounded
+        reference.rotate(10)
+        self.assertTrue(image.equals(reference))
+        surface_10 = image.get_surface(new=False)
+        image.rotate(image.get_angle() + 0.2)
+        self.assertIs(image.get_surface(new=False), surface_10)
+        image.rotate(image.get_angle() + 0.2)  # 10.6, rounds to 11
+        self.assertIsNot(image.get_surface(new=False), surface_10)
+        image.rotate(370)
+        image.rotate(10)
+        self.assertIs(image.get_surface(new=False), surface_10)
+        self.assertEqual(cache.get_stats()['misses'], 2)
+        self.assertEqual(cache.get_stats()['hits'], 2)
+
+        # Precompute all the rotations
+        image.precompute_rotations()
+        self.assertEqual(len(cache), 360)
+        misses = cache.misses
+        for angle in range(-720, 720, 7):
+            image.rotate(angle + 0.1)
+        self.assertEqual(cache.misses, misses)
+
+        # Modifying the pixels discards the cache
+        image.set_alpha(100)
+        self.assertEqual(len(cache), 0)
+        image.rotate(0)
+        image.checkpoint()
+        self.assertEqual(len(cache), 0)
+
+        # Scale factors are rounded to the step
+        image.restore()
+        w, h = image.get_size()
+        image.scale(1.96, 1.96)
+        self.assertEqual(image.get_size(), (int(w * 2), int(h * 2)))
+        image.restore()
+        hits = cache.hits
+        image.scale(2.04, 2.04)
+        self.assertEqual(cache.hits, hits + 1)
+        self.assertEqual(image.get_size(), (int(w * 2), int(h * 2)))
+
+        # Changing the pixels does not change the checkpoint
+        original = pygame.image.tostring(image._original_surface, 'RGBA')
+        image.restore()
+        image.crop(0, 0, 10, 10)
+        image.to_bw()
+        image.restore()
+        image.set_at((0, 0), (1, 2, 3))
+        self.assertEqual(pygame.image.tostring(image._original_surface, 'RGBA'), original)
+
+        # The memory is bounded
+        image.set_transform_cache(max_size=surface_bytes(image.get_surface(new=False)) * 3)
+        image.restore()
+        image.precompute_rotations()
+        self.assertLessEqual(image.get_transform_cache().size, image.get_transform_cache().max_size)
+        self.assertGreater(image.get_transform_cache().evictions, 0)
+
+        # Copies keep the settings, not the surfaces
+        self.assertEqual(len(image.copy().get_transform_cache()), 0)
+
+        # Disable
+        image.set_transform_cache(False)
+        self.assertIsNone(image.get_transform_cache())
+        self.assertRaises(AssertionError, lambda: image.precompute_rotations())
+
+    def test_image_cache(self) -> None:
+        """
+        Test the images shared through the image cache.
+        """
+        cache = get_image_cache()
+        image = pygame_menu.BaseImage(pygame_menu.baseimage.IMAGE_EXAMPLE_GRAY_LINES)
+        self.assertFalse(image.is_loaded())
+        self.assertEqual(image.get_memory_usage(), {'decoded': 0, 'resident': 0})
+
+        # The image is decoded when used
+        self.assertEqual(image.get_size(), (256, 256))
+        self.assertTrue(image.is_loaded())
+        decoded = surface_bytes(image.get_surface(new=False))
+        self.assertEqual(image.get_memory_usage(), {'decoded': decoded, 'resident': 0})
+
+        # Other image of the same file shares the pixels, copies too
+        hits = cache.hits
+        image2 = pygame_menu.BaseImage(pygame_menu.baseimage.IMAGE_EXAMPLE_GRAY_LINES)
+        image3 = image2.copy()
+        self.assertFalse(image3.is_loaded())
+        self.assertEqual(image2.get_surface(new=False), image.get_surface(new=False))
+        self.assertEqual(image3.get_surface(new=False), image.get_surface(new=False))
+        self.assertEqual(cache.hits, hits + 2)
+        self.assertEqual(image.copy().get_surface(new=False), image.get_surface(new=False))
+
+        # Changing the pixels copies the surface first
+        color = image.get_at((0, 0))
+        image2.set_at((0, 0), (255, 0, 0))
+        self.assertNotEqual(image2.get_surface(new=False), image.get_surface(new=False))
+        self.assertEqual(image.get_at((0, 0)), color)
+        self.assertEqual(image3.get_at((0, 0)), color)
+        self.assertEqual(image2.get_memory_usage(), {'decoded': decoded, 'resident': decoded})
+        image2.restore()
+        self.assertEqual(image2.get_surface(new=False), image.get_surface(new=False))
+        self.assertEqual(image2.get_memory_usage()['resident'], 0)
+        image3.rotate(45)
+        self.assertEqual(image.get_at((0, 0)), color)
+        self.assertGreater(image3.get_memory_usage()['resident'], 0)
+
+        # The same data is shared, whatever its source
+        with open(pygame_menu.baseimage.IMAGE_EXAMPLE_GRAY_LINES, 'rb') as f:
+            data = f.read()
+        image4 = pygame_menu.BaseImage(io.BytesIO(data))
+        image5 = pygame_menu.BaseImage(base64.b64encode(data).decode(), frombase64=True)
+        self.assertEqual(image4.get_surface(new=False), image5.get_surface(new=False))
+        self.assertTrue(image4.equals(image))
+
     def test_drawing_position(self) -> None:
         """
         Test drawing position.
@@ -404,21 +572,68 @@ class BaseImageTest(unittest.TestCase):
         Cache draw test.
         """
         image = pygame_menu.BaseImage(pygame_menu.baseimage.IMAGE_EXAMPLE_GRAY_LINES)
-        self.assertEqual(image._last_transform[2], None)
+        self.assertEqual(image._last_transform[1], None)
 
         image.set_drawing_mode(pygame_menu.baseimage.IMAGE_MODE_FILL)
 
         # Draw, this should force cache
         image.draw(surface)
-        self.assertNotEqual(image._last_transform[2], None)
-        s = image._last_transform[2]
+        self.assertNotEqual(image._last_transform[1], None)
+        s = image._last_transform[1]
         image.draw(surface)  # Draw again, then the image should be the same
-        self.assertEqual(image._last_transform[2], s)
-        self.assertEqual(image._last_transform[0], 600)
+        self.assertEqual(image._last_transform[1], s)
+        self.assertEqual(image._last_transform[1].get_width(), 600)
 
         # Changes the area, then image should change
         r = image.get_rect()
         r.width = 300
         image.draw(surface, r)
-        self.assertNotEqual(image._last_transform[2], s)
-        self.assertEqual(image._last_transform[0], 300)
+        self.assertNotEqual(image._last_transform[1], s)
+        self.assertEqual(image._last_transform[1].get_width(), 300)
+
+        # Changing the image also changes the cached surface
+        s = image._last_transform[1]
+        image.flip(True, False)
+        image.draw(surface, r)
+        self.assertNotEqual(image._last_transform[1], s)
+        s = image._last_transform[1]
+        image.set_at((0, 0), (255, 0, 0))
+        self.assertEqual(image._last_transform[1], None)
+        image.draw(surface, r)
+        self.assertNotEqual(image._last_transform[1], s)
+
+    def test_cache_repeat(self) -> None:
+        """
+        Test the tiled surface drawn by the repeat modes.
+        """
+        image = pygame_menu.BaseImage(pygame_menu.baseimage.IMAGE_EXAMPLE_PYGAME_MENU)
+        image.scale(0.1, 0.1)
+        w, h = image.get_size()
+        area = pygame.Rect(0, 0, 300, 200)
+        for mode in (IMAGE_MODE_REPEAT_X, IMAGE_MODE_REPEAT_Y, IMAGE_MODE_REPEAT_XY):
+            image.set_drawing_mode(mode)
+            image.set_drawing_offset((3, 4))
+            s = pygame.Surface((320, 240))
+            s.fill((40, 90, 200))
+            image.draw(s, area, (2, 1))
+            tiled = image._last_transform[1]
+            self.assertNotEqual(tiled, None)
+
+            # Compare against drawing each tile
+            expected = pygame.Surface((320, 240))
+            expected.fill((40, 90, 200))
+            timesx = 1 if mode == IMAGE_MODE_REPEAT_Y else (area.width + w - 1) // w
+            timesy = 1 if mode == IMAGE_MODE_REPEAT_X else (area.height + h - 1) // h
+            for x in range(timesx):
+                for y in range(timesy):
+                    expected.blit(image.get_surface(new=False), (x * w + 5, y * h + 5), area)
+            self.assertEqual(pygame.image.tostring(s, 'RGB'), pygame.image.tostring(expected, 'RGB'))
+
+            # Moving the image reuses the tiles
+            image.set_drawing_offset((10, 10))
+            image.draw(s, area)
+            self.assertEqual(image._last_transform[1], tiled)
+
+            # Resizing the area builds them again
+            image.draw(s, pygame.Rect(0, 0, 100, 100))
+            self.assertNotEqual(image._last_transform[1], tiled)
@@ -0,0 +1,100 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST BENCHMARK
+Benchmark suite tests.
+
+License:
+-------------------------------------------------------------------------------
+The MIT License (MIT)
+Copyright 2017-2021 Pablo Pizarro R. @ppizarror
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the Software
+is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+-------------------------------------------------------------------------------
+"""
+
+__all__ = ['BenchmarkTest']
+
+import json
+import os
+import tempfile
+import unittest
+
+from test import benchmark
+
+
+class BenchmarkTest(unittest.TestCase):
+
+    def test_configs(self) -> None:
+        """
+        Test the benchmark configurations.
+        """
+        configs = benchmark.get_configs((10, 100))
+        self.assertEqual(len(configs), 14)
+        self.assertEqual(configs[0], {'columns': 1, 'decorators': 0, 'scroll': 0.0, 'theme': 'default', 'widgets': 10})
+        self.assertEqual(configs[1]['columns'], 3)
+        self.assertEqual(configs[-1]['theme'], 'image')
+        self.assertEqual(configs[-1]['widgets'], 100)
+
+        menu = benchmark.build_menu(10, columns=3, decorators=2)
+        self.assertEqual(len(menu.get_widgets()), 10)
+        self.assertEqual(menu._used_columns, 3)
+        self.assertEqual(menu.get_widgets()[0].get_decorator()._total_decor(), 2)
+
+    def test_run_compare(self) -> None:
+        """
+        Test the benchmark run, and the comparison against a baseline.
+        """
+        results = benchmark.run((4,), repeat=1, cases=('layout', 'draw'), name_filter='theme=default')
+        results = json.loads(json.dumps(results))  # Results can be stored as JSON
+        names = sorted(results['results'].keys())
+        self.assertEqual(len(names), 10)
+        self.assertEqual(names[0], 'draw[widgets=4,columns=1,decorators=0,scroll=0.0,theme=default]')
+        for result in results['results'].values():
+            self.assertLessEqual(result['min_ms'], result['median_ms'])
+            self.assertEqual(result['repeat'], 1)
+        self.assertIn('pygame_menu', results['meta'])
+        self.assertRaises(AssertionError, lambda: benchmark.run((4,), cases=('unknown',)))
+
+        # Compare
+        baseline = json.loads(json.dumps(results))
+        name = names[0]
+        baseline['results'][name]['min_ms'] = results['results'][name]['min_ms'] / 2
+        baseline['results'][names[1]]['min_ms'] = results['results'][names[1]]['min_ms'] * 2
+        del baseline['results'][names[2]]
+        comparison = {c['name']: c for c in benchmark.compare(results, baseline, threshold=0.5)}
+        self.assertEqual(len(comparison), 9)
+        self.assertEqual(comparison[name]['status'], 'regression')
+        self.assertAlmostEqual(comparison[name]['ratio'], 2)
+        self.assertEqual(comparison[names[1]]['status'], 'improvement')
+        self.assertEqual(comparison[names[3]]['status'], 'ok')
+
+        # Command line, exits with 1 if there's a regression
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'bench.json')
+            argv = ['--widgets', '4', '--cases', 'draw', '--repeat', '1', '--filter', 'theme=dark']
+            self.assertEqual(benchmark.main(argv + ['--output', path]), 0)
+            with open(path) as f:
+                stored = json.load(f)
+            self.assertEqual(len(stored['results']), 1)
+            for result in stored['results'].values():
+                result['min_ms'] /= 1000
+            with open(path, 'w') as f:
+                json.dump(stored, f)
+            self.assertEqual(benchmark.main(argv + ['--compare', path]), 1)
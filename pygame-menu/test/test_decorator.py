@@ -91,19 +91,19 @@ class DecoratorTest(unittest.TestCase):
         deco.cache = True
 
         # Prev
-        self.assertEqual(deco._cache_surface['prev'], None)
-        self.assertEqual(deco._cache_surface['post'], None)
+        self.assertEqual(deco._cache_layers['prev'], None)
+        self.assertEqual(deco._cache_layers['post'], None)
         deco.add_circle(1, 1, 1, (0, 0, 0), True)
-        self.assertEqual(deco._cache_surface['prev'], None)
-        self.assertEqual(deco._cache_surface['post'], None)
+        self.assertEqual(deco._cache_layers['prev'], None)
+        self.assertEqual(deco._cache_layers['post'], None)
         deco.draw_prev(surface)
-        self.assertNotEqual(deco._cache_surface['prev'], None)
-        self.assertEqual(deco._cache_surface['post'], None)
-        p = deco._cache_surface['prev']
+        self.assertNotEqual(deco._cache_layers['prev'], None)
+        self.assertEqual(deco._cache_layers['post'], None)
+        p = deco._cache_layers['prev']
         deco.add_circle(1, 1, 1, (0, 0, 0), True)
         deco.draw_prev(surface)
-        self.assertNotEqual(deco._cache_surface['prev'], p)
-        self.assertEqual(deco._cache_surface['post'], None)
+        self.assertNotEqual(deco._cache_layers['prev'], p)
+        self.assertEqual(deco._cache_layers['post'], None)
         self.assertFalse(deco._cache_needs_update['prev'])
         self.assertFalse(deco._cache_needs_update['post'])
         deco.add_circle(1, 1, 1, (0, 0, 0), True)
@@ -124,14 +124,77 @@ class DecoratorTest(unittest.TestCase):
         # Post
         deco.add_circle(1, 1, 1, (0, 0, 0), False, prev=False)
         self.assertTrue(deco._cache_needs_update['post'])
-        self.assertEqual(deco._cache_surface['post'], None)
+        self.assertEqual(deco._cache_layers['post'], None)
         deco.draw_post(surface)
         self.assertEqual(deco._total_decor(), 1)
         self.assertFalse(deco._cache_needs_update['post'])
-        self.assertNotEqual(deco._cache_surface['post'], None)
+        self.assertNotEqual(deco._cache_layers['post'], None)
         deco.remove_all()
         self.assertEqual(deco._total_decor(), 0)
 
+    def test_cache_layers(self) -> None:
+        """
+        Test the cached layers of static decorations.
+        """
+        menu = MenuUtils.generic_menu()
+        btn = menu.add_button('Button', None)
+        deco = btn.get_decorator()
+        calls = [0]
+
+        def fun(surf: 'pygame.Surface', _) -> None:
+            """
+            Dynamic decoration.
+            """
+            calls[0] += 1
+            surf.fill((0, 0, 255), (0, 0, 5, 5))
+
+        deco.add_polygon([(-40, -10), (30, -15), (0, 25)], (255, 0, 0), True)
+        deco.add_circle(20, 5, 12, (0, 255, 0), False, width=3)
+        deco.add_rect(-50, -20, pygame.Rect(0, 0, 30, 10), (255, 255, 0), 2)
+        deco.add_text(0, 0, 'deco', pygame_menu.font.FONT_OPEN_SANS, 15, (255, 255, 255), centered=True)
+        deco.add_callable(fun)
+        deco.add_line((-60, 30), (60, 30), (0, 255, 255), 4)
+        deco.add_ellipse(10, -10, 15, 6, (255, 0, 255), True)
+
+        def draw() -> bytes:
+            """
+            Draw the decorations and return the pixels.
+            """
+            s = pygame.Surface((600, 600))
+            s.fill((40, 40, 40))
+            deco.draw_prev(s)
+            return pygame.image.tostring(s, 'RGB')
+
+        # Cached drawing is the same as the uncached one
+        expected = draw()
+        deco.cache = True
+        self.assertEqual(draw(), expected)
+        layers = deco._cache_layers['prev']
+        self.assertEqual(len(layers), 3)  # static, callable, static
+        self.assertEqual(calls[0], 2)
+
+        # Layers are bounded to the decorations
+        self.assertLess(layers[0][0].get_width(), 200)
+        self.assertLess(layers[0][0].get_height(), 100)
+
+        # Moving the object moves the layers without drawing them again
+        btn.translate(37, -21)
+        menu.render()
+        moved = draw()
+        self.assertEqual(deco._cache_layers['prev'], layers)
+        self.assertEqual(calls[0], 3)
+        deco.cache = False
+        self.assertEqual(draw(), moved)
+        deco.cache = True
+
+        # Disabling a decoration draws the layers again
+        d = deco.add_pixel(0, 0, (1, 1, 1))
+        draw()
+        layers = deco._cache_layers['prev']
+        deco.disable(d)
+        draw()
+        self.assertNotEqual(deco._cache_layers['prev'], layers)
+
     def test_copy(self) -> None:
         """
         Test decorator copy.
@@ -166,6 +229,54 @@ class DecoratorTest(unittest.TestCase):
         deco.remove(p)
         self.assertEqual(len(deco._coord_cache.keys()), 0)
 
+    def test_decoration_slots(self) -> None:
+        """
+        Test the indexed storage of the decorations.
+        """
+        widg = pygame_menu.widgets.NoneWidget()
+        deco = widg.get_decorator()
+        ids = [deco.add_pixel(i, 0, (1, 1, 1)) for i in range(100)]
+        call = deco.add_callable(lambda: None, pass_args=False)
+        post = deco.add_pixel(0, 0, (1, 1, 1), prev=False)
+        self.assertTrue(deco._has_callable())
+
+        # Removing leaves empty slots until half of the list is empty
+        for i in range(0, 40):
+            deco.remove(ids[i])
+        self.assertEqual(len(deco._decor['prev']), 101)
+        self.assertEqual(deco._decor_removed['prev'], 40)
+        self.assertEqual(deco._total_decor(), 62)
+        for i in range(40, 51):
+            deco.remove(ids[i])
+        self.assertEqual(len(deco._decor['prev']), 50)
+        self.assertEqual(deco._decor_removed['prev'], 0)
+        for d in ids[51:] + [call]:
+            p, i = deco._decor_slot[d]
+            self.assertEqual(deco._decor[p][i][1], d)
+        self.assertEqual(deco._decor_slot[post], ('post', 0))
+        self.assertRaises(IndexError, lambda: deco.remove(ids[0]))
+
+        # Only the enabled decorations are drawn
+        deco.disable(ids[70])
+        deco.disable(call)
+        active = deco._get_active('prev')
+        self.assertEqual(len(active), 48)
+        self.assertNotIn(ids[70], [d[1] for d in active])
+        deco.draw_prev(surface)
+        deco.enable(ids[70])
+        self.assertEqual(len(deco._get_active('prev')), 49)
+        self.assertEqual(deco._get_active('prev')[19][1], ids[70])
+
+        # Remove all
+        deco.remove(call)
+        self.assertFalse(deco._has_callable())
+        deco.remove_all(prev=True)
+        self.assertEqual(deco._total_decor(), 1)
+        self.assertEqual(len(deco._decor_enabled), 1)
+        self.assertEqual(deco._get_active('prev'), [])
+        deco.remove(post)
+        self.assertEqual(deco._total_decor(), 0)
+
     def test_enable_disable(self) -> None:
         """
         Test enable disable decoration.
@@ -35,7 +35,9 @@ from pathlib import Path
 import unittest
 from test._utils import MenuUtils
 
+import pygame
 import pygame_menu
+from pygame_menu._cache import LRUCache
 
 
 class FontTest(unittest.TestCase):
@@ -69,3 +71,88 @@ class FontTest(unittest.TestCase):
 
         # Modify the system font and load, this will raise an exception
         self.assertRaises(ValueError, lambda: MenuUtils.get_font('invalid font', 5))
+
+    def test_font_cache(self) -> None:
+        """
+        Test the font cache.
+        """
+        cache = pygame_menu.font.get_font_cache()
+        font = pygame_menu.font.get_font(pygame_menu.font.FONT_MUNRO, 13)
+        stats = cache.get_stats()
+        self.assertIs(pygame_menu.font.get_font(pygame_menu.font.FONT_MUNRO, 13), font)
+        self.assertIs(pygame_menu.font.get_font(Path(pygame_menu.font.FONT_MUNRO), 13), font)
+        self.assertEqual(cache.get_stats()['hits'], stats['hits'] + 2)
+
+        # The file of the name is kept, a new size does not check it again
+        # noinspection PyProtectedMember
+        self.assertEqual(pygame_menu.font._font_paths[pygame_menu.font.FONT_MUNRO], pygame_menu.font.FONT_MUNRO)
+        self.assertIsNot(pygame_menu.font.get_font(pygame_menu.font.FONT_MUNRO, 14), font)
+
+        # The number of fonts is bounded
+        max_items = cache.max_items
+        cache.max_items = 2
+        try:
+            pygame_menu.font.get_font(pygame_menu.font.FONT_MUNRO, 15)
+            pygame_menu.font.get_font(pygame_menu.font.FONT_MUNRO, 16)
+            self.assertEqual(len(cache), 2)
+            self.assertNotIn((pygame_menu.font.FONT_MUNRO, 13), cache)
+            self.assertIsNot(pygame_menu.font.get_font(pygame_menu.font.FONT_MUNRO, 13), font)
+        finally:
+            cache.max_items = max_items
+
+    def test_text_cache(self) -> None:
+        """
+        Test the rendered text cache.
+        """
+        cache = pygame_menu.font.get_text_cache()
+        cache.clear()
+        stats = cache.get_stats()
+        font = pygame_menu.font.get_font(pygame_menu.font.FONT_OPEN_SANS, 20)
+
+        # The same text is rendered once
+        text = pygame_menu.font.render_text(font, 'cached', True, (255, 0, 0))
+        self.assertEqual(cache.get_stats()['misses'], stats['misses'] + 1)
+        self.assertIs(pygame_menu.font.render_text(font, 'cached', True, (255, 0, 0)), text)
+        self.assertEqual(cache.get_stats()['hits'], stats['hits'] + 1)
+        self.assertEqual(pygame.image.tostring(text, 'RGBA'),
+                         pygame.image.tostring(font.render('cached', True, (255, 0, 0)), 'RGBA'))
+
+        # Any change of the key renders again
+        self.assertIsNot(pygame_menu.font.render_text(font, 'cached', True, (255, 0, 1)), text)
+        self.assertIsNot(pygame_menu.font.render_text(font, 'cached', False, (255, 0, 0)), text)
+        self.assertIsNot(pygame_menu.font.render_text(font, 'cached', True, (255, 0, 0), (0, 0, 0)), text)
+        font.set_bold(True)
+        self.assertIsNot(pygame_menu.font.render_text(font, 'cached', True, (255, 0, 0)), text)
+        font.set_bold(False)
+        self.assertEqual(cache.get_stats()['misses'], stats['misses'] + 5)
+
+        # Widgets share the cache, selecting a button again does not render its text
+        menu = MenuUtils.generic_menu()
+        btn1 = menu.add_button('button 1', None)
+        btn2 = menu.add_button('button 2', None)
+        menu.select_widget(btn2)
+        menu.select_widget(btn1)
+        misses = cache.get_stats()['misses']
+        for _ in range(5):
+            menu.select_widget(btn2)
+            menu.select_widget(btn1)
+        self.assertEqual(cache.get_stats()['misses'], misses)
+
+        # Memory bound
+        lru = LRUCache(max_size=100)
+        lru.put('a', 1, 40)
+        lru.put('b', 2, 40)
+        self.assertEqual(lru.get('a'), 1)  # b is now the least recently used
+        lru.put('c', 3, 40)
+        self.assertEqual(lru.get_stats(), {'evictions': 1, 'hits': 1, 'items': 2, 'misses': 0, 'size': 80})
+        self.assertIsNone(lru.get('b'))
+        self.assertEqual(lru.get('c'), 3)
+        lru.put('d', 4, 200)  # Larger than the cache
+        self.assertNotIn('d', lru)
+        lru = LRUCache(max_items=2)
+        for k in range(5):
+            lru.put(k, k)
+        self.assertEqual(len(lru), 2)
+        self.assertEqual(lru.evictions, 3)
+        lru.clear()
+        self.assertEqual(lru.size, 0)
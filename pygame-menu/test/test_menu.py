@@ -32,6 +32,7 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 __all__ = ['MenuTest']
 
 import copy
+import json
 import unittest
 import timeit
 from test._utils import surface, test_reset_surface, MenuUtils, PygameUtils
@@ -43,6 +44,7 @@ from pygame_menu.widgets import Label, Button
 
 # Configure the tests
 TEST_TIME_DRAW = False
+TEST_TIME_LAYOUT = False
 
 
 def dummy_function() -> None:
@@ -105,6 +107,30 @@ class MenuTest(unittest.TestCase):
         # (decorator) with surface cache, 0.1033874000000008
         print(timeit.timeit(lambda: draw_and_update(), number=100))
 
+    @staticmethod
+    def test_time_layout() -> None:
+        """
+        This test the time that takes to menu to layout several widgets.
+        """
+        if not TEST_TIME_LAYOUT:
+            return
+        menu = MenuUtils.generic_menu(title='EPIC')
+
+        # Add the widgets without building the menu surface on each addition
+        with menu.batch():
+            for i in range(10000):
+                menu.add_label(title='epic label {0}'.format(i))
+        menu._widget_layout = {}
+
+        # (re-walking each column) full layout, 78.1
+        # (prefix sums) full layout, 0.344
+        # (prefix sums) nothing changed, 0.193
+        # (prefix sums) middle widget changed, 0.262
+        print(timeit.timeit(lambda: menu._update_widget_position(), number=1))
+        print(timeit.timeit(lambda: menu._update_widget_position(), number=1))
+        menu.get_widgets()[5000].set_title('epic')
+        print(timeit.timeit(lambda: menu._update_widget_position(), number=1))
+
     def test_copy(self) -> None:
         """
         Test menu copy.
@@ -534,6 +560,32 @@ class MenuTest(unittest.TestCase):
         self.assertEqual(self.menu.get_widget('deep_id', recursive=True), deep_widget)
         self.assertEqual(self.menu.get_widget('deep_selector', recursive=True), deep_selector)
 
+        # The ID index follows the changes of the deepest menu
+        deep_widget.change_id('new_deep_id')
+        self.assertIsNone(self.menu.get_widget('deep_id', recursive=True))
+        self.assertEqual(self.menu.get_widget('new_deep_id', recursive=True), deep_widget)
+        self.assertRaises(IndexError, lambda: deep_selector.change_id('new_deep_id'))
+        prev_menu.remove_widget(deep_selector)
+        self.assertIsNone(self.menu.get_widget('deep_selector', recursive=True))
+        deep_label = prev_menu.add_label('label', label_id='deep_label')
+        self.assertEqual(self.menu.get_widget('deep_label', recursive=True), deep_label)
+
+        # Widgets of the menu take precedence over the submenus
+        submenu = MenuUtils.generic_menu()
+        submenu_btn = submenu.add_button('button', None, button_id='btn')
+        self.menu.add_button('submenu', submenu)
+        self.assertEqual(self.menu.get_widget('btn', recursive=True), submenu_btn)
+        btn = self.menu.add_button('button', None, button_id='btn')
+        self.assertEqual(self.menu.get_widget('btn', recursive=True), btn)
+        self.assertEqual(submenu.get_widget('btn'), submenu_btn)
+
+        # Unlink the submenus
+        self.menu.clear()
+        self.assertIsNone(self.menu.get_widget('btn', recursive=True))
+        self.assertIsNone(self.menu.get_widget('new_deep_id', recursive=True))
+        self.assertEqual(len(submenu._supermenus), 0)
+        self.menu.add_text_input('test', textinput_id='some_id')
+
     def test_add_generic_widget(self) -> None:
         """
         Test generic widget.
@@ -1481,6 +1533,26 @@ class MenuTest(unittest.TestCase):
         btn._selected = True
         self.assertNotEqual(None, menu._draw_focus_widget(surface, btn))
 
+        # The focus areas are drawn as the polygons were
+        s1 = pygame.Surface((600, 600))
+        s1.fill((120, 200, 40))
+        s2 = s1.copy()
+        focus = menu._draw_focus_widget(s1, btn)
+        for area in focus.values():
+            pygame.gfxdraw.filled_polygon(s2, area, menu._theme.focus_background_color)
+        for x in range(0, 600, 7):
+            for y in range(0, 600, 7):
+                for c1, c2 in zip(s1.get_at((x, y)), s2.get_at((x, y))):
+                    self.assertAlmostEqual(c1, c2, delta=1)
+
+        # The focus surface is kept until the widget moves
+        overlay = menu._focus_overlay[1]
+        menu._draw_focus_widget(surface, btn)
+        self.assertEqual(menu._focus_overlay[1], overlay)
+        btn.translate(10, 10)
+        menu._draw_focus_widget(surface, btn)
+        self.assertNotEqual(menu._focus_overlay[1], overlay)
+
     def test_visible(self) -> None:
         """
         Test visible.
@@ -1690,6 +1762,301 @@ class MenuTest(unittest.TestCase):
         # This should be proportional
         self.assertEqual(menu._column_widths, [100, 250, 250])
 
+    def test_position_update(self) -> None:
+        """
+        Test the incremental widget position update.
+        """
+        menu = MenuUtils.generic_menu(columns=2, rows=[4, 5])
+        widgets = []
+        for i in range(8):
+            widgets.append(menu.add_button('button {0}'.format(i), None))
+        btn_float = menu.add_button('floating', None)
+        btn_float.set_float()
+        menu.render()
+
+        def positions() -> list:
+            """
+            Return the position of each widget.
+            """
+            return [w.get_position() for w in menu.get_widgets()]
+
+        def reference_positions() -> list:
+            """
+            Return the positions computed by a full update.
+            """
+            menu._widget_layout = {}
+            menu._update_widget_position()
+            return positions()
+
+        # Nothing changed, no widget is placed again
+        pos = positions()
+        placed = menu._stats.position_update_widgets
+        menu._update_widget_position()
+        self.assertEqual(menu._stats.position_update_widgets, placed)
+        self.assertEqual(positions(), pos)
+
+        # Change the height of the second widget of the first column, only the
+        # widgets after it in the same column are placed again
+        widgets[1].set_padding((30, widgets[1].get_padding()[1]))
+        placed = menu._stats.position_update_widgets
+        menu._update_widget_position()
+        self.assertEqual(menu._stats.position_update_widgets - placed, 3)
+        pos = positions()
+        self.assertEqual(pos[2][1] - widgets[2].get_padding()[0],
+                         pos[1][1] - widgets[1].get_padding()[0] + widgets[1].get_height() + widgets[1].get_margin()[1])
+        self.assertEqual(reference_positions(), pos)
+
+        # Floating widget shares the row of the last one
+        self.assertEqual(btn_float.get_position()[1], widgets[7].get_position()[1])
+
+        # Hide a widget, the rest of the widgets move to the previous row
+        widgets[2].hide()
+        menu._update_widget_position()
+        pos = positions()
+        self.assertEqual(pos[2], (0, 0))
+        self.assertEqual(widgets[3].get_col_row_index()[0:2], (0, 2))
+        self.assertEqual(reference_positions(), pos)
+        widgets[2].show()
+        menu._update_widget_position()
+        pos = positions()
+        self.assertEqual(reference_positions(), pos)
+
+        # Translation
+        widgets[6].translate(10, 5)
+        pos = positions()
+        menu._update_widget_position()
+        self.assertEqual(positions()[6], (pos[6][0] + 10, pos[6][1] + 5))
+        pos = positions()
+        self.assertEqual(reference_positions(), pos)
+
+        # Max position follows the last widget of the column
+        menu._update_widget_position()
+        self.assertEqual(menu._widget_max_position[1],
+                         max(w.get_rect().bottom - w.get_padding()[2] for w in widgets))
+
+    def test_batch(self) -> None:
+        """
+        Test widget batch addition.
+        """
+        menu = MenuUtils.generic_menu()
+        ref = MenuUtils.generic_menu()
+        for i in range(10):
+            ref.add_button('button {0}'.format(i), None)
+        ref.add_label('label')
+
+        with menu.batch() as m:
+            self.assertEqual(m, menu)
+            for i in range(10):
+                menu.add_button('button {0}'.format(i), None)
+            with menu.batch():
+                menu.add_label('label')
+            self.assertIsNone(menu._widgets_surface)
+            self.assertEqual(menu._stats.build_surface, 0)
+            self.assertEqual(menu._stats.batch, 0)
+        self.assertEqual(menu._stats.build_surface, 1)
+        self.assertEqual(menu._stats.batch, 1)
+        self.assertIsNotNone(menu._widgets_surface)
+        self.assertEqual([w.get_position() for w in menu.get_widgets()],
+                         [w.get_position() for w in ref.get_widgets()])
+        self.assertEqual(menu.get_selected_widget(), menu.get_widgets()[0])
+
+        # Removal within a batch
+        with menu.batch():
+            for w in menu.get_widgets()[0:5]:
+                menu.remove_widget(w)
+        for w in ref.get_widgets()[0:5]:
+            ref.remove_widget(w)
+        ref.render()
+        self.assertEqual(menu._stats.build_surface, 2)
+        self.assertEqual([w.get_position() for w in menu.get_widgets()],
+                         [w.get_position() for w in ref.get_widgets()])
+        self.assertEqual(menu.get_selected_widget().get_title(), 'button 5')
+
+        # The menu is rendered even if the batch fails
+        try:
+            with menu.batch():
+                menu.add_button('button', None)
+                raise ValueError('batch failed')
+        except ValueError:
+            pass
+        self.assertEqual(menu._batch_depth, 0)
+        self.assertIsNotNone(menu._widgets_surface)
+        self.assertEqual(len(menu.get_widgets()), 7)
+        menu.draw(surface)
+
+    def test_widget_culling(self) -> None:
+        """
+        Test the culling of the widgets out of the visible area.
+        """
+        menu = MenuUtils.generic_menu()
+        ref = MenuUtils.generic_menu()
+        for m in (menu, ref):
+            with m.batch():
+                for i in range(100):
+                    m.add_button('button {0}'.format(i), None)
+        menu.set_widget_culling(margin=50)
+        self.assertRaises(AssertionError, lambda: menu.set_widget_culling(margin=-1))
+
+        def visible_area(m: 'pygame_menu.Menu') -> bytes:
+            """
+            Return the pixels of the visible area of the widgets surface.
+            """
+            rect = m._get_scroll_view_world_rect()
+            return pygame.image.tostring(m._widgets_surface.subsurface(rect), 'RGBA')
+
+        menu.draw(surface)
+        ref.draw(surface)
+        culled = menu._stats.draw_culled_widgets
+        self.assertGreater(culled, 80)
+        self.assertEqual(ref._stats.draw_culled_widgets, 0)
+        self.assertEqual(visible_area(menu), visible_area(ref))
+
+        # Scrolling within the margin does not draw the widgets again
+        updates = menu._stats.draw_update_cached
+        # noinspection PyProtectedMember
+        sbar = [s for s in menu._scroll._scrollbars if s.get_orientation() == pygame_menu.locals.ORIENTATION_VERTICAL][0]
+        sbar.set_value(sbar.get_value() + 10)
+        menu.draw(surface)
+        self.assertEqual(menu._stats.draw_update_cached, updates)
+
+        # Scroll to the last widget, the widgets near it are drawn
+        for m in (menu, ref):
+            m.select_widget(m.get_widgets()[-1])
+            m.draw(surface)
+        self.assertEqual(menu._stats.draw_update_cached, updates + 1)
+        self.assertEqual(visible_area(menu), visible_area(ref))
+        self.assertGreater(menu._stats.draw_culled_widgets, culled)
+
+        # Disable culling, every widget is drawn
+        menu.set_widget_culling(False)
+        culled = menu._stats.draw_culled_widgets
+        menu.draw(surface)
+        self.assertEqual(menu._stats.draw_culled_widgets, culled)
+        self.assertEqual(pygame.image.tostring(menu._widgets_surface, 'RGBA'),
+                         pygame.image.tostring(ref._widgets_surface, 'RGBA'))
+
+    def test_dirty_rects(self) -> None:
+        """
+        Test the changed areas returned by draw.
+        """
+        menu = MenuUtils.generic_menu()
+        btn1 = menu.add_button('button 1', None)
+        btn2 = menu.add_button('button 2', None)
+        menu.add_text_input('text', textinput_id='text')
+        self.assertIsInstance(menu.draw(surface), pygame_menu.Menu)
+
+        # The first draw updates the whole surface
+        self.assertEqual(menu.draw(surface, dirty_rects=True), [surface.get_rect()])
+
+        # Nothing changed
+        self.assertEqual(menu.draw(surface, dirty_rects=True), [])
+        self.assertEqual(menu.draw(surface, dirty_rects=True), [])
+
+        # Change the selected widget, the widgets and selected rects are updated
+        rect1 = menu.get_scrollarea().to_real_position(btn1.get_selection_effect().inflate(btn1.get_rect()))
+        menu.select_widget(btn2)
+        rect2 = menu.get_scrollarea().to_real_position(btn2.get_selection_effect().inflate(btn2.get_rect()))
+        rects = menu.draw(surface, dirty_rects=True)
+        self.assertIn(menu._get_scrollarea_rect(), rects)
+        self.assertIn(rect1, rects)
+        self.assertIn(rect2, rects)
+        self.assertEqual(menu.draw(surface, dirty_rects=True), [])
+
+        # Changing a widget updates the scroll area only
+        menu.get_widget('text').set_value('value')
+        self.assertEqual(menu.draw(surface, dirty_rects=True), [menu._get_scrollarea_rect()])
+
+        # Changing the title updates the menubar
+        menu.set_title('new title')
+        rects = menu.draw(surface, dirty_rects=True)
+        self.assertEqual(len(rects), 2)
+        self.assertTrue(rects[0].contains(menu._menubar.get_rect()))
+        self.assertEqual(menu.draw(surface, dirty_rects=True), [])
+
+        # Drawing without dirty rects, or into another surface, updates everything
+        menu.draw(surface)
+        self.assertEqual(menu.draw(surface, dirty_rects=True), [surface.get_rect()])
+        other = surface.copy()
+        self.assertEqual(menu.draw(other, dirty_rects=True), [other.get_rect()])
+
+        # Callable decorations may change on each draw
+        menu.get_decorator().add_callable(lambda surf, obj: None)
+        self.assertEqual(menu.draw(other, dirty_rects=True), [other.get_rect()])
+        self.assertEqual(menu.draw(other, dirty_rects=True), [other.get_rect()])
+
+        # Updating only the returned rects gives the same surface
+        menu = MenuUtils.generic_menu()
+        for i in range(20):
+            menu.add_button('button {0}'.format(i), None)
+        target = surface.copy()
+        screen = surface.copy()
+        for i in range(20):
+            for rect in menu.draw(target, clear_surface=True, dirty_rects=True):
+                screen.blit(target, rect, rect)
+            self.assertEqual(pygame.image.tostring(screen, 'RGB'), pygame.image.tostring(target, 'RGB'))
+            menu.update(PygameUtils.key(pygame_menu.controls.KEY_MOVE_UP, keydown=True))
+
+        # Mainloop using display.update
+        menu = MenuUtils.generic_menu()
+        menu.add_button('button', None)
+        menu.mainloop(surface, disable_loop=True, dirty_rects=True)
+        menu.mainloop(surface, disable_loop=True, dirty_rects=True)
+        self.assertEqual(menu._stats.draw_dirty_rects, 2)  # Full surface, then the scroll area
+
+    def test_hit_index(self) -> None:
+        """
+        Test the widget grid used to find the widgets under the mouse.
+        """
+        menu = MenuUtils.generic_menu(columns=3, rows=21, mouse_motion_selection=True)
+        with menu.batch():
+            for i in range(60):
+                menu.add_button('button {0}'.format(i) * (1 + i % 3), None)
+        menu.add_label('label').set_float()  # Not selectable
+
+        def brute_force(ev: 'pygame.event.Event') -> list:
+            """
+            Return the widgets colliding the event, checking every widget.
+            """
+            return [j for j in range(len(menu._widgets)) if menu._widgets[j].is_selectable and
+                    menu._widgets[j].is_visible() and menu._scroll.collide(menu._widgets[j], ev)]
+
+        def check() -> int:
+            """
+            Compare the grid and the brute force results over the window.
+            """
+            found = 0
+            for x in range(0, 600, 23):
+                for y in range(0, 600, 29):
+                    ev = pygame.event.Event(pygame.MOUSEMOTION, {'pos': (x, y)})
+                    indices = menu._get_widgets_at(ev)
+                    self.assertEqual(indices, brute_force(ev))
+                    found += len(indices)
+            return found
+
+        self.assertGreater(check(), 0)
+        self.assertEqual(menu._stats.hit_index_build, 1)
+
+        # Scrolling does not change the grid, as it stores world positions
+        # noinspection PyProtectedMember
+        sbar = [s for s in menu._scroll._scrollbars if s.get_orientation() == pygame_menu.locals.ORIENTATION_VERTICAL][0]
+        sbar.set_value(sbar.get_value() + 200)
+        self.assertGreater(check(), 0)
+        self.assertEqual(menu._stats.hit_index_build, 1)
+
+        # The grid is built again after the layout changes
+        menu._widgets[30].hide()
+        menu.remove_widget(menu._widgets[10])
+        menu.add_button('new', None)
+        builds = menu._stats.hit_index_build
+        self.assertGreater(check(), 0)
+        self.assertEqual(menu._stats.hit_index_build, builds + 1)
+
+        # Mouse motion selects the widget under the mouse
+        btn = menu._widgets[4]
+        pos = menu.get_scrollarea().to_real_position(btn.get_rect()).center
+        menu.update([pygame.event.Event(pygame.MOUSEMOTION, {'pos': pos})])
+        self.assertEqual(menu.get_selected_widget(), btn)
+
     def test_surface_cache(self) -> None:
         """
         Surface cache tests.
@@ -1699,3 +2066,55 @@ class MenuTest(unittest.TestCase):
         menu.force_surface_cache_update()
         menu.force_surface_update()
         self.assertTrue(menu._widgets_surface_need_update)
+
+    def test_profiling(self) -> None:
+        """
+        Test the profiling of the draw phases and widgets.
+        """
+        menu = MenuUtils.generic_menu()
+        menu.add_button('button', None)
+        menu.add_label('label')
+        self.assertIsNone(menu.get_profiler())
+        self.assertRaises(AssertionError, lambda: menu.set_profiling(buffer_size=0))
+
+        menu.set_profiling(buffer_size=4)
+        profiler = menu.get_profiler()
+        for _ in range(6):
+            menu.force_surface_cache_update()
+            menu.draw(surface)
+        stats = profiler.get_stats()
+        self.assertEqual(stats['frames'], 6)
+        for phase in ('background', 'decorator', 'draw', 'focus', 'layout', 'menubar', 'scroll', 'widgets'):
+            self.assertEqual(stats['phases'][phase]['count'], 4)
+        self.assertEqual(list(stats['widgets'].keys()), ['Button', 'Label'])
+        draw = stats['phases']['draw']
+        self.assertTrue(draw['min'] <= draw['p50'] <= draw['p90'] <= draw['p99'] <= draw['max'])
+
+        # The widgets are only recorded if drawn again
+        menu.draw(surface)
+        self.assertEqual(len(profiler._widgets['Button']), 4)
+        self.assertEqual(profiler.frames, 7)
+
+        # Disabled, the timings are kept
+        menu.set_profiling(False)
+        menu.draw(surface)
+        self.assertEqual(profiler.frames, 7)
+        menu.set_profiling()
+        self.assertEqual(menu.get_profiler(), profiler)
+
+        # Export
+        self.assertEqual(json.loads(profiler.to_json()), json.loads(json.dumps(profiler.get_stats())))
+        trace = json.loads(profiler.to_chrome_trace())['traceEvents']
+        self.assertEqual(len(trace), len(profiler.get_trace()))
+        self.assertEqual(trace[-1]['name'], 'draw')
+        self.assertEqual(trace[-1]['ph'], 'X')
+        self.assertEqual(len([e for e in trace if e['cat'] == 'widget']), 2 * 6)
+
+        # Percentiles use the nearest rank
+        profiler.clear()
+        self.assertEqual(profiler.get_stats(), {'frames': 0, 'phases': {}, 'widgets': {}})
+        summary = profiler._summary([i / 1000 for i in range(1, 101)])
+        self.assertAlmostEqual(summary['p50'], 50)
+        self.assertAlmostEqual(summary['p90'], 90)
+        self.assertAlmostEqual(summary['p99'], 99)
+        self.assertAlmostEqual(summary['mean'], 50.5)
@@ -69,6 +69,25 @@ class SelectionTest(unittest.TestCase):
         w.set_selection_effect(RightArrowSelection())
         self.menu.draw(surface)
 
+        # Blinking follows the animation clock, which draw never waits for
+        clock = self.menu.get_animation_clock()
+        sel = LeftArrowSelection(blink_ms=100)
+        w.set_selection_effect(sel)
+        frame = clock.get_frame()
+        for _ in range(10):
+            self.menu.draw(surface)
+        self.assertEqual(clock.get_frame(), frame + 10)
+        sel.draw(surface, w)
+        self.assertTrue(sel._blink_status)
+        clock.advance(150)
+        sel.draw(surface, w)
+        self.assertFalse(sel._blink_status)
+        sel.draw(surface, w)
+        self.assertFalse(sel._blink_status)
+        clock.advance(150)
+        sel.draw(surface, w)
+        self.assertTrue(sel._blink_status)
+
     def test_highlight(self) -> None:
         """
         Test highlight selection.
@@ -86,6 +86,19 @@ class ThemeTest(unittest.TestCase):
 
         self.assertRaises(AssertionError, lambda: theme.set_background_color_opacity(0.5))
 
+    def test_preload_fonts(self) -> None:
+        """
+        Test theme fonts preloading.
+        """
+        theme = pygame_menu.themes.THEME_DEFAULT.copy()
+        theme.widget_font_size = 31
+        theme.title_font_size = 41
+        cache = pygame_menu.font.get_font_cache()
+        self.assertEqual(theme.preload_fonts(sizes=(17,)), theme)
+        for key in ((theme.widget_font, 31), (theme.widget_font, 17), (theme.title_font, 41)):
+            self.assertIn(key, cache)
+        self.assertRaises(AssertionError, lambda: theme.preload_fonts(sizes=17))
+
     def test_invalid_kwargs(self) -> None:
         """
         Test invalid theme kwargs.
@@ -32,6 +32,7 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 __all__ = ['WidgetsTest']
 
 import copy
+import timeit
 import unittest
 from test._utils import MenuUtils, surface, PygameUtils, test_reset_surface
 
@@ -43,6 +44,9 @@ from pygame_menu.widgets import MENUBAR_STYLE_ADAPTIVE, MENUBAR_STYLE_NONE, \
     MENUBAR_STYLE_SIMPLE, MENUBAR_STYLE_UNDERLINE, MENUBAR_STYLE_UNDERLINE_TITLE, \
     MENUBAR_STYLE_TITLE_ONLY, MENUBAR_STYLE_TITLE_ONLY_DIAGONAL
 
+# Configure the tests
+TEST_TIME_RENDER = False
+
 
 class WidgetsTest(unittest.TestCase):
 
@@ -53,6 +57,45 @@ class WidgetsTest(unittest.TestCase):
         test_reset_surface()
         self.menu = MenuUtils.generic_menu()
 
+    @staticmethod
+    def test_time_render() -> None:
+        """
+        This test the per-frame time that takes to check the render of 1000 widgets.
+        """
+        if not TEST_TIME_RENDER:
+            return
+        menu = MenuUtils.generic_menu()
+        widgets = []
+        with menu.batch():
+            for i in range(250):
+                widgets.append(menu.add_button('button {0}'.format(i), None))
+                widgets.append(menu.add_label('label {0}'.format(i)))
+                widgets.append(menu.add_selector('selector {0}'.format(i), [('a',), ('b',)]))
+                widgets.append(menu.add_text_input('text {0}: '.format(i), default='x' * 40))
+        menu.draw(surface)
+
+        def render() -> None:
+            """
+            Check the render of all the widgets, as each frame does.
+            """
+            for w in widgets:
+                w._render()
+
+        def get_rect() -> None:
+            """
+            Get the rect of all the widgets, which also checks the render.
+            """
+            for w in widgets:
+                w.get_rect()
+
+        # Per frame (ms), best of 5
+        # (hash of the render variables) render 1.117, get_rect 3.025
+        # (render version counter) render 0.431, get_rect 2.328
+        # (render attribute descriptors) render 0.535, get_rect 2.906; on the same
+        # machine the __setattr__ counter measured render 0.578, get_rect 2.716
+        print(min(timeit.repeat(render, number=100, repeat=5)) * 10)
+        print(min(timeit.repeat(get_rect, number=100, repeat=5)) * 10)
+
     def test_kwargs(self) -> None:
         """
         Test kwargs addition.
@@ -319,19 +362,68 @@ class WidgetsTest(unittest.TestCase):
         """
         self.menu.clear()
         w = self.menu.add_label('Text')
-        lasthash = w._last_render_hash
+        lastversion = w._last_render_version
         w.hide()
         self.assertFalse(w.is_visible())
-        self.assertNotEqual(w._last_render_hash, lasthash)
-        lasthash = w._last_render_hash
+        self.assertNotEqual(w._last_render_version, lastversion)
+        lastversion = w._last_render_version
         w.show()
         self.assertTrue(w.is_visible())
-        self.assertNotEqual(w._last_render_hash, lasthash)
+        self.assertNotEqual(w._last_render_version, lastversion)
 
         w = Button('title')
         self.menu.add_generic_widget(w)
         w.hide()
 
+    def test_render_version(self) -> None:
+        """
+        Test the widget render version.
+        """
+        self.menu.clear()
+        w = self.menu.add_selector('Selector', [('a', 0), ('b', 1)])
+        self.assertEqual(w._last_render_version, w._render_version)
+        self.assertFalse(w._render_changed())
+
+        # Setting a render attribute to the same object does not change the version
+        version = w._render_version
+        w._visible = True
+        w.readonly = False
+        self.assertEqual(w._render_version, version)
+        self.assertFalse(w._render_changed())
+
+        # Setters bump the version
+        w.readonly = True
+        self.assertEqual(w._render_version, version + 1)
+        self.assertTrue(w._render_changed())
+        w.readonly = False
+        w.set_value('b')
+        self.assertEqual(w._render_version, version + 3)
+        w.get_rect()
+        surf = w.get_surface()
+        w.get_rect()
+        self.assertIs(w.get_surface(), surf)
+        self.assertEqual(w._last_render_version, w._render_version)
+        w._force_render()
+        self.assertEqual(w._render_version, version + 4)
+
+        # Render args
+        self.assertTrue(w._render_changed(1))
+        self.assertFalse(w._render_changed(1))
+        self.assertTrue(w._render_changed(2))
+
+        # The render check finds the changes not tracked by the version
+        w._elements.append(('c', 2))
+        self.assertFalse(w._render_changed(2))
+        pygame_menu.widgets.core.widget.set_render_check(True)
+        try:
+            self.assertFalse(w._render_changed(2))
+            w._elements.append(('d', 3))
+            with self.assertWarns(UserWarning):
+                self.assertTrue(w._render_changed(2))
+            self.assertFalse(w._render_changed(2))
+        finally:
+            pygame_menu.widgets.core.widget.set_render_check(False)
+
     def test_font(self) -> None:
         """
         Test widget font.
@@ -448,6 +540,16 @@ class WidgetsTest(unittest.TestCase):
         self.assertEqual(selector.get_value()[0][0], '5 - Medium')
         selector.update(PygameUtils.key(pygame_menu.controls.KEY_LEFT, keydown=True))
         self.assertEqual(selector.get_value()[0][0], '4 - Easy')
+
+        # Update the elements in place, the widget must render the new element
+        width = selector.get_width()
+        new_elements[0] = ('4 - A much much longer element name', 'EASY')
+        selector.update_elements(new_elements)
+        self.assertEqual(selector.get_value()[0][0], '4 - A much much longer element name')
+        self.assertGreater(selector.get_width(), width)
+        new_elements[0] = ('4 - Easy', 'EASY')
+        selector.update_elements(new_elements)
+        self.assertEqual(selector.get_width(), width)
         selector.readonly = True
         selector.update(PygameUtils.key(pygame_menu.controls.KEY_LEFT, keydown=True))
         self.assertEqual(selector.get_value()[0][0], '4 - Easy')
@@ -745,6 +847,15 @@ class WidgetsTest(unittest.TestCase):
         textinput.clear()
         self.assertEqual(textinput.get_value(), '')
 
+        # The cursor blinks with the animation clock
+        textinput.update([])
+        visible = textinput._cursor_visible
+        self.menu.get_animation_clock().advance(textinput._cursor_switch_ms)
+        textinput.update([])
+        self.assertNotEqual(textinput._cursor_visible, visible)
+        textinput.update([])
+        self.assertNotEqual(textinput._cursor_visible, visible)
+
         passwordinput = self.menu.add_text_input('title', password=True, input_underline='_')
         self.assertRaises(ValueError,  # Password cannot be set
                           lambda: passwordinput.set_value('new_value'))
@@ -1477,3 +1588,133 @@ class WidgetsTest(unittest.TestCase):
         # Assert switch values
         self.assertRaises(ValueError, lambda: menu.add_toggle_switch('toggle', 'false',
                                                                      onchange=onchange, infinite=False))
+
+    def test_virtuallist(self) -> None:
+        """
+        Test virtual list widget.
+        """
+        menu = MenuUtils.generic_menu()
+        menu.add_button('before', None)
+
+        rendered = []
+        value = [None, None]
+
+        def render_item(index: int) -> str:
+            """
+            Renders an item.
+            """
+            rendered.append(index)
+            return 'item {0}'.format(index)
+
+        def onchange(index: int) -> None:
+            """
+            Function executed when changing the item.
+            """
+            value[0] = index
+
+        def onreturn(index: int) -> None:
+            """
+            Function executed when pressing return.
+            """
+            value[1] = index
+
+        vlist = menu.add_virtual_list(100000, render_item, onchange=onchange, onreturn=onreturn,
+                                      rows=5, width=200)
+        menu.add_button('after', None)
+        self.assertEqual(vlist.get_value(), 0)
+        self.assertEqual(vlist.get_height(apply_padding=False), 5 * vlist._row_height)
+        self.assertEqual(vlist.get_width(apply_padding=False), 200)
+
+        # Only the visible rows are rendered, using a pool of the visible size
+        del rendered[:]
+        vlist.refresh()
+        menu.draw(surface)
+        self.assertEqual(sorted(rendered), [0, 1, 2, 3, 4])
+        self.assertEqual(vlist.get_pool_size(), 5)
+
+        # Move within the list
+        menu.select_widget(vlist)
+        menu.update(PygameUtils.key(pygame_menu.controls.KEY_MOVE_UP, keydown=True))
+        self.assertEqual(vlist.get_value(), 1)
+        self.assertEqual(value[0], 1)
+        self.assertEqual(menu.get_selected_widget(), vlist)
+        for _ in range(5):
+            menu.update(PygameUtils.key(pygame_menu.controls.KEY_MOVE_UP, keydown=True))
+        self.assertEqual(vlist.get_value(), 6)
+        self.assertEqual(vlist.get_first_visible(), 2)
+        vlist.update(PygameUtils.key(pygame.K_PAGEDOWN, keydown=True))
+        self.assertEqual(vlist.get_value(), 11)
+        self.assertEqual(vlist.get_first_visible(), 7)
+        menu.update(PygameUtils.key(pygame_menu.controls.KEY_APPLY, keydown=True))
+        self.assertEqual(value[1], 11)
+
+        # Jump far, only the new window is rendered and the pool is reused
+        del rendered[:]
+        vlist.set_value(99999)
+        menu.draw(surface)
+        self.assertEqual(sorted(rendered), [99995, 99996, 99997, 99998, 99999])
+        self.assertEqual(vlist.get_pool_size(), 5)
+
+        # Moving the selection renders only the rows which changed
+        del rendered[:]
+        menu.update(PygameUtils.key(pygame_menu.controls.KEY_MOVE_DOWN, keydown=True))
+        menu.draw(surface)
+        self.assertEqual(sorted(rendered), [99998, 99999])
+
+        # At the ends of the list the Menu selects the next/previous widget
+        vlist.set_value(99999)
+        menu.update(PygameUtils.key(pygame_menu.controls.KEY_MOVE_UP, keydown=True))
+        self.assertEqual(menu.get_selected_widget().get_title(), 'after')
+        menu.update(PygameUtils.key(pygame_menu.controls.KEY_MOVE_DOWN, keydown=True))
+        self.assertEqual(menu.get_selected_widget(), vlist)
+        vlist.set_value(0)
+        menu.update(PygameUtils.key(pygame_menu.controls.KEY_MOVE_DOWN, keydown=True))
+        self.assertEqual(menu.get_selected_widget().get_title(), 'before')
+        menu.select_widget(vlist)
+
+        # Click on a row
+        menu.render()
+        vlist.update([PygameUtils.middle_rect_click(vlist.get_row_rect(3), menu)])
+        self.assertEqual(vlist.get_value(), 3)
+        self.assertEqual(value[0], 3)
+
+        # Scroll the window without changing the selection
+        vlist.scroll_to(50)
+        self.assertEqual(vlist.get_first_visible(), 50)
+        self.assertEqual(vlist.get_value(), 3)
+        vlist.scroll_to(1000000)
+        self.assertEqual(vlist.get_first_visible(), 99995)
+
+        # Data source of variable length
+        items = ['a', 'b', 'c']
+        vlist2 = menu.add_virtual_list(lambda: len(items), lambda i: items[i], default=2, rows=10)
+        menu.draw(surface)
+        self.assertEqual(vlist2.get_value(), 2)
+        self.assertEqual(vlist2.get_pool_size(), 3)
+        items.pop()
+        vlist2.refresh()
+        self.assertEqual(vlist2.get_value(), 1)
+        menu.draw(surface)
+        self.assertEqual(vlist2.get_pool_size(), 3)  # One surface is kept in the pool
+        del items[:]
+        vlist2.refresh()
+        self.assertEqual(vlist2.get_value(), -1)
+        vlist2.update(PygameUtils.key(pygame_menu.controls.KEY_MOVE_UP, keydown=True))
+        self.assertEqual(vlist2.get_value(), -1)
+        menu.draw(surface)
+
+        # Readonly
+        vlist.readonly = True
+        self.assertFalse(vlist.update(PygameUtils.key(pygame_menu.controls.KEY_MOVE_UP, keydown=True)))
+        vlist.readonly = False
+
+        # Transforms are not applied
+        vlist.rotate(10)
+        self.assertEqual(vlist._angle, 0)
+        vlist.scale(2, 2)
+        self.assertFalse(vlist._scale[0])
+
+        # Invalid arguments
+        self.assertRaises(AssertionError, lambda: menu.add_virtual_list(10, render_item, rows=0))
+        self.assertRaises(AssertionError, lambda: menu.add_virtual_list(10, render_item, default=10))
+        self.assertRaises(AssertionError, lambda: menu.add_virtual_list(10, 'item'))
@@ -1,35 +1,36 @@
 import math
+import os
 import random
 
+# Imported before pygame so the startup timeline covers the whole launch
+from startup import timeline, init_pygame
+
 import pygame
 from pygame import mixer
 
-# Intialize the pygame
-pygame.init()
+from assets import assets
+import corpus
+import gamestate
+import layout
+from loader import AssetLoader
+
+# Intialize only the pygame subsystems the game uses
+init_pygame()
 
 # create the screen
 screen = pygame.display.set_mode((800, 600))
-
-# Background
-background = pygame.image.load('background.png')
-
-# Sound
-mixer.music.load("background.wav")
-mixer.music.play(-1)
+timeline.mark('set display mode')
 
 # Caption and Icon
 pygame.display.set_caption("Word Invader")
-icon = pygame.image.load('ufo.png')
-pygame.display.set_icon(icon)
+pygame.display.set_icon(assets.image('ufo.png'))
 
 # Player
-playerImg = pygame.image.load('player.png')
 playerX = 370
 playerY = 480
 playerX_change = 0
 
 # Enemy
-enemyImg = []
 enemyX = []
 enemyY = []
 enemyX_change = []
@@ -37,7 +38,6 @@ enemyY_change = []
 num_of_enemies = 4
 
 for i in range(num_of_enemies):
-    enemyImg.append(pygame.image.load('enemy.png'))
     enemyX.append(random.randint(0, 736))
     enemyY.append(random.randint(50, 150))
     enemyX_change.append(4)
@@ -48,7 +48,6 @@ for i in range(num_of_enemies):
 # Ready - You can't see the bullet on the screen
 # Fire - The bullet is currently moving
 
-bulletImg = pygame.image.load('bullet.png')
 bulletX = 0
 bulletY = 480
 bulletX_change = 0
@@ -56,26 +55,15 @@ bulletY_change = 10
 bullet_state = "ready"
 
 # Sentence text
-sentence_text = pygame.font.Font('freesansbold.ttf', 20)
 prepY = 0
-
-# Game Over
-over_font = pygame.font.Font('freesansbold.ttf', 64)
+question = 0
 
 # Hit count
 hit_count = 0
 
-# display main page
-first_Page = pygame.font.Font('freesansbold.ttf', 65)
-description_font = pygame.font.Font('freesansbold.ttf', 15)
-
-#button for first screen/page   
-playFont = pygame.font.Font('freesansbold.ttf', 20)
-
 # draw text to screen
 def draw_text(surface, text, size, x, y, color):
-    font = pygame.font.Font(pygame.font.match_font('freesansbold.ttf'), size)
-    text_surface = font.render(text, True, color)
+    text_surface = assets.font(size).render(text, True, color)
     text_rect = text_surface.get_rect()
     text_rect.midtop = (x, y)
     surface.blit(text_surface, text_rect)
@@ -85,13 +73,14 @@ def main_page():
     # RGB = Red, Green, Blue
     screen.fill((0, 0, 0))
     # Background Image
-    screen.blit(background, (0, 0))
+    screen.blit(assets.image('background.png'), (0, 0))
 
     # display title
-    title = first_Page.render("Word Invader", True, (255, 255, 255))
+    title = assets.font(65).render("Word Invader", True, (255, 255, 255))
     screen.blit(title, (185, 185))
 
     # display description
+    description_font = assets.font(15)
     description = description_font.render("A game designed to help high school students prepare for the College Board’s SAT", True, (255, 255, 255))
     screen.blit(description, (100, 260))
     description2 = description_font.render("Reading Section by playing a modified version of Space Invaders (1978) to", True, (255, 255, 255))
@@ -102,34 +91,67 @@ def main_page():
     # display CTA (call to action)
     draw_text(screen, "press [ENTER] to begin", 25, 390, 365, (220, 220, 220))
 
+# Gameplay assets, loaded in the background while the title screen is shown
+loader = AssetLoader(assets,
+                     images=['player.png', 'enemy.png', 'bullet.png'],
+                     sounds=['laser.wav', 'explosion.wav'],
+                     fonts=[20, 64])
+assets_ready = False
+clock = pygame.time.Clock()
+
 showMainScreen = True
 while showMainScreen:
     
     main_page()
     pygame.display.flip()
 
+    if timeline.first_frame_ms is None:
+        timeline.first_frame()
+
+        # Sound, started once the title screen is up
+        if mixer.get_init():
+            mixer.music.load("background.wav")
+            mixer.music.play(-1)
+            timeline.mark('background music')
+
+        loader.start()
+
+    if not assets_ready and loader.poll() == 1:
+        assets_ready = True
+        timeline.mark('gameplay assets')
+
     for event in pygame.event.get():
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_RETURN:
                 showMainScreen = False
 
+    # Nothing moves on the title screen, leave the CPU to the loader
+    clock.tick(60)
+
+# Question bank, compiled with: python corpus.py questions.txt -o sentences.bin
+sentences = loader.finish()
+
+# Sentences are wrapped to the window, leaving the same margin on both sides
+sentence_layout = layout.SentenceLayout(assets.font(20), 20, 800 - 2 * 85)
+timeline.mark('start game')
+
 def game_over_text():
-    over_text = over_font.render("GAME OVER", True, (255, 255, 255))
+    over_text = assets.font(64).render("GAME OVER", True, (255, 255, 255))
     screen.blit(over_text, (200, 250))
 
 
 def player(x, y):
-    screen.blit(playerImg, (x, y))
+    screen.blit(assets.image('player.png'), (x, y))
 
 
 def enemy(x, y, i):
-    screen.blit(enemyImg[i], (x, y))
+    screen.blit(assets.image('enemy.png'), (x, y))
 
 
 def fire_bullet(x, y):
     global bullet_state
     bullet_state = "fire"
-    screen.blit(bulletImg, (x + 16, y + 10))
+    screen.blit(assets.image('bullet.png'), (x + 16, y + 10))
 
 
 def isCollision(enemyX, enemyY, bulletX, bulletY):
@@ -142,20 +164,45 @@ def isCollision(enemyX, enemyY, bulletX, bulletY):
 
 # Display sentence
 def prep_sentence(prepY):
-    sentence = sentence_text.render("A transportation [ planner's, ] job may include counting traffic.", True, (255, 255, 255))
+    sentence = sentence_layout.render(sentences[question])
     screen.blit(sentence, (85, prepY))
 
+# Save file for quick resume and crash recovery. Point WORDINVADERS_STATE at a
+# snapshot to start straight from a mid-game state (e.g. for profiling)
+save_path = os.environ.get('WORDINVADERS_STATE', 'savegame.bin')
+autosave_interval = 5000  # ms
+last_autosave = pygame.time.get_ticks()
+
+def save_game():
+    if hit_count >= 3:
+        # Nothing to resume after game over
+        if os.path.exists(save_path):
+            os.remove(save_path)
+    else:
+        gamestate.save(save_path, globals())
+
+if os.path.exists(save_path):
+    try:
+        gamestate.load(save_path, globals(), len(sentences))
+    except gamestate.SnapshotError:
+        pass
+
 # Game Loop
 running = True
 while running: # main game loop
 
+    if pygame.time.get_ticks() - last_autosave >= autosave_interval:
+        save_game()
+        last_autosave = pygame.time.get_ticks()
+
     # RGB = Red, Green, Blue
     screen.fill((0, 0, 0))
 
     # Background Image
-    screen.blit(background, (0, 0))
+    screen.blit(assets.image('background.png'), (0, 0))
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
+            save_game()
             running = False  
 
         # if keystroke is pressed check whether its right or left
@@ -166,8 +213,9 @@ while running: # main game loop
                 playerX_change = 5
             if event.key == pygame.K_SPACE:
                 if bullet_state is "ready":
-                    bulletSound = mixer.Sound("laser.wav")
-                    bulletSound.play()
+                    bulletSound = assets.sound("laser.wav")
+                    if bulletSound:
+                        bulletSound.play()
                     # Get the current x cordinate of the spaceship
                     bulletX = playerX
                     fire_bullet(bulletX, bulletY)
@@ -208,8 +256,9 @@ while running: # main game loop
         # Collision
         collision = isCollision(enemyX[i], enemyY[i], bulletX, bulletY)
         if collision:
-            explosionSound = mixer.Sound("explosion.wav")
-            explosionSound.play()
+            explosionSound = assets.sound("explosion.wav")
+            if explosionSound:
+                explosionSound.play()
             bulletY = 480
             bullet_state = "ready"
             hit_count += 1
@@ -0,0 +1,91 @@
+"""
+Startup helpers for Word Invader.
+
+Only the pygame subsystems the game uses are initialized, and a timeline of the
+startup steps is kept so time-to-first-frame can be checked and regress-tested.
+
+Set WORDINVADERS_TIMELINE=1 to print the timeline to stderr once the first
+frame is shown, and WORDINVADERS_FIRST_FRAME_ONLY=1 to quit right after it
+(useful to time many launches from a script).
+"""
+
+import os
+import sys
+import time
+
+# Import this module before pygame so the timeline also covers importing it
+_start = time.perf_counter()
+
+
+class Timeline(object):
+    """
+    Records named startup steps as milliseconds since the game was launched.
+    """
+
+    def __init__(self, start=None):
+        self._start = _start if start is None else start
+        self.events = []
+        self.first_frame_ms = None
+
+    def mark(self, label):
+        """
+        Record a step.
+
+        :param label: Step name
+        :return: Milliseconds since launch
+        """
+        ms = (time.perf_counter() - self._start) * 1000
+        self.events.append((label, ms))
+        return ms
+
+    def first_frame(self):
+        """
+        Record that the first frame has been presented. Only the first call
+        counts.
+
+        :return: None
+        """
+        if self.first_frame_ms is not None:
+            return
+        self.first_frame_ms = self.mark('first frame')
+        if os.environ.get('WORDINVADERS_TIMELINE'):
+            self.report()
+        if os.environ.get('WORDINVADERS_FIRST_FRAME_ONLY'):
+            sys.exit(0)
+
+    def report(self, stream=None):
+        """
+        Print the timeline.
+
+        :param stream: Output stream, stderr by default
+        :return: None
+        """
+        stream = stream or sys.stderr
+        last = 0
+        for label, ms in self.events:
+            print('{:>9.1f} ms  (+{:.1f})  {}'.format(ms, ms - last, label), file=stream)
+            last = ms
+
+
+timeline = Timeline()
+
+
+def init_pygame():
+    """
+    Initialize only the display, font and mixer subsystems, instead of every
+    subsystem like pygame.init() does. The game still runs silently if no audio
+    device is available.
+
+    :return: None
+    """
+    import pygame
+    timeline.mark('import pygame')
+    pygame.display.init()
+    timeline.mark('init display')
+    pygame.font.init()
+    timeline.mark('init font')
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        pass
+    timeline.mark('init mixer')
@@ -0,0 +1,68 @@
+"""
+Tests of the background asset loader.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+import corpus
+from assets import Assets
+from loader import AssetLoader
+
+
+class AssetLoaderTest(unittest.TestCase):
+
+    def setUp(self):
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_mode((100, 100))
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.mkdtemp()
+        os.chdir(self._tmp)
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        shutil.rmtree(self._tmp)
+
+    def _load(self, text):
+        with open('questions.txt', 'w') as f:
+            f.write(text)
+        return AssetLoader(Assets(), fonts=[20]).start()
+
+    def test_raw(self):
+        loader = self._load('# Comment\nThe [ first ] sentence.\nThe second [ one. ]\n')
+        while loader.poll() < 1:
+            pass
+        sentences = loader.finish()
+        self.assertEqual([s.tokens for s in sentences], [('The', 'first', 'sentence.'), ('The', 'second', 'one.')])
+        self.assertEqual(sentences[0].target, (1, 2))
+        self.assertEqual(sentences, corpus.compile_corpus(corpus.read_raw('questions.txt'), jobs=1)[0])
+
+    def test_malformed(self):
+        loader = self._load('The [ first ] sentence.\nNo target here.\n')
+        with self.assertRaises(corpus.CorpusError) as e:
+            loader.finish()
+        self.assertIn('questions.txt: line 2', str(e.exception))
+
+    def test_empty(self):
+        loader = self._load('# Nothing yet\n')
+        self.assertRaises(corpus.CorpusError, loader.finish)
+
+    def test_compiled(self):
+        with open('questions.txt', 'w') as f:
+            f.write('A [ b ] c\n')
+        self.assertEqual(corpus.main(['questions.txt', '-o', 'sentences.bin']), 0)
+        loader = AssetLoader(Assets()).start()
+        self.assertEqual(loader.finish()[0].tokens, ('A', 'b', 'c'))
+        self.assertEqual(loader.progress, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()